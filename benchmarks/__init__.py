@@ -0,0 +1,8 @@
+"""
+Benchmarks for usfm_utils. Each module can be run as a script, e.g.
+
+    python -m benchmarks.bench_import
+
+benchmarks.suite runs the lexer and parser benchmarks on fixed inputs, writes
+the results as JSON, and can compare them against a baseline.
+"""
@@ -0,0 +1,51 @@
+"""
+Measures the throughput of usfm_utils.batch.parse_many for increasing numbers of
+worker processes, over a corpus of generated books written to a temporary
+directory. Scaling is bounded by the number of available cores.
+"""
+from __future__ import print_function
+
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+from tests import test_utils
+from usfm_utils.batch import parse_many, render_html
+
+
+def write_corpus(directory, num_books):
+    paths = []
+    for i in range(num_books):
+        path = os.path.join(directory, "{:02}.usfm".format(i))
+        with io.open(path, "w", encoding="utf-8") as usfm_file:
+            usfm_file.write(test_utils.book(num_chapters=30, seed=i))
+        paths.append(path)
+    return paths
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        paths = write_corpus(directory, 66)
+        print("{} books, {} CPUs".format(len(paths), multiprocessing.cpu_count()))
+        workers_counts = sorted(set((1, 2, 4, multiprocessing.cpu_count())))
+        for render in (None, render_html):
+            baseline = None
+            for workers in workers_counts:
+                start = time.time()
+                for _ in parse_many(paths, workers=workers, render=render, ordered=False):
+                    pass
+                elapsed = time.time() - start
+                baseline = baseline or elapsed
+                print("{:<12} workers={:<3} {:>7.2f} s  speedup {:.2f}x"
+                      .format("rendered" if render else "documents", workers,
+                              elapsed, baseline / elapsed))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
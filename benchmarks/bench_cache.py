@@ -0,0 +1,36 @@
+"""
+Compares a cache hit of DocumentCache against a parse of the same book, and
+reports the size of the cached entry.
+"""
+from __future__ import print_function
+
+import shutil
+import tempfile
+import timeit
+
+from tests import test_utils
+from usfm_utils.usfm.cache import DocumentCache
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+def main():
+    text = test_utils.book(num_chapters=50, seed=0)
+    directory = tempfile.mkdtemp()
+    try:
+        parser = UsfmParser.create(lexer_class=UsfmScanner)
+        cache = DocumentCache(directory, parser=parser)
+        cache.parse_text(text)
+        parse = min(timeit.repeat(lambda: parser.parse_text(text), number=1, repeat=5))
+        hit = min(timeit.repeat(lambda: cache.parse_text(text), number=1, repeat=5))
+        print("book: {} characters, cached entry: {} bytes".format(len(text), cache.size))
+        print("parse {:>7.2f} ms   cache hit {:>7.2f} ms   ({:.1f}x faster)"
+              .format(parse * 1000, hit * 1000, parse / hit))
+        print("hits: {}, misses: {}, evictions: {}"
+              .format(cache.hits, cache.misses, cache.evictions))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Measures, with tracemalloc, the memory retained by parsed element trees, in
+bytes per verse, for each of the inputs of benchmarks.profiles and a generated
+book.
+
+Elements, paragraph layouts and footnote labels are slotted, identical layouts
+and labels are shared, and verse and chapter numbers are interned. Before that,
+every element carried a __dict__ and every paragraph a layout of its own; the
+figures of the former model (as of the same inputs) are listed for comparison.
+"""
+from __future__ import print_function
+
+import tracemalloc
+
+from benchmarks.suite import PROFILES, count_elements
+from tests import test_utils
+from usfm_utils.usfm.parse import UsfmParser
+
+# bytes per verse retained by the former (unslotted, unshared) element trees
+FORMER_BYTES_PER_VERSE = {
+    "paragraphs": 711,
+    "poetry": 1297,
+    "footnotes": 2882,
+    "chapters": 689,
+    "book": 888,
+}
+
+
+def retained(func):
+    """
+    :return: the result of func, and the number of bytes allocated by func that
+    are still allocated after it returns
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = UsfmParser.create()
+    inputs = [(name, generate()) for name, generate in PROFILES]
+    inputs.append(("book", test_utils.book(num_chapters=50, seed=0)))
+    print("{:<12} {:>8} {:>10} {:>14} {:>14}".format(
+        "input", "verses", "elements", "bytes/verse", "formerly"))
+    for name, text in inputs:
+        parser.parse_text(text)  # warm up (e.g. the lexer's caches)
+        document, size = retained(lambda: parser.parse_text(text))
+        verses = text.count("\\v ")
+        print("{:<12} {:>8,} {:>10,} {:>14,.0f} {:>14,}".format(
+            name, verses, count_elements(document.elements), size / float(verses),
+            FORMER_BYTES_PER_VERSE[name]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares documents as trees of element objects with FlatDocuments, on a large
+generated book: the time to build each (parse_text against parse_flat), the
+memory each retains, the time of a full garbage collection while each is alive,
+the time to pickle and unpickle each (as for sending a document to another
+process), and the time to render each to HTML.
+"""
+from __future__ import print_function
+
+import gc
+import io
+import pickle
+import timeit
+import tracemalloc
+
+from tests import test_utils
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import UsfmParser
+
+REPETITIONS = 5
+
+
+def best_time(func):
+    return min(timeit.repeat(func, number=1, repeat=REPETITIONS))
+
+
+def retained(func):
+    """
+    :return: the number of bytes allocated by func that are still allocated after
+    it returns (while its result is kept)
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        size = tracemalloc.get_traced_memory()[0] - before
+        del result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def collect_time(build):
+    """
+    :return: the time of a full garbage collection while the result of build is
+    alive
+    """
+    document = build()
+    seconds = best_time(gc.collect)
+    del document
+    return seconds
+
+
+def render(document):
+    HtmlVisitor(io.StringIO()).write(document)
+
+
+def main():
+    text = test_utils.book(num_chapters=150, verses_per_chapter=30, seed=0)
+    parser = UsfmParser.create()
+    print("book: {} characters, {} verses".format(len(text), text.count("\\v ")))
+    print("{:<16} {:>12} {:>12}".format("", "Document", "FlatDocument"))
+    builds = (lambda: parser.parse_text(text), lambda: parser.parse_flat(text))
+
+    def row(name, values, fmt):
+        print("{:<16} {:>12} {:>12}".format(name, *[fmt.format(value) for value in values]))
+
+    row("build (ms)", [best_time(build) * 1000 for build in builds], "{:.1f}")
+    row("memory (KiB)", [retained(build) / 1024.0 for build in builds], "{:,.0f}")
+    row("gc.collect (ms)", [collect_time(build) * 1000 for build in builds], "{:.1f}")
+    documents = [build() for build in builds]
+    pickled = [pickle.dumps(document, pickle.HIGHEST_PROTOCOL) for document in documents]
+    row("pickle (KiB)", [len(data) / 1024.0 for data in pickled], "{:,.0f}")
+    row("pickle (ms)", [best_time(lambda: pickle.dumps(document, pickle.HIGHEST_PROTOCOL))
+                        * 1000 for document in documents], "{:.1f}")
+    row("unpickle (ms)", [best_time(lambda: pickle.loads(data)) * 1000
+                          for data in pickled], "{:.1f}")
+    row("render (ms)", [best_time(lambda: render(document)) * 1000
+                        for document in documents], "{:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Serves generated books from an in-process asyncio server to many concurrent
+clients, and measures the time to the first byte of each response, the
+throughput of the server, and the longest time the event loop was kept from
+running. Responses are rendered with html_async.write_html_async (parsing and
+rendering in executor threads, streaming each chapter), or by parsing and
+rendering the whole book on the event loop and writing it at once.
+"""
+from __future__ import print_function
+
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests import test_utils
+from tests.test_html_async import Server, run, serve_concurrently
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import parse
+
+CLIENTS = (1, 8, 32)
+EXECUTOR_THREADS = 8
+
+
+class BlockingServer(Server):
+    async def _handle(self, reader, writer):
+        seed = int((await reader.readline()).decode("ascii"))
+        output = io.BytesIO()
+        HtmlVisitor(output, encoding="utf-8").write(parse(self._texts[seed]))
+        writer.write(output.getvalue())
+        await writer.drain()
+        writer.close()
+
+
+def main():
+    texts = [test_utils.book(num_chapters=50, verses_per_chapter=30, seed=seed)
+             for seed in range(4)]
+    print("{:<9} {:<8} {:>14} {:>14} {:>10} {:>14}".format(
+        "server", "clients", "mean TTFB ms", "max TTFB ms", "MB/s", "max stall ms"))
+    for num_clients in CLIENTS:
+        for name in ("async", "blocking"):
+            start = time.perf_counter()
+            if name == "async":
+                executor = ThreadPoolExecutor(EXECUTOR_THREADS)
+                try:
+                    responses, events = run(serve_concurrently(texts, num_clients,
+                                                               executor=executor))
+                finally:
+                    executor.shutdown()
+            else:
+                responses, events = run(serve_concurrently(texts, num_clients,
+                                                           server_class=BlockingServer))
+            seconds = time.perf_counter() - start
+            starts = dict((client, t) for kind, client, t in events if kind == "start")
+            first_bytes = [t - starts[client] for kind, client, t in events
+                           if kind == "first"]
+            ticks = [start] + [t for kind, _, t in events if kind == "tick"]
+            stall = max(b - a for a, b in zip(ticks, ticks[1:]))
+            size = sum(len(response) for response in responses)
+            print("{:<9} {:<8} {:>14.1f} {:>14.1f} {:>10.1f} {:>14.1f}".format(
+                name, num_clients, sum(first_bytes) / len(first_bytes) * 1000,
+                max(first_bytes) * 1000, size / seconds / 1e6, stall * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Measures HTML escaping: html_utils.escape on the texts of a large generated book
+(which rarely need escaping) and on texts which do, against str.translate with
+a table of escapes (whether or not the text needs it) and the standard
+library's html.escape; and rendering the book with escaping built in, against
+rendering it unescaped and escaping the output in a second pass (a lower bound
+for post-processing, which would also need to tell text from tags).
+"""
+from __future__ import print_function
+
+import html
+import io
+import timeit
+
+from tests import test_utils
+from usfm_utils.html.html_utils import escape
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import parse
+
+REPETITIONS = 5
+
+ESCAPES = {ord("&"): "&amp;", ord("<"): "&lt;", ord(">"): "&gt;", ord("\""): "&quot;"}
+
+
+class UnescapedHtmlVisitor(HtmlVisitor):
+    """
+    Renders text as HtmlVisitor did before it escaped it
+    """
+    def text(self, raw_text):
+        self.record(raw_text.content)
+
+
+def texts_of(elements):
+    for element in elements:
+        content = getattr(element, "content", None)
+        if content is not None:
+            yield content
+        for text in texts_of(getattr(element, "children", ())):
+            yield text
+
+
+def best_time(func):
+    return min(timeit.repeat(func, number=1, repeat=REPETITIONS))
+
+
+def per_text(func, texts):
+    """
+    :return: the time, in nanoseconds, of func on each of the texts
+    :rtype: float
+    """
+    def run():
+        for text in texts:
+            func(text)
+    return best_time(run) * 1e9 / len(texts)
+
+
+def main():
+    document = parse(test_utils.book(num_chapters=150, verses_per_chapter=30, seed=0))
+    texts = list(texts_of(document.elements))
+    special = [text + " & <more>" for text in texts]
+    print("{:<22} {:>12} {:>14}".format("", "plain (ns)", "special (ns)"))
+    for name, func in (("escape", escape),
+                       ("translate", lambda text: text.translate(ESCAPES)),
+                       ("html.escape", html.escape)):
+        print("{:<22} {:>12.0f} {:>14.0f}".format(name, per_text(func, texts),
+                                                  per_text(func, special)))
+
+    def render(visitor_class):
+        output = io.StringIO()
+        visitor_class(output).write(document)
+        return output.getvalue()
+
+    rendered = render(UnescapedHtmlVisitor)
+    unescaped = best_time(lambda: render(UnescapedHtmlVisitor))
+    built_in = best_time(lambda: render(HtmlVisitor))
+    post_pass = best_time(lambda: escape(rendered))
+    print("render, unescaped:        {:>8.1f} ms".format(unescaped * 1000))
+    print("render, escaping built in: {:>7.1f} ms".format(built_in * 1000))
+    print("render, then escape pass: {:>8.1f} ms".format((unescaped + post_pass) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Measures HTML rendering of footnote-dense books: the footnote profile of
+benchmarks.profiles, and a book whose verses carry long cross-reference lists
+(single footnotes of thousands of fragments).
+
+Each book is rendered to an in-memory text file, and (encoded to UTF-8) to an
+unbuffered binary file, where each write is a system call. Output is buffered
+as usual, or by a buffer of one character, which writes each fragment to the
+file as it is produced (as rendering did before output was buffered).
+"""
+from __future__ import print_function
+
+import io
+import os
+import timeit
+
+from benchmarks.suite import PROFILES
+from tests.test_utils import sentence
+from usfm_utils.html.html_buffer import DEFAULT_BUFFER_SIZE
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import parse
+
+REPETITIONS = 5
+
+
+def cross_reference_heavy(num_chapters=5, verses_per_chapter=4, references=2000):
+    """
+    :return: a book whose verses each have a cross-reference listing many passages
+    :rtype: unicode
+    """
+    lines = ["\\id GEN benchmark", "\\h Benchmark"]
+    for chapter in range(1, num_chapters + 1):
+        lines.append("\\c {}".format(chapter))
+        lines.append("\\p")
+        for verse in range(1, verses_per_chapter + 1):
+            passages = " ".join("\\xot {}:{};\\xot*".format(chapter, k)
+                                for k in range(references))
+            lines.append("\\v {} {} \\x - \\xo {}:{} {}\\x*".format(
+                verse, sentence(6), chapter, verse, passages))
+    return "\n".join(lines) + "\n"
+
+
+def best_time(func):
+    return min(timeit.repeat(func, number=1, repeat=REPETITIONS))
+
+
+def main():
+    footnotes = dict(PROFILES)["footnotes"]
+    books = (("footnotes", footnotes(num_chapters=50)),
+             ("cross-references", cross_reference_heavy()))
+    raw_file = open(os.devnull, "wb", buffering=0)
+    try:
+        print("{:<18} {:<8} {:>14} {:>14}".format("book", "buffer", "text (ms)", "binary (ms)"))
+        for name, text in books:
+            document = parse(text)
+            for buffer_size in (1, DEFAULT_BUFFER_SIZE):
+
+                def render_text():
+                    HtmlVisitor(io.StringIO(), buffer_size=buffer_size).write(document)
+
+                def render_binary():
+                    HtmlVisitor(raw_file, buffer_size=buffer_size,
+                                encoding="utf-8").write(document)
+
+                print("{:<18} {:<8} {:>14.1f} {:>14.1f}".format(
+                    name, buffer_size, best_time(render_text) * 1000,
+                    best_time(render_binary) * 1000))
+    finally:
+        raw_file.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Measures rendering a long generated book (150 chapters, as Psalms) to one HTML
+page per chapter with html_pages.write_pages, serially and in pools of worker
+processes, and the cost of the prepass numbering footnotes (split_chapters).
+Pools only pay off with as many CPUs as workers.
+"""
+from __future__ import print_function
+
+import multiprocessing
+import shutil
+import tempfile
+import time
+import timeit
+
+from tests import test_utils
+from usfm_utils.html.html_pages import split_chapters, write_pages
+from usfm_utils.usfm.parse import parse
+
+REPETITIONS = 3
+WORKERS = (1, 2, 4)
+
+
+def write_time(document, workers):
+    """
+    :return: the best time of writing the pages of document, each time to a new
+    directory (as when publishing)
+    :rtype: float
+    """
+    times = []
+    for _ in range(REPETITIONS):
+        directory = tempfile.mkdtemp()
+        try:
+            start = time.perf_counter()
+            write_pages(document, directory, workers=workers)
+            times.append(time.perf_counter() - start)
+        finally:
+            shutil.rmtree(directory)
+    return min(times)
+
+
+def main():
+    document = parse(test_utils.book(num_chapters=150, verses_per_chapter=30, seed=0))
+    print("{} CPUs".format(multiprocessing.cpu_count()))
+    prepass = min(timeit.repeat(lambda: split_chapters(document), number=1, repeat=REPETITIONS))
+    print("prepass: {:.1f} ms".format(prepass * 1000))
+    print("{:<8} {:>10} {:>9}".format("workers", "time (ms)", "speedup"))
+    serial = None
+    for workers in WORKERS:
+        seconds = write_time(document, workers)
+        if serial is None:
+            serial = seconds
+        print("{:<8} {:>10.1f} {:>8.2f}x".format(workers, seconds * 1000, serial / seconds))
+
+
+if __name__ == "__main__":
+    main()
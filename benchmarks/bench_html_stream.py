@@ -0,0 +1,74 @@
+"""
+Compares rendering generated books of increasing length to HTML by parsing a
+Document and writing it (HtmlVisitor.write) with streaming the elements as they
+are parsed (HtmlStreamWriter): the time until the first chapter reaches the
+file, the total time, and the peak memory allocated while rendering (the source
+text excluded).
+"""
+from __future__ import print_function
+
+import io
+import time
+import tracemalloc
+
+from tests import test_utils
+from usfm_utils.html.html_stream import HtmlStreamWriter
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import UsfmParser
+
+LENGTHS = (25, 100, 400)
+
+
+class TimingFile(object):
+    """
+    A file discarding what is written, recording when the first chapter is
+    written to it
+    """
+    def __init__(self, start):
+        self._start = start
+        self.first_chapter = None
+
+    def write(self, s):
+        if self.first_chapter is None and "chapter_no" in s:
+            self.first_chapter = time.perf_counter() - self._start
+
+
+def render_document(parser, text, output):
+    HtmlVisitor(output).write(parser.parse_text(text))
+
+
+def render_stream(parser, text, output):
+    HtmlStreamWriter(output).write_text(text, parser=parser)
+
+
+def measure(render, parser, text):
+    """
+    :return: seconds until the first chapter is written, seconds in total, and
+    peak bytes allocated
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    output = TimingFile(start)
+    render(parser, text, output)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return output.first_chapter, total, peak
+
+
+def main():
+    parser = UsfmParser.create()
+    # warm up, so that the one-time setup of the parser is not measured
+    parser.parse_text(test_utils.book(num_chapters=1, seed=0))
+    print("{:<9} {:<9} {:>16} {:>11} {:>11}".format(
+        "chapters", "renderer", "first chapter ms", "total ms", "peak KiB"))
+    for num_chapters in LENGTHS:
+        text = test_utils.book(num_chapters=num_chapters, verses_per_chapter=30, seed=0)
+        for name, render in (("document", render_document), ("stream", render_stream)):
+            first, total, peak = measure(render, parser, text)
+            print("{:<9} {:<9} {:>16.1f} {:>11.1f} {:>11,.0f}".format(
+                num_chapters, name, first * 1000, total * 1000, peak / 1024.0))
+
+
+if __name__ == "__main__":
+    main()
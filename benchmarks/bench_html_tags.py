@@ -0,0 +1,66 @@
+"""
+Measures the per-element cost of the opening tags of HTML rendering, for the
+elements of a large generated book: HtmlVisitor's cached tags, against building
+each tag anew (as rendering did before tags were cached), and the per-element
+cost of a full render.
+"""
+from __future__ import print_function
+
+import io
+import timeit
+
+from tests import test_utils
+from usfm_utils.elements.element_impls import ChapterNumber, FormattedText, \
+    Heading, Paragraph
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import parse
+
+REPETITIONS = 5
+
+
+def descendants(elements):
+    for element in elements:
+        yield element
+        for descendant in descendants(getattr(element, "children", ())):
+            yield descendant
+
+
+def per_element(func, elements):
+    """
+    :return: the time, in nanoseconds, of func on each of the elements
+    :rtype: float
+    """
+    def run():
+        for element in elements:
+            func(element)
+    seconds = min(timeit.repeat(run, number=1, repeat=REPETITIONS))
+    return seconds * 1e9 / len(elements)
+
+
+def main():
+    document = parse(test_utils.book(num_chapters=150, verses_per_chapter=30, seed=0))
+    elements = list(descendants(document.elements))
+    visitor = HtmlVisitor(io.StringIO())
+    cases = (
+        (Paragraph, visitor.before_paragraph, visitor.paragraph_tag),
+        (FormattedText, visitor.before_formatted_text,
+         lambda element: HtmlVisitor.formatted_text_tags(element.kind)),
+        (Heading, visitor.before_heading,
+         lambda element: HtmlVisitor.heading_tags(element.kind, element.weight)),
+        (ChapterNumber, visitor.before_chapter_no,
+         lambda element: HtmlVisitor.chapter_no_tag(element.kind)),
+    )
+    print("{:<16} {:>8} {:>14} {:>14}".format("element", "count", "cached (ns)", "uncached (ns)"))
+    for element_class, cached, uncached in cases:
+        of_class = [element for element in elements if type(element) is element_class]
+        print("{:<16} {:>8,} {:>14,.0f} {:>14,.0f}".format(
+            element_class.__name__, len(of_class), per_element(cached, of_class),
+            per_element(uncached, of_class)))
+    seconds = min(timeit.repeat(lambda: HtmlVisitor(io.StringIO()).write(document),
+                                number=1, repeat=REPETITIONS))
+    print("full render: {:,.0f} ns per element ({:,} elements)"
+          .format(seconds * 1e9 / len(elements), len(elements)))
+
+
+if __name__ == "__main__":
+    main()
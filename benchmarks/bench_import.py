@@ -0,0 +1,53 @@
+"""
+Measures the start-up cost of a fresh process: importing usfm_utils.usfm and
+parsing a first (tiny) document, with and without the prebuilt PLY tables.
+"""
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+SNIPPET = """
+import time
+start = time.time()
+import usfm_utils.usfm
+from usfm_utils.usfm import tables, UsfmLexer, UsfmParser
+tables.USE_PREBUILT = {prebuilt}
+lexer = UsfmLexer.create()
+parser = UsfmParser.create()
+lexer.input(r"\\p hello")
+parser.parse(lexer)
+print(time.time() - start)
+"""
+
+REPETITIONS = 10
+
+
+def startup_time(prebuilt):
+    """
+    :param bool prebuilt: whether to use the prebuilt tables
+    :return: median seconds for importing and running a first parse
+    :rtype: float
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    code = SNIPPET.format(prebuilt=prebuilt)
+    times = []
+    for _ in range(REPETITIONS):
+        output = subprocess.check_output([sys.executable, "-c", code], env=env)
+        times.append(float(output.decode("utf-8").strip().splitlines()[-1]))
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    regenerated = startup_time(prebuilt=False)
+    prebuilt = startup_time(prebuilt=True)
+    print("import + first parse, regenerating tables: {:.1f} ms".format(regenerated * 1000))
+    print("import + first parse, prebuilt tables:     {:.1f} ms".format(prebuilt * 1000))
+    print("saving: {:.1f} ms per process".format((regenerated - prebuilt) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measures the latency of a single keystroke (the insertion of one character in a
+random word of the text) on a Psalms-sized book, reparsed incrementally and in
+full.
+"""
+from __future__ import print_function
+
+import random
+import timeit
+
+from tests import test_utils
+from usfm_utils.usfm.incremental import Edit, IncrementalParser
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main():
+    text = test_utils.book(num_chapters=150, verses_per_chapter=17, seed=0)
+    parser = UsfmParser.create(lexer_class=UsfmScanner)
+    incremental = IncrementalParser(parser)
+    document = parser.parse_text(text)
+    random.seed(0)
+
+    full_latencies = []
+    incremental_latencies = []
+    for _ in range(100):
+        offset = random.randrange(1, len(text))
+        while ord(text[offset - 1]) < 256:  # the words of test_utils are not ASCII
+            offset = random.randrange(1, len(text))
+        edit = Edit(offset, 0, "a")
+        new_text = edit.apply(text)
+        full_latencies.append(timeit.timeit(lambda: parser.parse_text(new_text), number=1))
+        # timed on the edit's own reparse, which reuses the segments of the previous one
+        start = timeit.default_timer()
+        document = incremental.reparse(document, text, edit)
+        incremental_latencies.append(timeit.default_timer() - start)
+        text = new_text
+
+    print("book: {} characters, 150 chapters; latency per edit over 100 edits"
+          .format(len(text)))
+    print("{:<12} {:>10} {:>10} {:>10}".format("", "median", "p90", "max"))
+    for name, latencies in (("full", full_latencies),
+                            ("incremental", incremental_latencies)):
+        print("{:<12} {:>7.2f} ms {:>7.2f} ms {:>7.2f} ms".format(
+            name, percentile(latencies, 0.5) * 1000, percentile(latencies, 0.9) * 1000,
+            max(latencies) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Compares parsing a single passage from a verse index against parsing the whole
+book, and reports the cost of the prescan and the size of the saved index.
+"""
+from __future__ import print_function
+
+import timeit
+
+from tests import test_utils
+from usfm_utils.usfm.index import IndexedBook, VerseIndex
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+def main():
+    text = test_utils.book(num_chapters=50, seed=0)
+    parser = UsfmParser.create(lexer_class=UsfmScanner)
+    index = VerseIndex.build(text)
+    book = IndexedBook(text, index, parser=parser)
+    data = index.dumps()
+
+    parse = min(timeit.repeat(lambda: parser.parse_text(text), number=1, repeat=5))
+    prescan = min(timeit.repeat(lambda: VerseIndex.build(text), number=1, repeat=5))
+    load = min(timeit.repeat(lambda: VerseIndex.loads(data), number=1, repeat=5))
+    passage = min(timeit.repeat(lambda: book.parse_passage("GEN 30:16-18"),
+                                number=1, repeat=5))
+    print("book: {} characters, {} chapters, {} verses, index: {} bytes"
+          .format(len(text), len(index.chapter_numbers), len(index.verse_offsets),
+                  len(data)))
+    print("full parse     {:>8.2f} ms".format(parse * 1000))
+    print("prescan        {:>8.2f} ms".format(prescan * 1000))
+    print("index load     {:>8.2f} ms".format(load * 1000))
+    print("GEN 30:16-18   {:>8.2f} ms   ({:.0f}x faster than a full parse)"
+          .format(passage * 1000, parse / passage))
+
+
+if __name__ == "__main__":
+    main()
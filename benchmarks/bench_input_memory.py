@@ -0,0 +1,46 @@
+"""
+Measures, with tracemalloc, the peak memory allocated while lexing a large book.
+
+UsfmLexer.input used to copy the whole source (escape_text replaced every
+backslash by "$", and a newline was sometimes appended), and that copy was kept
+alive for the whole of lexing. This reports the current peak next to the size of
+that copy.
+"""
+from __future__ import print_function
+
+import tracemalloc
+
+from tests import test_utils
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+def lex(lexer, text):
+    lexer.input(text)
+    while lexer.token() is not None:
+        pass
+
+
+def peak_allocated(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    text = test_utils.book(num_chapters=150, verses_per_chapter=30, seed=0)
+    escaped_copy = peak_allocated(lambda: text.replace("\\", "$"))
+    print("book: {} characters".format(len(text)))
+    print("size of the former escape_text copy: {:>10,} bytes".format(escaped_copy))
+    for lexer_class in (UsfmLexer, UsfmScanner):
+        lexer = lexer_class.create()
+        peak = peak_allocated(lambda: lex(lexer, text))
+        print("{:<12} peak while lexing: {:>10,} bytes (previously at least {:,})"
+              .format(lexer_class.__name__, peak, peak + escaped_copy))
+
+
+if __name__ == "__main__":
+    main()
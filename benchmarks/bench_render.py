@@ -0,0 +1,61 @@
+"""
+Compares visiting the elements of a large generated book through recursive
+accept calls with traversal.walk: for a visitor overriding nothing, for one
+overriding only text, and for a full HTML render.
+"""
+from __future__ import print_function
+
+import io
+import timeit
+
+from tests import test_utils
+from usfm_utils.elements.element_visitor import ElementVisitor
+from usfm_utils.elements.traversal import walk
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import parse
+
+REPETITIONS = 5
+
+
+class TextLengthVisitor(ElementVisitor):
+    def __init__(self):
+        self.length = 0
+
+    def text(self, raw_text):
+        self.length += len(raw_text.content)
+
+
+def accept_all(elements, visitor):
+    for element in elements:
+        element.accept(visitor)
+
+
+def best_time(func):
+    return min(timeit.repeat(func, number=1, repeat=REPETITIONS))
+
+
+def render(document, traverse):
+    """
+    Renders the elements and footnotes of document as HtmlVisitor.write does,
+    but visiting the elements with the given traversal function
+    """
+    visitor = HtmlVisitor(io.StringIO())
+    traverse(document.elements, visitor)
+    visitor.write_footnotes()
+
+
+def main():
+    document = parse(test_utils.book(num_chapters=150, verses_per_chapter=30, seed=0))
+    print("{:<20} {:>12} {:>12}".format("", "accept (ms)", "walk (ms)"))
+    for name, make_visitor in (("no-op visitor", ElementVisitor),
+                               ("text visitor", TextLengthVisitor)):
+        times = [best_time(lambda: traverse(document.elements, make_visitor())) * 1000
+                 for traverse in (accept_all, walk)]
+        print("{:<20} {:>12.1f} {:>12.1f}".format(name, *times))
+    times = [best_time(lambda: render(document, traverse)) * 1000
+             for traverse in (accept_all, walk)]
+    print("{:<20} {:>12.1f} {:>12.1f}".format("HTML render", *times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares the lexing throughput (tokens/sec) of UsfmLexer (PLY's master regex)
+and UsfmScanner (single marker regex with dictionary dispatch) on whole books.
+"""
+from __future__ import print_function
+
+import timeit
+
+from tests import test_utils
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.scan import UsfmScanner
+
+REPETITIONS = 5
+
+
+def count_tokens(lexer, text):
+    lexer.input(text)
+    count = 0
+    while lexer.token() is not None:
+        count += 1
+    return count
+
+
+def tokens_per_second(lexer, text):
+    num_tokens = count_tokens(lexer, text)
+    seconds = min(timeit.repeat(lambda: count_tokens(lexer, text),
+                                number=1, repeat=REPETITIONS))
+    return num_tokens, num_tokens / seconds
+
+
+def main():
+    for num_chapters in (10, 50, 150):
+        text = test_utils.book(num_chapters=num_chapters, verses_per_chapter=30, seed=0)
+        print("book of {} chapters ({} characters)".format(num_chapters, len(text)))
+        for lexer_class in (UsfmLexer, UsfmScanner):
+            num_tokens, rate = tokens_per_second(lexer_class.create(), text)
+            print("  {:<12} {:>8} tokens {:>12,.0f} tokens/sec"
+                  .format(lexer_class.__name__, num_tokens, rate))
+
+
+if __name__ == "__main__":
+    main()
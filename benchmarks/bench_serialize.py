@@ -0,0 +1,33 @@
+"""
+Compares usfm_utils.elements.serialize against pickle (highest protocol), in
+size and in dump/load time, for a parsed book.
+"""
+from __future__ import print_function
+
+import pickle
+import timeit
+import zlib
+
+from tests import test_utils
+from usfm_utils.elements import serialize
+from usfm_utils.usfm.parse import parse
+
+
+def main():
+    document = parse(test_utils.book(num_chapters=50, seed=0))
+    formats = (
+        ("pickle", lambda d: pickle.dumps(d, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("serialize", serialize.dumps, serialize.loads),
+    )
+    print("{:<10} {:>10} {:>12} {:>10} {:>10}".format(
+        "format", "bytes", "compressed", "dump", "load"))
+    for name, dumps, loads in formats:
+        data = dumps(document)
+        dump_time = min(timeit.repeat(lambda: dumps(document), number=1, repeat=5))
+        load_time = min(timeit.repeat(lambda: loads(data), number=1, repeat=5))
+        print("{:<10} {:>10,} {:>12,} {:>7.2f} ms {:>7.2f} ms".format(
+            name, len(data), len(zlib.compress(data)), dump_time * 1000, load_time * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Measures the overhead of Stats instrumentation on parsing and rendering a book:
+without a Stats object (which should cost nothing), and with one.
+"""
+from __future__ import print_function
+
+import io
+import timeit
+
+from tests import test_utils
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.stats import Stats
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+REPETITIONS = 7
+
+
+def parse_and_render(parser, text, stats):
+    document = parser.parse_text(text, stats=stats)
+    HtmlVisitor(io.StringIO(), stats=stats).write(document)
+
+
+def main():
+    text = test_utils.book(num_chapters=50, seed=0)
+    parser = UsfmParser.create(lexer_class=UsfmScanner)
+    disabled = min(timeit.repeat(lambda: parse_and_render(parser, text, None),
+                                 number=1, repeat=REPETITIONS))
+    stats = Stats()
+    enabled = min(timeit.repeat(lambda: parse_and_render(parser, text, stats),
+                                number=1, repeat=REPETITIONS))
+    print("parse + render, without stats {:>7.2f} ms".format(disabled * 1000))
+    print("parse + render, with stats    {:>7.2f} ms   ({:+.0%})"
+          .format(enabled * 1000, enabled / disabled - 1))
+    stats = Stats(path="book.usfm")
+    parse_and_render(parser, text, stats)
+    for phase, seconds in sorted(stats.phases.items()):
+        print("  {:<8} {:>7.2f} ms".format(phase, seconds * 1000))
+    print("  {} tokens, {} reductions, {} bytes written".format(
+        sum(stats.token_counts.values()), sum(stats.reductions.values()),
+        stats.bytes_written))
+
+
+if __name__ == "__main__":
+    main()
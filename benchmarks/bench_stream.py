@@ -0,0 +1,45 @@
+"""
+Compares, with tracemalloc, the peak memory of a full parse against that of
+UsfmParser.iter_elements, for books of increasing length.
+
+Elements are discarded as soon as they are streamed, so the peak of a streamed
+parse is bounded by the largest element rather than growing with the book (the
+source text itself is allocated beforehand and not counted).
+"""
+from __future__ import print_function
+
+import tracemalloc
+
+from tests import test_utils
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+def peak_allocated(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def stream(parser, text):
+    for _ in parser.iter_elements(text):
+        pass
+
+
+def main():
+    parser = UsfmParser.create(lexer_class=UsfmScanner)
+    parser.parse_text(test_utils.book(num_chapters=1))  # load tables beforehand
+    print("{:>9} {:>12} {:>16} {:>16}".format("chapters", "characters", "full parse", "streamed"))
+    for num_chapters in (10, 50, 150):
+        text = test_utils.book(num_chapters=num_chapters, seed=0)
+        full = peak_allocated(lambda: parser.parse_text(text))
+        streamed = peak_allocated(lambda: stream(parser, text))
+        print("{:>9} {:>12,} {:>10,} bytes {:>10,} bytes"
+              .format(num_chapters, len(text), full, streamed))
+
+
+if __name__ == "__main__":
+    main()
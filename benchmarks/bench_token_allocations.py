@@ -0,0 +1,49 @@
+"""
+Measures, with tracemalloc, the memory blocks and bytes that remain allocated
+per token when all the tokens of a book are kept (as the parser's stacks do
+for the tokens of a production), for UsfmLexer and UsfmScanner.
+
+The strings produced by lexing (token values) are counted as well, so the
+figures are an upper bound on the cost of the token objects themselves.
+"""
+from __future__ import print_function
+
+import tracemalloc
+
+from tests import test_utils
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+def lex_all(lexer, text):
+    lexer.input(text)
+    tokens = []
+    token = lexer.token()
+    while token is not None:
+        tokens.append(token)
+        token = lexer.token()
+    return tokens
+
+
+def main():
+    text = test_utils.book(num_chapters=50, seed=0)
+    print("book: {} characters".format(len(text)))
+    for lexer_class in (UsfmLexer, UsfmScanner):
+        lexer = lexer_class.create(track_positions=True)
+        lex_all(lexer, text)  # warm up
+        tracemalloc.start()
+        try:
+            tokens = lex_all(lexer, text)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        stats = snapshot.statistics("filename")
+        blocks = sum(stat.count for stat in stats)
+        size = sum(stat.size for stat in stats)
+        print("{:<12} {:>7} tokens {:>6.2f} blocks/token {:>7.1f} bytes/token"
+              .format(lexer_class.__name__, len(tokens), blocks / float(len(tokens)),
+                      size / float(len(tokens))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Compares UsfmParser.validate, which runs the grammar without building elements,
+against a full parse of the same large book, with both lexing engines.
+"""
+from __future__ import print_function
+
+import timeit
+
+from tests import test_utils
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+def main():
+    text = test_utils.book(num_chapters=150, verses_per_chapter=30, seed=0)
+    print("book: {} characters".format(len(text)))
+    for lexer_class in (UsfmLexer, UsfmScanner):
+        parser = UsfmParser.create(lexer_class=lexer_class)
+        assert parser.validate(text).valid
+        parse = min(timeit.repeat(lambda: parser.parse_text(text), number=1, repeat=5))
+        validate = min(timeit.repeat(lambda: parser.validate(text), number=1, repeat=5))
+        print("{:<12} parse {:>7.1f} ms   validate {:>7.1f} ms   ({:.2f}x faster)"
+              .format(lexer_class.__name__, parse * 1000, validate * 1000, parse / validate))
+
+
+if __name__ == "__main__":
+    main()
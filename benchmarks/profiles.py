@@ -0,0 +1,118 @@
+"""
+Fixed USFM inputs for benchmarks, each stressing a different part of the lexer
+and grammar. The inputs are generated from the random words of tests.test_utils,
+with a fixed seed, so that every run measures exactly the same text.
+"""
+from __future__ import unicode_literals
+
+import random
+
+from tests.test_utils import sentence, word
+
+SEED = 0
+
+HEADER = [
+    "\\id GEN benchmark",
+    "\\h Benchmark",
+    "\\toc1 Benchmark",
+    "\\mt1 Benchmark",
+]
+
+
+def paragraph_heavy(num_chapters=20, verses_per_chapter=25):
+    """
+    Prose, with a new (possibly indented) paragraph before every verse
+    :rtype: unicode
+    """
+    random.seed(SEED)
+    markers = ["\\p", "\\p", "\\m", "\\pi1", "\\pi2", "\\pmo", "\\li1", "\\nb"]
+    lines = list(HEADER)
+    for chapter in range(1, num_chapters + 1):
+        lines.append("\\c {}".format(chapter))
+        for verse in range(1, verses_per_chapter + 1):
+            lines.append(random.choice(markers))
+            lines.append("\\v {} {}".format(verse, sentence(random.randint(4, 16))))
+    return "\n".join(lines) + "\n"
+
+
+def poetry_heavy(num_chapters=20, verses_per_chapter=25):
+    """
+    Psalms-like poetry: a line per poetic marker, with stanza breaks, selahs and
+    acrostic headings
+    :rtype: unicode
+    """
+    random.seed(SEED)
+    lines = list(HEADER)
+    for chapter in range(1, num_chapters + 1):
+        lines.append("\\c {}".format(chapter))
+        lines.append("\\d {}".format(sentence(5)))
+        for verse in range(1, verses_per_chapter + 1):
+            if verse % 8 == 1:
+                lines.append("\\qa {}".format(word(allow_empty=False)))
+            lines.append("\\q1")
+            lines.append("\\v {} {}".format(verse, sentence(random.randint(3, 8))))
+            lines.append("\\q2 {}".format(sentence(random.randint(3, 8))))
+            choice = random.random()
+            if choice < 0.1:
+                lines.append("\\qr {} \\qs {}\\qs*".format(sentence(3), word(allow_empty=False)))
+            elif choice < 0.2:
+                lines.append("\\qc {}".format(sentence(4)))
+            elif choice < 0.4:
+                lines.append("\\b")
+    return "\n".join(lines) + "\n"
+
+
+def footnote_heavy(num_chapters=10, verses_per_chapter=25):
+    """
+    Short verses, each with one to three footnotes or cross-references
+    :rtype: unicode
+    """
+    random.seed(SEED)
+    lines = list(HEADER)
+    for chapter in range(1, num_chapters + 1):
+        lines.append("\\c {}".format(chapter))
+        lines.append("\\p")
+        for verse in range(1, verses_per_chapter + 1):
+            parts = ["\\v {} {}".format(verse, sentence(random.randint(2, 6)))]
+            for _ in range(random.randint(1, 3)):
+                choice = random.random()
+                if choice < 0.5:
+                    parts.append("\\f + \\fr {}:{} \\fq {} \\ft {}\\f*".format(
+                        chapter, verse, sentence(2), sentence()))
+                elif choice < 0.7:
+                    parts.append("\\f {} \\fr {}:{} \\fk {} \\ft {} \\fqa {}\\f*".format(
+                        word(allow_empty=False), chapter, verse, word(allow_empty=False),
+                        sentence(), sentence(2)))
+                else:
+                    parts.append("\\x - \\xo {}:{} \\xq {}\\x*".format(
+                        chapter, verse, sentence(3)))
+                parts.append(sentence(random.randint(1, 4)))
+            lines.append(" ".join(parts))
+    return "\n".join(lines) + "\n"
+
+
+def chapter_heavy(num_chapters=400, verses_per_chapter=3):
+    """
+    Many short chapters, with chapter labels and section headings
+    :rtype: unicode
+    """
+    random.seed(SEED)
+    lines = list(HEADER)
+    lines.append("\\cl {}".format(word(allow_empty=False)))
+    for chapter in range(1, num_chapters + 1):
+        lines.append("\\c {}".format(chapter))
+        if chapter % 10 == 0:
+            lines.append("\\cl {}".format(sentence(2)))
+        lines.append("\\s1 {}".format(sentence(4)))
+        lines.append("\\p")
+        for verse in range(1, verses_per_chapter + 1):
+            lines.append("\\v {} {}".format(verse, sentence(random.randint(4, 10))))
+    return "\n".join(lines) + "\n"
+
+
+PROFILES = (
+    ("paragraphs", paragraph_heavy),
+    ("poetry", poetry_heavy),
+    ("footnotes", footnote_heavy),
+    ("chapters", chapter_heavy),
+)
@@ -0,0 +1,171 @@
+"""
+Lexer and parser benchmark suite, with regression checks against a baseline.
+
+Measures, on each of the inputs of benchmarks.profiles:
+- lex.<profile>.<lexer>: tokens/sec of UsfmLexer and UsfmScanner
+- parse.<profile>: elements/sec of UsfmParser (all elements of the tree)
+and the start-up time of a fresh process (import and first parse).
+
+Results are written as JSON. Given a baseline (the JSON output of an earlier run),
+each metric is compared against it, and the suite fails if any metric is worse
+than the baseline by more than the threshold:
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.1
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+from benchmarks.bench_import import startup_time
+from benchmarks.bench_scan import count_tokens
+from benchmarks.profiles import PROFILES
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+REPETITIONS = 5
+DEFAULT_THRESHOLD = 0.1
+
+
+class Metric(object):
+    def __init__(self, name, value, unit, higher_is_better):
+        """
+        :param str name:
+        :param float value:
+        :param str unit:
+        :param bool higher_is_better: whether higher values are improvements (e.g.
+        for throughputs, as opposed to durations)
+        """
+        self.name = name
+        self.value = value
+        self.unit = unit
+        self.higher_is_better = higher_is_better
+
+    def to_json(self):
+        return {"value": self.value, "unit": self.unit,
+                "higher_is_better": self.higher_is_better}
+
+    @staticmethod
+    def from_json(name, obj):
+        return Metric(name, obj["value"], obj["unit"], obj["higher_is_better"])
+
+    def change(self, baseline):
+        """
+        :param Metric baseline: the same metric, from an earlier run
+        :return: the relative change from baseline, positive for improvements
+        :rtype: float
+        """
+        change = (self.value - baseline.value) / baseline.value
+        return change if self.higher_is_better else -change
+
+
+def count_elements(elements):
+    """
+    :return: the number of elements in the given trees
+    :rtype: int
+    """
+    count = 0
+    for element in elements:
+        count += 1 + count_elements(getattr(element, "children", ()))
+    return count
+
+
+def best_time(func):
+    return min(timeit.repeat(func, number=1, repeat=REPETITIONS))
+
+
+def run(startup=True):
+    """
+    :param bool startup: whether to measure the start-up time (which runs fresh
+    processes)
+    :rtype: list[Metric]
+    """
+    metrics = []
+    parser = UsfmParser.create()
+    for profile, generate in PROFILES:
+        text = generate()
+        for lexer_class in (UsfmLexer, UsfmScanner):
+            lexer = lexer_class.create()
+            num_tokens = count_tokens(lexer, text)
+            seconds = best_time(lambda: count_tokens(lexer, text))
+            metrics.append(Metric("lex.{}.{}".format(profile, lexer_class.__name__),
+                                  num_tokens / seconds, "tokens/s", True))
+        num_elements = count_elements(parser.parse_text(text).elements)
+        seconds = best_time(lambda: parser.parse_text(text))
+        metrics.append(Metric("parse.{}".format(profile), num_elements / seconds,
+                              "elements/s", True))
+    if startup:
+        metrics.append(Metric("startup", startup_time(prebuilt=True), "s", False))
+    return metrics
+
+
+def to_json(metrics):
+    return {
+        "python": platform.python_version(),
+        "metrics": dict((metric.name, metric.to_json()) for metric in metrics),
+    }
+
+
+def from_json(obj):
+    return [Metric.from_json(name, value) for name, value in sorted(obj["metrics"].items())]
+
+
+def compare(metrics, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    :param list[Metric] metrics:
+    :param list[Metric] baseline: metrics of an earlier run
+    :param float threshold: largest allowed relative regression, e.g. 0.1 for 10%
+    :return: (metric, baseline metric, relative change) for each metric present
+    in both, and the regressions among them
+    :rtype: (list[(Metric, Metric, float)], list[(Metric, Metric, float)])
+    """
+    baseline_by_name = dict((metric.name, metric) for metric in baseline)
+    comparisons = [(metric, baseline_by_name[metric.name],
+                    metric.change(baseline_by_name[metric.name]))
+                   for metric in metrics if metric.name in baseline_by_name]
+    regressions = [comparison for comparison in comparisons if comparison[2] < -threshold]
+    return comparisons, regressions
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--output", help="file to write the results to, as JSON")
+    arg_parser.add_argument("--compare", metavar="BASELINE",
+                            help="JSON results of an earlier run to compare against")
+    arg_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="largest allowed relative regression (default: %(default)s)")
+    arg_parser.add_argument("--no-startup", action="store_true",
+                            help="skip the start-up time, which runs fresh processes")
+    args = arg_parser.parse_args(argv)
+
+    metrics = run(startup=not args.no_startup)
+    results = json.dumps(to_json(metrics), indent=2, sort_keys=True)
+    if args.output is None:
+        print(results)
+    else:
+        with open(args.output, "w") as output_file:
+            output_file.write(results + "\n")
+
+    if args.compare is None:
+        return 0
+    with open(args.compare) as baseline_file:
+        baseline = from_json(json.load(baseline_file))
+    comparisons, regressions = compare(metrics, baseline, args.threshold)
+    for metric, baseline_metric, change in comparisons:
+        print("{:<32} {:>14,.4g} {:>14,.4g} {:>+8.1%}{}".format(
+            metric.name, baseline_metric.value, metric.value, change,
+            "  REGRESSION" if change < -args.threshold else ""), file=sys.stderr)
+    if regressions:
+        print("{} metric(s) regressed by more than {:.0%}"
+              .format(len(regressions), args.threshold), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
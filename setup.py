@@ -1,10 +1,44 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Command
+from setuptools.command.build_py import build_py
 from codecs import open
 from os import path
 
 here = path.abspath(path.dirname(__file__))
 
 
+def build_tables():
+    try:
+        from usfm_utils.usfm.tables import build_tables as build
+    except ImportError as e:
+        print("Could not regenerate lexer/parser tables ({}), "
+              "using the shipped ones".format(e))
+        return
+    build()
+
+
+class BuildTables(Command):
+    """
+    Regenerates the prebuilt PLY tables (usfm_utils/usfm/lextab.py and parsetab.py)
+    """
+    description = "regenerate the prebuilt lexer and parser tables"
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        build_tables()
+
+
+class BuildPy(build_py):
+    def run(self):
+        build_tables()
+        build_py.run(self)
+
+
 with open(path.join(here, "README.rst"), "r") as f:
     long_description = f.read()
 
@@ -26,7 +60,8 @@ setup(
         'Programming Language :: Python :: 3.5'
     ],
     keywords=["usfm", "html"],
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     install_requires=["enum34", "future", "ply"],
-    test_suite="tests"
+    test_suite="tests.suite",
+    cmdclass={"build_py": BuildPy, "build_tables": BuildTables}
 )
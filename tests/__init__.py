@@ -1 +1,26 @@
-from tests import test_html, test_parse
+from tests import test_batch, test_cache, test_concurrency, test_elements, test_flat, test_html, test_html_pages, test_html_stream, test_incremental, test_index, test_parse, test_scan, test_serialize, test_stats, test_tables, test_traversal
+
+import sys
+import unittest
+
+TEST_MODULES = [test_batch, test_cache, test_concurrency, test_elements, test_flat, test_html,
+                test_html_pages, test_html_stream, test_incremental, test_index, test_parse,
+                test_scan, test_serialize, test_stats, test_tables, test_traversal]
+
+if sys.version_info >= (3, 5):
+    from tests import test_html_async
+    TEST_MODULES.append(test_html_async)
+
+
+def suite():
+    """
+    The tests run by setup.py test. They are loaded from TEST_MODULES rather than
+    by scanning the package, which would import test_html_async on any version.
+    test_benchmarks imports the benchmarks, which import tests, so it is only
+    loaded here
+    :rtype: unittest.TestSuite
+    """
+    loader = unittest.TestLoader()
+    tests = unittest.TestSuite(loader.loadTestsFromModule(module) for module in TEST_MODULES)
+    tests.addTests(loader.loadTestsFromName("tests.test_benchmarks"))
+    return tests
@@ -0,0 +1,100 @@
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests import test_utils
+from usfm_utils.batch import parse_many, render_html
+from usfm_utils.usfm.parse import parse
+from usfm_utils.usfm.usfm_error import UsfmInputError
+
+
+class BatchTests(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.texts = [test_utils.book(num_chapters=2, seed=seed) for seed in range(5)]
+        self.texts.append("\\p {}\\bd*".format(test_utils.word()))
+        self.paths = []
+        for i, text in enumerate(self.texts):
+            path = os.path.join(self.directory, "{}.usfm".format(i))
+            with io.open(path, "w", encoding="utf-8") as usfm_file:
+                usfm_file.write(text)
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assert_results(self, results, ordered=True):
+        if ordered:
+            self.assertEqual([result.path for result in results], self.paths)
+        self.assertEqual(sorted(result.path for result in results), sorted(self.paths))
+        by_path = dict((result.path, result) for result in results)
+        for path, text in zip(self.paths[:-1], self.texts):
+            result = by_path[path]
+            self.assertTrue(result.ok, path)
+            self.assertEqual(test_utils.structure(result.document),
+                             test_utils.structure(parse(text)))
+        error = by_path[self.paths[-1]]
+        self.assertFalse(error.ok)
+        self.assertIsNone(error.document)
+        self.assertIsInstance(error.error, UsfmInputError)
+        self.assertEqual(error.error.position.line, 1)
+
+    def test_in_process(self):
+        self.assert_results(list(parse_many(self.paths, workers=1)))
+
+    def test_ordered(self):
+        self.assert_results(list(parse_many(self.paths, workers=2)))
+
+    def test_unordered(self):
+        results = list(parse_many(self.paths, workers=2, ordered=False, chunksize=2))
+        self.assert_results(results, ordered=False)
+
+    def test_render(self):
+        results = list(parse_many(self.paths[:2], workers=2, render=render_html))
+        for result, text in zip(results, self.texts):
+            self.assertIsNone(result.document)
+            self.assertEqual(result.output, render_html(parse(text)))
+
+    def test_stats(self):
+        results = list(parse_many(self.paths[:2], workers=2, render=render_html,
+                                  collect_stats=True))
+        for result in results:
+            stats = result.stats.to_json()
+            self.assertEqual(stats["path"], result.path)
+            self.assertEqual(set(stats["phases"]), {"input", "lex", "parse", "render"})
+            self.assertEqual(stats["tokens"]["CHAPTER"], 2)
+            self.assertEqual(stats["bytes_written"], len(result.output.encode("utf-8")))
+        self.assertIsNone(next(parse_many(self.paths[:1], workers=1)).stats)
+
+    def test_missing_file(self):
+        path = os.path.join(self.directory, "missing.usfm")
+        result, = parse_many([path], workers=1)
+        self.assertIsInstance(result.error, EnvironmentError)
+
+    def test_invalid_encoding(self):
+        path = os.path.join(self.directory, "latin1.usfm")
+        with io.open(path, "wb") as usfm_file:
+            usfm_file.write("\\p caf\u00e9".encode("latin-1"))
+        for workers in (1, 2):
+            results = list(parse_many([path] + self.paths[:2], workers=workers))
+            self.assertIsInstance(results[0].error, UnicodeDecodeError)
+            self.assertTrue(all(result.ok for result in results[1:]))
+
+    def test_render_error(self):
+        results = list(parse_many(self.paths[:2], workers=1, render=failing_render))
+        for result in results:
+            self.assertIsInstance(result.error, ValueError)
+
+
+def failing_render(document):
+    raise ValueError("cannot render")
+
+
+if __name__ == "__main__":
+    unittest.main()
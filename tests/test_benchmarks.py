@@ -0,0 +1,49 @@
+from __future__ import unicode_literals
+
+import os
+import subprocess
+import sys
+import unittest
+
+from benchmarks import suite
+from benchmarks.profiles import PROFILES
+from usfm_utils.usfm.parse import parse
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    longMessage = True
+
+    def test_profiles(self):
+        for name, generate in PROFILES:
+            text = generate()
+            self.assertEqual(generate(), text, name)
+            self.assertGreater(suite.count_elements(parse(text).elements), 1000, name)
+
+    def test_compare(self):
+        baseline = [suite.Metric("parse", 100.0, "elements/s", True),
+                    suite.Metric("startup", 1.0, "s", False),
+                    suite.Metric("removed", 1.0, "s", False)]
+        metrics = [suite.Metric("parse", 95.0, "elements/s", True),
+                   suite.Metric("startup", 1.2, "s", False),
+                   suite.Metric("added", 1.0, "s", False)]
+        comparisons, regressions = suite.compare(metrics, baseline, threshold=0.1)
+        self.assertEqual([metric.name for metric, _, _ in comparisons], ["parse", "startup"])
+        self.assertAlmostEqual(comparisons[0][2], -0.05)
+        self.assertAlmostEqual(comparisons[1][2], -0.2)
+        self.assertEqual([metric.name for metric, _, _ in regressions], ["startup"])
+
+    def test_json(self):
+        metrics = [suite.Metric("parse", 100.0, "elements/s", True)]
+        loaded = suite.from_json(suite.to_json(metrics))
+        self.assertEqual([vars(metric) for metric in loaded],
+                         [vars(metric) for metric in metrics])
+
+    def test_import(self):
+        # in a fresh interpreter, where neither benchmarks nor tests is imported yet
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for module in ("benchmarks.suite", "benchmarks.profiles"):
+            subprocess.check_call([sys.executable, "-c", "import " + module], cwd=root)
+
+
+if __name__ == "__main__":
+    unittest.main()
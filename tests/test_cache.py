@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from tests import test_utils
+from usfm_utils.usfm import tables
+from usfm_utils.usfm.cache import DocumentCache
+from usfm_utils.usfm.parse import parse
+
+
+class DocumentCacheTests(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hit(self):
+        cache = DocumentCache(self.directory)
+        text = test_utils.book(num_chapters=2)
+        expected = test_utils.structure(parse(text))
+        self.assertEqual(test_utils.structure(cache.parse_text(text)), expected)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(test_utils.structure(cache.parse_text(text)), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 1)
+
+    def test_persistent(self):
+        text = test_utils.book(num_chapters=1)
+        DocumentCache(self.directory).parse_text(text)
+        cache = DocumentCache(self.directory)
+        self.assertIsNotNone(cache.get(text))
+        self.assertEqual(cache.hits, 1)
+
+    def test_shared_directory(self):
+        text = test_utils.book(num_chapters=1)
+        cache = DocumentCache(self.directory)
+        DocumentCache(self.directory).parse_text(text)
+        self.assertIsNotNone(cache.get(text))
+        self.assertEqual(cache.size, os.path.getsize(os.path.join(
+            self.directory, DocumentCache.key(text) + ".doc")))
+
+    def test_flags_fingerprint(self):
+        text = test_utils.book(num_chapters=1)
+        key = DocumentCache.key(text)
+        checksum = tables._checksum
+        tables._checksum = "changed"
+        try:
+            self.assertNotEqual(DocumentCache.key(text), key)
+        finally:
+            tables._checksum = checksum
+
+    def test_lru_eviction(self):
+        texts = [test_utils.book(num_chapters=1, seed=seed) for seed in range(4)]
+        entry_size = len(DocumentCache.dumps(parse(texts[0])))
+        cache = DocumentCache(self.directory, max_size=int(entry_size * 3.5))
+        for text in texts[:3]:
+            cache.parse_text(text)
+        cache.parse_text(texts[0])  # texts[1] is now the least recently used
+        cache.parse_text(texts[3])
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get(texts[1]))
+        for text in (texts[0], texts[2], texts[3]):
+            self.assertIsNotNone(cache.get(text))
+        self.assertLessEqual(cache.size, int(entry_size * 3.5))
+
+    def test_corrupted_entry(self):
+        text = test_utils.book(num_chapters=1)
+        cache = DocumentCache(self.directory)
+        cache.parse_text(text)
+        with open(os.path.join(self.directory, cache.key(text) + ".doc"), "wb") as f:
+            f.write(b"garbage")
+        self.assertIsNotNone(cache.parse_text(text))
+        self.assertEqual(cache.misses, 2)
+
+    def test_read_only_entry(self):
+        text = test_utils.book(num_chapters=1)
+        cache = DocumentCache(self.directory)
+        cache.parse_text(text)
+        utime = os.utime
+
+        def failing_utime(path, times):
+            raise OSError("read-only file system")
+        os.utime = failing_utime
+        try:
+            self.assertIsNotNone(cache.get(text))
+        finally:
+            os.utime = utime
+        self.assertEqual(cache.hits, 1)
+
+    def test_pickled_entry(self):
+        # entries are never unpickled, so a tampered entry cannot run code
+        text = test_utils.book(num_chapters=1)
+        cache = DocumentCache(self.directory)
+        cache.parse_text(text)
+        with open(os.path.join(self.directory, cache.key(text) + ".doc"), "wb") as f:
+            f.write(pickle.dumps(Tampered()))
+        del Tampered.loaded[:]
+        self.assertIsNotNone(cache.parse_text(text))
+        self.assertEqual(Tampered.loaded, [])
+        self.assertEqual(cache.misses, 2)
+
+
+class Tampered(object):
+    loaded = []
+
+    def __reduce__(self):
+        return tampered_loaded, ()
+
+
+def tampered_loaded():
+    Tampered.loaded.append("loaded")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from __future__ import unicode_literals
+
+import threading
+import unittest
+
+from tests import test_utils
+from usfm_utils.elements.element_impls import Paragraph
+from usfm_utils.usfm.parse import UsfmParser, parse
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+class ConcurrencyTests(unittest.TestCase):
+    longMessage = True
+
+    @staticmethod
+    def run_threads(target, num_threads):
+        errors = []
+
+        def run():
+            try:
+                target()
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=run) for _ in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def assert_parallel_parses(self, parse_func, num_threads=8, parses_per_thread=5):
+        books = [test_utils.book(num_chapters=3, seed=seed) for seed in range(4)]
+        expected = [test_utils.structure(parse_func(book)) for book in books]
+        mismatches = []
+
+        def parse_books():
+            for i in range(parses_per_thread):
+                index = (i + threading.current_thread().ident) % len(books)
+                actual = test_utils.structure(parse_func(books[index]))
+                if actual != expected[index]:
+                    mismatches.append(index)
+        errors = self.run_threads(parse_books, num_threads)
+        self.assertEqual(errors, [])
+        self.assertEqual(mismatches, [])
+
+    def test_parse_function(self):
+        self.assert_parallel_parses(parse)
+
+    def test_shared_parser(self):
+        parser = UsfmParser.create(lexer_class=UsfmScanner)
+        self.assert_parallel_parses(parser.parse_text)
+
+    def test_reentrant(self):
+        parser = UsfmParser.create()
+        outer = test_utils.book(num_chapters=2, seed=0)
+        inner = test_utils.book(num_chapters=1, seed=1)
+        expected = test_utils.structure(parser.parse_text(inner))
+        stream = parser.iter_elements(outer)
+        streamed = []
+        for element in stream:
+            streamed.append(element)
+            self.assertEqual(test_utils.structure(parser.parse_text(inner)), expected)
+        self.assertEqual(test_utils.structure(streamed),
+                         test_utils.structure(list(parser.parse_text(outer).elements)))
+
+    def test_no_leaked_metadata(self):
+        parser = UsfmParser.create()
+        document = parser.parse_text("\\h Heading\n\\toc1 Long\n\\p text")
+        self.assertEqual(document.heading, "Heading")
+        self.assertEqual(document.table_of_contents.long_description, "Long")
+        document = parser.parse_text("\\nb text")
+        self.assertIsNone(document.heading)
+        self.assertIsNone(document.table_of_contents.long_description)
+        # no previous paragraph to continue
+        self.assertFalse(document.elements[0].continuation)
+        self.assertIsInstance(document.elements[0], Paragraph)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+from __future__ import unicode_literals
+
+import copy
+import gc
+import pickle
+import unittest
+
+from tests import test_utils
+from usfm_utils.elements.element_impls import FormattedText, Paragraph, Text
+from usfm_utils.elements.footnote_utils import AutomaticFootnoteLabel, \
+    CustomFootnoteLabel, NoFootnoteLabel
+from usfm_utils.elements.paragraph_utils import Centered, LeftAligned, \
+    RightAligned
+from usfm_utils.usfm.parse import parse
+
+
+def walk(elements):
+    for element in elements:
+        yield element
+        for descendant in walk(getattr(element, "children", ())):
+            yield descendant
+
+
+class ElementTests(unittest.TestCase):
+    longMessage = True
+
+    def test_no_dict(self):
+        document = parse(test_utils.book(num_chapters=2))
+        for element in walk(document.elements):
+            self.assertFalse(hasattr(element, "__dict__"), type(element))
+        for value in (LeftAligned(), Centered(), AutomaticFootnoteLabel(),
+                      CustomFootnoteLabel("a")):
+            self.assertFalse(hasattr(value, "__dict__"), type(value))
+
+    def test_shared_layouts(self):
+        self.assertIs(LeftAligned(), LeftAligned(LeftAligned.FirstLineIndent.default, 0))
+        self.assertIs(LeftAligned(left_margin_indent=2), LeftAligned(left_margin_indent=2))
+        self.assertIsNot(LeftAligned(left_margin_indent=2), LeftAligned())
+        self.assertIs(Centered(), Centered())
+        self.assertIs(RightAligned(), RightAligned())
+        self.assertIs(Paragraph([]).layout, Paragraph([]).layout)
+
+    def test_shared_labels(self):
+        self.assertIs(AutomaticFootnoteLabel(), AutomaticFootnoteLabel())
+        self.assertIs(NoFootnoteLabel(), NoFootnoteLabel())
+        self.assertIs(CustomFootnoteLabel("a"), CustomFootnoteLabel("a"))
+        self.assertIsNot(CustomFootnoteLabel("a"), CustomFootnoteLabel("b"))
+        document = parse("\\id GEN\n\\c 1\n\\p\n\\v 1 a \\f * b\\f* \\f * c\\f*")
+        first, second = [element for element in walk(document.elements)
+                         if hasattr(element, "label")]
+        self.assertIs(first.label, second.label)
+
+    def test_unused_values_released(self):
+        label = CustomFootnoteLabel("unused label")
+        layout = LeftAligned(left_margin_indent=123)
+        keys = [(CustomFootnoteLabel, "unused label"),
+                (LeftAligned, LeftAligned.FirstLineIndent.default, 123)]
+        self.assertIn(keys[0], CustomFootnoteLabel._instances)
+        self.assertIn(keys[1], LeftAligned._instances)
+        del label, layout
+        gc.collect()
+        self.assertNotIn(keys[0], CustomFootnoteLabel._instances)
+        self.assertNotIn(keys[1], LeftAligned._instances)
+
+    def test_copies_are_shared(self):
+        values = [LeftAligned(LeftAligned.FirstLineIndent.outdent, 3), Centered(),
+                  RightAligned(), AutomaticFootnoteLabel(), NoFootnoteLabel(),
+                  CustomFootnoteLabel("a")]
+        for value in values:
+            self.assertIs(copy.copy(value), value)
+            self.assertIs(copy.deepcopy(value), value)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                self.assertIs(pickle.loads(pickle.dumps(value, protocol)), value)
+
+    def test_pickle(self):
+        document = parse(test_utils.book(num_chapters=2))
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(document, protocol))
+            self.assertEqual(test_utils.structure(loaded), test_utils.structure(document))
+
+    def test_interned_verse_numbers(self):
+        document = parse("\\id GEN\n\\c 1\n\\p\n\\v 1 a\n\\c 2\n\\p\n\\v 1 b\n")
+        numbers = [element.children[0].content for element in walk(document.elements)
+                   if isinstance(element, FormattedText) and
+                   element.kind == FormattedText.Kind.verse_no]
+        self.assertEqual(numbers, ["1", "1"])
+        self.assertIs(numbers[0], numbers[1])
+
+    def test_children(self):
+        children = [Text("a"), Text("b")]
+        paragraph = Paragraph(children)
+        children.append(Text("c"))
+        self.assertEqual(len(paragraph.children), 2)
+        self.assertIsInstance(paragraph.children, tuple)
+
+
+if __name__ == "__main__":
+    unittest.main()
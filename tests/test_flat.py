@@ -0,0 +1,97 @@
+from __future__ import unicode_literals
+
+import io
+import pickle
+import unittest
+
+from tests import test_utils
+from usfm_utils.elements.document import Document
+from usfm_utils.elements.element_impls import ChapterNumber, Paragraph, Text
+from usfm_utils.elements.flat import NO_INDEX, TYPE_CODES, FlatDocument
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import UsfmParser, parse, parse_flat
+
+FIELDS = ("kind", "content", "weight", "introductory", "layout", "embedded",
+          "poetic", "continuation", "label")
+
+
+def describe(element):
+    """
+    :return: a comparable description of an element tree, through the fields of
+    its element class, so that views and elements can be compared
+    """
+    element_type = next(cls for cls in type(element).__mro__ if cls in TYPE_CODES)
+    fields = dict((name, getattr(element, name)) for name in FIELDS
+                  if hasattr(element, name))
+    children = [describe(child) for child in getattr(element, "children", ())]
+    return element_type, fields, children
+
+
+def render(document):
+    output = io.StringIO()
+    HtmlVisitor(output).write(document)
+    return output.getvalue()
+
+
+class FlatDocumentTests(unittest.TestCase):
+    longMessage = True
+
+    def assert_flattens(self, document):
+        flat = FlatDocument.from_document(document)
+        self.assertEqual([describe(view) for view in flat.elements],
+                         [describe(element) for element in document.elements])
+        self.assertEqual(test_utils.structure(flat.to_document()),
+                         test_utils.structure(document))
+        self.assertEqual(flat.heading, document.heading)
+        self.assertIs(flat.table_of_contents, document.table_of_contents)
+        return flat
+
+    def test_every_kind(self):
+        self.assert_flattens(test_utils.every_kind_document())
+
+    def test_book(self):
+        flat = self.assert_flattens(parse(test_utils.book(num_chapters=5)))
+        self.assertGreater(len(flat), 100)
+
+    def test_empty(self):
+        flat = self.assert_flattens(Document([]))
+        self.assertEqual(len(flat), 0)
+        self.assertEqual(flat.to_document().elements, [])
+
+    def test_links(self):
+        document = Document([ChapterNumber(ChapterNumber.Kind.standard, [Text("1")]),
+                             Paragraph([Text("a"), Paragraph([Text("b")]), Text("c")])])
+        flat = FlatDocument.from_document(document)
+        self.assertEqual(list(flat.parents), [NO_INDEX, 0, NO_INDEX, 2, 2, 4, 2])
+        self.assertEqual(list(flat.first_children),
+                         [1, NO_INDEX, 3, NO_INDEX, 5, NO_INDEX, NO_INDEX])
+        self.assertEqual(list(flat.next_siblings),
+                         [2, NO_INDEX, NO_INDEX, 4, 6, NO_INDEX, NO_INDEX])
+        self.assertEqual(flat.text, "1abc")
+        paragraph = flat.view(4)
+        self.assertIsInstance(paragraph, Paragraph)
+        self.assertEqual(paragraph.index, 4)
+        self.assertEqual([child.content for child in paragraph.children], ["b"])
+
+    def test_render(self):
+        document = parse(test_utils.book(num_chapters=3))
+        self.assertEqual(render(FlatDocument.from_document(document)), render(document))
+
+    def test_parse_flat(self):
+        text = test_utils.book(num_chapters=3)
+        document = parse(text)
+        for flat in (parse_flat(text), UsfmParser.create().parse_flat(text)):
+            self.assertEqual(test_utils.structure(flat.to_document()),
+                             test_utils.structure(document))
+            self.assertEqual(test_utils.structure(flat.table_of_contents),
+                             test_utils.structure(document.table_of_contents))
+
+    def test_pickle(self):
+        flat = parse_flat(test_utils.book(num_chapters=3))
+        loaded = pickle.loads(pickle.dumps(flat, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(test_utils.structure(loaded.to_document()),
+                         test_utils.structure(flat.to_document()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,15 @@
+import io
 import itertools
 import unittest
 
 from usfm_utils.elements.document import Document
-from usfm_utils.elements.element_impls import FormattedText, Text, Paragraph, Footnote
+from usfm_utils.elements.element_impls import FormattedText, Text, Paragraph, Footnote, \
+    Heading
 from usfm_utils.elements.footnote_utils import AutomaticFootnoteLabel, CustomFootnoteLabel
+from usfm_utils.elements.paragraph_utils import Centered, LeftAligned
+from usfm_utils.html.html_utils import escape, open_tag
 from usfm_utils.html.html_visitor import HtmlVisitor, non_span_formatting
+from usfm_utils.usfm.parse import parse
 
 from tests import test_utils
 
@@ -93,18 +98,81 @@ class HtmlRenderingTest(unittest.TestCase):
             else:
                 self.assertNotIn("continuation", rendered)
 
+    def test_cached_tags(self):
+        layouts = (LeftAligned(), LeftAligned(LeftAligned.FirstLineIndent.outdent, 2),
+                   Centered())
+        paragraphs = [Paragraph([Text("({})".format(index))], layout=layout, poetic=poetic)
+                      for index, (layout, poetic)
+                      in enumerate(2 * list(itertools.product(layouts, (False, True))))]
+        headings = [Heading(kind, [Text("({})".format(index))], weight=weight)
+                    for index, (kind, weight)
+                    in enumerate(2 * list(itertools.product(Heading.Kind, (1, 2))))]
+        rendered = self.render_elements(*(paragraphs + headings))
+        visitor = HtmlVisitor(HtmlRenderingTest.TestFile())
+        for paragraph in paragraphs:
+            self.assertIn(visitor.paragraph_tag(paragraph) + paragraph.children[0].content,
+                          rendered)
+        for heading in headings:
+            open_tag, close_tag = HtmlVisitor.heading_tags(heading.kind, heading.weight)
+            self.assertIn(open_tag + heading.children[0].content + close_tag, rendered)
+
+    def test_buffering(self):
+        document = parse(test_utils.book(num_chapters=3))
+        expected = self.render(document)
+        for buffer_size in (1, 100, 1 << 30):
+            test_file = HtmlRenderingTest.TestFile()
+            HtmlVisitor(test_file, buffer_size=buffer_size).write(document)
+            self.assertEqual(test_file.content(), expected)
+            if buffer_size > len(expected):
+                self.assertEqual(test_file.writes, 1)
+        output = io.BytesIO()
+        HtmlVisitor(output, encoding="utf-8").write(document)
+        self.assertEqual(output.getvalue(), expected.encode("utf-8"))
+
+    def test_nested_footnotes(self):
+        words = [test_utils.word(allow_empty=False) for _ in range(4)]
+        inner = Footnote(Footnote.Kind.footnote, [Text(words[1])], AutomaticFootnoteLabel())
+        outer = Footnote(Footnote.Kind.cross_reference,
+                         [Text(words[0]), inner, Text(words[2])], AutomaticFootnoteLabel())
+        rendered = self.render_elements(Paragraph([outer, Text(words[3])]))
+        footnotes = rendered[rendered.index(words[3]):]
+        self.assertLess(footnotes.index(words[0]), footnotes.index(words[2]))
+        self.assertLess(footnotes.index(words[2]), footnotes.index(words[1]))
+        self.assertLess(footnotes.index("ref2"), footnotes.index(words[2]))
+
+    def test_escaping(self):
+        self.assertEqual(escape("plain text"), "plain text")
+        self.assertEqual(escape("<a href=\"x\">&</a>"),
+                         "&lt;a href=&quot;x&quot;&gt;&amp;&lt;/a&gt;")
+        label = CustomFootnoteLabel("<*>")
+        document = Document([Paragraph([Text("1 < 2 & \"3\" > 0"),
+                                        Footnote(Footnote.Kind.footnote, [Text("a&b")], label)])],
+                            heading="<Title>")
+        test_file = HtmlRenderingTest.TestFile()
+        HtmlVisitor(test_file, stylesheets=["a\"b.css"]).write(document)
+        rendered = test_file.content()
+        self.assertIn("1 &lt; 2 &amp; &quot;3&quot; &gt; 0", rendered)
+        self.assertIn(">&lt;*&gt;</a>", rendered)
+        self.assertIn("a&amp;b", rendered)
+        self.assertIn("<title>&lt;Title&gt;</title>", rendered)
+        self.assertIn("href=\"a&quot;b.css\"", rendered)
+        self.assertEqual(open_tag("span", title="\"&\""),
+                         "<span title=\"&quot;&amp;&quot;\">")
+
     class TestFile(object):
         """
         A file-like string object used for mocking text files
         """
         def __init__(self):
             self._content = ""
+            self.writes = 0
 
         def content(self):
             return self._content
 
         def write(self, p_str):
             self._content += p_str
+            self.writes += 1
 
 
 if __name__ == "__main__":
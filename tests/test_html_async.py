@@ -0,0 +1,199 @@
+import asyncio
+import io
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tests import test_utils
+from usfm_utils.html.html_async import write_async, write_document_async, \
+    write_html_async
+from usfm_utils.html.html_stream import write_html_stream
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import parse
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class ListWriter(object):
+    """
+    A StreamWriter-like object collecting chunks, whose drain waits for drained
+    (if set), and fails once more than fail_after chunks are written (if set)
+    """
+    def __init__(self, drained=None, fail_after=None):
+        self.chunks = []
+        self._drained = drained
+        self._fail_after = fail_after
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+
+    async def drain(self):
+        if self._fail_after is not None and len(self.chunks) > self._fail_after:
+            raise ConnectionResetError()
+        if self._drained is not None:
+            await self._drained.wait()
+
+
+class Server(object):
+    """
+    An in-process HTTP-like server, answering a request line naming a seed with
+    the HTML of the book generated from that seed
+    """
+    def __init__(self, texts, executor=None):
+        self._texts = texts
+        self._executor = executor
+        self._server = None
+        self.port = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        seed = int((await reader.readline()).decode("ascii"))
+        try:
+            await write_html_async(self._texts[seed], writer, executor=self._executor)
+        finally:
+            writer.close()
+
+    async def fetch(self, client, seed, events):
+        """
+        Appends (event, client, time) to events: "start" on connecting, "first"
+        once the first bytes of the response are received, and "end" once it is
+        complete
+        :return: the response
+        """
+        events.append(("start", client, time.perf_counter()))
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write("{}\n".format(seed).encode("ascii"))
+        chunks = [await reader.read(1 << 16)]
+        events.append(("first", client, time.perf_counter()))
+        while chunks[-1]:
+            chunks.append(await reader.read(1 << 16))
+        events.append(("end", client, time.perf_counter()))
+        writer.close()
+        return b"".join(chunks)
+
+
+async def serve_concurrently(texts, num_clients, executor=None, server_class=Server):
+    """
+    Fetches texts num_clients times at once from a Server, while a ticker task
+    appends ("tick", None, time) to the events every millisecond, whenever the
+    event loop lets it run
+    :return: responses of the clients, and the events in order (see Server.fetch)
+    """
+    server = server_class(texts, executor=executor)
+    await server.start()
+    events = []
+    done = asyncio.Event()
+
+    async def tick():
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            events.append(("tick", None, time.perf_counter()))
+
+    ticker = asyncio.ensure_future(tick())
+    try:
+        responses = await asyncio.gather(*[server.fetch(i, i % len(texts), events)
+                                           for i in range(num_clients)])
+    finally:
+        done.set()
+        await ticker
+        await server.stop()
+    return responses, events
+
+
+class HtmlAsyncTests(unittest.TestCase):
+    longMessage = True
+
+    def test_server(self):
+        texts = [test_utils.book(num_chapters=10, verses_per_chapter=10, seed=seed)
+                 for seed in range(4)]
+        num_clients = 8
+        expected = []
+        start = time.perf_counter()
+        for i in range(num_clients):
+            output = io.BytesIO()
+            write_html_stream(texts[i % len(texts)], output, encoding="utf-8")
+            expected.append(output.getvalue())
+        blocking = time.perf_counter() - start
+        executor = ThreadPoolExecutor(4)
+        start = time.perf_counter()
+        try:
+            responses, events = run(serve_concurrently(texts, num_clients=num_clients,
+                                                       executor=executor))
+        finally:
+            executor.shutdown()
+        elapsed = time.perf_counter() - start
+        for i, response in enumerate(responses):
+            self.assertEqual(response, expected[i], i)
+        kinds = [kind for kind, _, _ in events]
+        # with more clients than threads, responses still take turns: each client
+        # gets its first bytes before any response is complete
+        last_first = len(kinds) - 1 - kinds[::-1].index("first")
+        first_end = kinds.index("end")
+        self.assertLess(last_first, first_end, events)
+        # the event loop keeps running while they are rendered
+        self.assertIn("tick", kinds[kinds.index("first"):first_end])
+        # and taking turns costs little throughput (a generous bound, to be
+        # robust to loaded machines)
+        self.assertLess(elapsed, 5 * blocking + 1.0)
+
+    def test_document(self):
+        document = parse(test_utils.book(num_chapters=3, seed=1))
+        output = io.BytesIO()
+        HtmlVisitor(output, encoding="utf-8").write(document)
+        writer = ListWriter()
+        run(write_document_async(document, writer, buffer_size=256))
+        self.assertGreater(len(writer.chunks), 1)
+        self.assertEqual(b"".join(writer.chunks), output.getvalue())
+
+    def test_backpressure(self):
+        produced = []
+
+        def chunks():
+            for i in range(100):
+                produced.append(i)
+                yield b"x"
+
+        async def check():
+            drained = asyncio.Event()
+            writer = ListWriter(drained)
+            writing = asyncio.ensure_future(write_async(chunks(), writer))
+            await asyncio.sleep(0.05)
+            # the chunk being drained, and the next one
+            self.assertEqual(len(writer.chunks), 1)
+            self.assertEqual(len(produced), 2)
+            drained.set()
+            await writing
+            self.assertEqual(len(writer.chunks), 100)
+
+        run(check())
+
+    def test_disconnected(self):
+        produced = []
+
+        def chunks():
+            for i in range(100):
+                produced.append(i)
+                yield b"x"
+
+        writer = ListWriter(fail_after=3)
+        with self.assertRaises(ConnectionResetError):
+            run(write_async(chunks(), writer))
+        self.assertEqual(len(writer.chunks), 4)
+        self.assertLessEqual(len(produced), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests import test_utils
+from usfm_utils.html.html_pages import INDEX_FILENAME, split_chapters, write_pages
+from usfm_utils.html.html_stream import write_html_stream
+from usfm_utils.usfm.parse import parse
+
+BODY = "<body>\n        "
+FOOTER = "</body></html>"
+
+
+def body(html):
+    return html[html.index(BODY) + len(BODY):html.rindex(FOOTER)]
+
+
+def read(path):
+    with io.open(path, encoding="utf-8") as html_file:
+        return html_file.read()
+
+
+class HtmlPagesTests(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.text = test_utils.book(num_chapters=6, verses_per_chapter=8, seed=4)
+        self.document = parse(self.text)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, workers):
+        directory = os.path.join(self.directory, str(workers))
+        os.mkdir(directory)
+        return write_pages(self.document, directory, workers=workers)
+
+    def test_split(self):
+        text = "\\h Book\n\\mt1 Title\n\\c 1\n\\p\n\\v 1 one \\f + \\ft a\\f* \\f + \\ft b\\f*\n" \
+               "\\c 2\n\\p\n\\v 1 two\n\\c 3\n\\p\n\\v 1 three \\f + \\ft c\\f*\n"
+        pages = split_chapters(parse(text))
+        self.assertEqual([page.chapter for page in pages], [None, "1", "2", "3"])
+        self.assertEqual([page.first_footnote_id for page in pages], [1, 1, 3, 3])
+        self.assertEqual(pages[1].filename, "chapter_1.html")
+        self.assertEqual(pages[1].title("Book"), "Book 1")
+        pages = split_chapters(parse("\\c 1\n\\p\n\\v 1 one\n"))
+        self.assertEqual([page.chapter for page in pages], ["1"])
+        self.assertEqual(pages[0].filename, "chapter_1.html")
+        self.assertEqual(pages[0].title(None), "1")
+
+    def test_chapter_labels(self):
+        # labels are shown, but do not name files
+        text = "\\c 1\n\\cl 1/2\n\\p\n\\v 1 one\n\\c 2\n\\cl ../../x\n\\p\n\\v 1 two\n" \
+               "\\c 3\n\\cl 1/2\n\\p\n\\v 1 three\n"
+        document = parse(text)
+        pages = split_chapters(document)
+        self.assertEqual([page.chapter for page in pages], ["1/2", "../../x", "1/2"])
+        self.assertEqual([page.filename for page in pages],
+                         ["chapter_1.html", "chapter_2.html", "chapter_3.html"])
+        self.assertEqual(pages[0].title(None), "1/2")
+        paths = write_pages(document, self.directory, workers=1)
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         sorted(os.path.basename(path) for path in paths))
+        self.assertIn(">../../x</a>", read(paths[-1]))
+        self.assertIn("<title>1/2</title>", read(paths[0]))
+        self.assertIn("<title></title>", read(paths[-1]))
+
+    def test_parallel(self):
+        serial = self.write(workers=1)
+        parallel = self.write(workers=2)
+        self.assertEqual([os.path.basename(path) for path in parallel],
+                         [os.path.basename(path) for path in serial])
+        self.assertEqual(len(serial), 8)
+        for serial_path, parallel_path in zip(serial, parallel):
+            self.assertEqual(read(parallel_path), read(serial_path), parallel_path)
+
+    def test_serial_render(self):
+        # the pages hold the same HTML as a serial render writing footnotes after
+        # each chapter
+        output = io.StringIO()
+        write_html_stream(self.text, output)
+        paths = self.write(workers=2)
+        self.assertEqual("".join(body(read(path)) for path in paths[:-1]),
+                         body(output.getvalue()))
+
+    def test_index(self):
+        paths = self.write(workers=1)
+        self.assertEqual(os.path.basename(paths[-1]), INDEX_FILENAME)
+        index = read(paths[-1])
+        toc = self.document.table_of_contents
+        self.assertIn(toc.long_description, index)
+        for path in paths[:-1]:
+            self.assertIn("href=\"{}\"".format(os.path.basename(path)), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import io
+import unittest
+
+from usfm_utils.elements.element_impls import ChapterNumber
+from usfm_utils.html.html_stream import HtmlStreamWriter, write_html_stream
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.usfm.parse import UsfmParser, parse
+
+from tests import test_utils
+
+
+class HtmlStreamTest(unittest.TestCase):
+
+    @staticmethod
+    def render(text):
+        output = io.StringIO()
+        HtmlVisitor(output).write(parse(text))
+        return output.getvalue()
+
+    def test_footnotes_at_end(self):
+        text = test_utils.book(num_chapters=4, verses_per_chapter=6, seed=1)
+        output = io.StringIO()
+        write_html_stream(text, output, footnotes=HtmlStreamWriter.Footnotes.at_end)
+        self.assertEqual(output.getvalue(), self.render(text))
+
+    def test_footnotes_per_chapter(self):
+        text = "\\c 1\n\\p\n\\v 1 first \\f + \\ft one\\f*\n" \
+               "\\c 2\n\\p\n\\v 1 second \\f + \\ft two\\f*\n"
+        output = io.StringIO()
+        write_html_stream(text, output)
+        rendered = output.getvalue()
+        self.assertLess(rendered.index("one"), rendered.index("second"))
+        self.assertLess(rendered.index("second"), rendered.index("two"))
+        self.assertEqual(rendered.count("</html>"), 1)
+        # footnotes are numbered throughout the document
+        self.assertIn('href="#fn1"', rendered)
+        self.assertIn('href="#fn2"', rendered)
+
+    def test_chapters_written_as_parsed(self):
+        text = test_utils.book(num_chapters=3, verses_per_chapter=5, seed=2)
+        output = io.StringIO()
+        writer = HtmlStreamWriter(output)
+        chapters = 0
+        for element in UsfmParser.create().iter_elements(text):
+            writer.add(element)
+            written = output.getvalue()
+            self.assertTrue(written.startswith("<!DOCTYPE html>"))
+            if isinstance(element, ChapterNumber):
+                chapters += 1
+                # the previous chapter has been written out in full
+                if chapters > 1:
+                    self.assertIn('"chapter_no">{}<'.format(chapters - 1), written)
+                self.assertNotIn('"chapter_no">{}<'.format(chapters), written)
+        writer.finish()
+        self.assertEqual(chapters, 3)
+        self.assertTrue(output.getvalue().rstrip().endswith("</html>"))
+
+    def test_heading(self):
+        text = "\\id GEN\n\\h Genesis\n\\c 1\n\\p\n\\v 1 In the beginning\n"
+        output = io.StringIO()
+        write_html_stream(text, output, footnotes=HtmlStreamWriter.Footnotes.at_end)
+        self.assertIn("<title>Genesis</title>", output.getvalue())
+        self.assertEqual(output.getvalue(), self.render(text))
+
+    def test_empty(self):
+        output = io.StringIO()
+        write_html_stream("", output)
+        self.assertIn("</html>", output.getvalue())
+
+    def test_encoding(self):
+        text = test_utils.book(num_chapters=2, verses_per_chapter=3, seed=3)
+        output = io.BytesIO()
+        write_html_stream(text, output, encoding="utf-8",
+                          footnotes=HtmlStreamWriter.Footnotes.at_end)
+        self.assertEqual(output.getvalue().decode("utf-8"), self.render(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+from __future__ import unicode_literals
+
+import random
+import unittest
+
+from tests import test_utils
+from usfm_utils.usfm.incremental import Edit, IncrementalParser, Segments
+from usfm_utils.usfm.parse import parse
+from usfm_utils.usfm.usfm_error import UsfmInputError
+
+
+class IncrementalParserTests(unittest.TestCase):
+    longMessage = True
+
+    parser = IncrementalParser()
+
+    def assert_reparse(self, text, edit, document=None):
+        """
+        :return: the reparsed document, after checking it against a full parse
+        """
+        if document is None:
+            document = parse(text)
+        reparsed = self.parser.reparse(document, text, edit)
+        self.assertEqual(test_utils.structure(reparsed),
+                         test_utils.structure(parse(edit.apply(text))),
+                         repr(edit.apply(text)))
+        return reparsed
+
+    @staticmethod
+    def replace(text, old, new):
+        return Edit(text.index(old), len(old), new)
+
+    def test_edit(self):
+        text = "\\id GEN\n\\c 1\n\\p\n\\v 1 a\n\\c 2\n\\p\n\\v 1 b\n\\c 3\n\\p\n\\v 1 c\n"
+        document = parse(text)
+        reparsed = self.assert_reparse(text, self.replace(text, "b", "bb"), document)
+        # elements of the other chapters are reused
+        self.assertIs(reparsed.elements[0], document.elements[0])
+        self.assertIs(reparsed.elements[-1], document.elements[-1])
+
+    def test_chapter_markers(self):
+        text = "\\id GEN\n\\c 1\n\\p\n\\v 1 a\n\\c 2\n\\p\n\\v 1 b\n"
+        self.assert_reparse(text, self.replace(text, "\\c 2\n", ""))
+        self.assert_reparse(text, self.replace(text, "\\v 1 a\n", "\\v 1 a\n\\c 5\n\\p\n"))
+        self.assert_reparse(text, Edit(len(text), 0, "\\c 3\n\\p\n\\v 1 c\n"))
+        self.assert_reparse(text, Edit(0, 0, "\\h Genesis\n"))
+
+    def test_chapter_label(self):
+        text = "\\id PSA\n\\cl Psalm\n\\c 1\n\\q1\n\\v 1 a\n\\c 2\n\\q1\n\\v 1 b\n" \
+               "\\c 3\n\\cl Third\n\\q1\n\\v 1 c\n"
+        self.assert_reparse(text, self.replace(text, "Psalm", "Song"))
+        self.assert_reparse(text, self.replace(text, "\\cl Psalm\n", ""))
+        self.assert_reparse(text, self.replace(text, "\\c 2\n", "\\cl Song\n\\c 2\n"))
+        self.assert_reparse(text, self.replace(text, "Third", "3"))
+
+    def test_no_break(self):
+        text = "\\id GEN\n\\c 1\n\\q1\n\\v 1 a\n\\c 2\n\\nb\n\\v 1 b\n\\c 3\n\\nb\n\\v 1 c\n"
+        self.assert_reparse(text, self.replace(text, "\\q1", "\\p"))
+        self.assert_reparse(text, self.replace(text, "\\q1", "\\pm"))
+        self.assert_reparse(text, self.replace(text, "\\q1\n", ""))
+        self.assert_reparse(text, self.replace(text, "\\v 1 b", "\\v 1 b \\pi2 d"))
+
+    def test_table_of_contents(self):
+        text = "\\id GEN\n\\h Genesis\n\\toc1 Long\n\\c 1\n\\p\n\\v 1 a\n\\c 2\n\\p\n\\v 1 b\n"
+        self.assert_reparse(text, self.replace(text, "Long", "Longer"))
+        self.assert_reparse(text, self.replace(text, "\\v 1 b", "\\v 1 bb"))
+        self.assert_reparse(text, self.replace(text, "\\v 1 b", "\\v 1 b\n\\toc2 Short"))
+        self.assert_reparse(text, self.replace(text, "\\h Genesis\n", ""))
+
+    def test_error(self):
+        text = "\\id GEN\n\\c 1\n\\p\n\\v 1 a\n\\c 2\n\\p\n\\v 1 b\n"
+        document = parse(text)
+        edit = self.replace(text, "\\v 1 b", "\\v")
+        with self.assertRaises(UsfmInputError) as context:
+            self.parser.reparse(document, text, edit)
+        # the error refers to the whole source
+        self.assertEqual(context.exception.position.line, 7)
+
+    def test_random_edits(self):
+        random.seed(3)
+        text = test_utils.book(num_chapters=4, verses_per_chapter=8)
+        document = parse(text)
+        insertions = ["a", " ", "\n", "\\nb\n", "\\q2 ", "\\p\n", "\\c 9\n",
+                      "\\cl Psalm\n", "\\toc2 Short\n", "\\f + \\ft"]
+        for _ in range(200):
+            offset = random.randrange(len(text))
+            if random.random() < 0.6:
+                edit = Edit(offset, 0, random.choice(insertions))
+            else:
+                edit = Edit(offset, random.randint(1, 20), random.choice(["", "b"]))
+            new_text = edit.apply(text)
+            try:
+                expected = parse(new_text)
+            except UsfmInputError:
+                self.assertRaises(UsfmInputError, self.parser.reparse, document, text, edit)
+                continue
+            reparsed = self.parser.reparse(document, text, edit)
+            self.assertEqual(test_utils.structure(reparsed), test_utils.structure(expected),
+                             repr(new_text))
+            self.assert_segments(new_text)
+            text, document = new_text, reparsed
+
+    def assert_segments(self, text):
+        """
+        Checks the segments kept by the parser, if any, against a scan of text
+        """
+        segments = self.parser._segments
+        if segments is None:
+            return
+        expected = Segments.scan(text)
+        self.assertEqual(segments.offsets, expected.offsets, repr(text))
+        self.assertEqual(segments.states, expected.states, repr(text))
+        self.assertEqual(segments.headers, expected.headers, repr(text))
+
+    def test_segments_kept(self):
+        text = "\\id GEN\n\\h Genesis\n\\c 1\n\\p\n\\v 1 a\n\\c 2\n\\p\n\\v 1 b\n"
+        parser = IncrementalParser()
+        document = parse(text)
+        for old, new in (("b", "bb"), ("\\v 1 a", "\\v 1 a\n\\c 3\n\\q\n\\v 1 c"), ("a", "")):
+            edit = self.replace(text, old, new)
+            document = parser.reparse(document, text, edit)
+            text = edit.apply(text)
+            self.assertEqual(test_utils.structure(document), test_utils.structure(parse(text)))
+            self.assertIsNotNone(parser._segments)
+            self.assertEqual(parser._segments.offsets, Segments.scan(text).offsets)
+            self.assertEqual(parser._segments.states, Segments.scan(text).states)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests import test_utils
+from usfm_utils.elements.element_impls import FormattedText
+from usfm_utils.usfm.index import IndexedBook, VerseIndex, index_path, parse_reference
+from usfm_utils.usfm.parse import parse
+
+
+class VerseIndexTests(unittest.TestCase):
+    longMessage = True
+
+    text = "\n".join([
+        "\\id JHN test",
+        "\\toc1 John",
+        "\\h John",
+        "\\c 3",
+        "\\s Heading",
+        "\\p",
+        "\\v 15 a",
+        "\\q1",
+        "\\v 16 b \\f + \\ft note\\f*",
+        "\\v 17-18 c",
+        "\\p",
+        "\\v 19 d",
+        "\\v 20 e",
+        "\\c 4",
+        "\\v 1 f",
+        ""
+    ])
+
+    @staticmethod
+    def verse_numbers(elements):
+        numbers = []
+        for element in elements:
+            if isinstance(element, FormattedText) and \
+                    element.kind == FormattedText.Kind.verse_no:
+                numbers.append(element.children[0].content)
+            elif hasattr(element, "children"):
+                numbers.extend(VerseIndexTests.verse_numbers(element.children))
+        return numbers
+
+    def assert_excerpt(self, reference, expected, text=None):
+        text = self.text if text is None else text
+        index = VerseIndex.build(text)
+        _, chapter, first, last = parse_reference(reference)
+        excerpt = index.excerpt(text, chapter, first, last)
+        self.assertEqual(excerpt, expected, reference)
+        book = IndexedBook(text, index)
+        self.assertEqual(test_utils.structure(book.parse_passage(reference)),
+                         test_utils.structure(parse(expected)), reference)
+
+    def test_build(self):
+        index = VerseIndex.build(self.text)
+        self.assertEqual(index.book, "JHN")
+        self.assertEqual(index.chapters(), [3, 4])
+        self.assertEqual(index.verses(3), [(15, 15), (16, 16), (17, 18), (19, 19), (20, 20)])
+        self.assertEqual(index.verses(4), [(1, 1)])
+        self.assertEqual(list(index.header_offsets), [0, 13])
+
+    def test_passages(self):
+        header = "\\id JHN test\n\\toc1 John\n"
+        self.assert_excerpt("JHN 3:16-18",
+                            header + "\\q1\n\\v 16 b \\f + \\ft note\\f*\n\\v 17-18 c\n")
+        self.assert_excerpt("JHN 3:17", header + "\\q1\n\\v 17-18 c\n")
+        self.assert_excerpt("JHN 3:20", header + "\\p\n\\v 20 e\n")
+        self.assert_excerpt("JHN 4:1", header + "\\c 4\n\\v 1 f\n")
+        self.assert_excerpt("JHN 4", header + "\\c 4\n\\v 1 f\n")
+
+    def test_open_character_markers(self):
+        text = "\\id JHN test\n\\c 3\n\\p\n\\v 15 a \\wj b\n\\v 16 \\add c\\add* d\n" \
+               "\\v 17 e\\wj* f\n"
+        parse(text)
+        header = "\\id JHN test\n"
+        self.assert_excerpt("JHN 3:16", header + "\\p\n\\v 16 \\wj \\add c\\add* d\\wj*\n",
+                            text=text)
+        self.assert_excerpt("JHN 3:17", header + "\\p\n\\v 17 \\wj e\\wj* f\n", text=text)
+        self.assert_excerpt("JHN 3:15-16", header + "\\p\n\\v 15 a \\wj b\n"
+                                                    "\\v 16 \\add c\\add* d\\wj*\n", text=text)
+        self.assert_excerpt("JHN 3:16-17", header + "\\p\n\\v 16 \\wj \\add c\\add* d\n"
+                                                    "\\v 17 e\\wj* f\n", text=text)
+
+    def test_trailing_headings(self):
+        text = "\\id JHN test\n\\c 3\n\\p\n\\v 15 a\n\\s Heading\n\\p\n\\v 16 b\n" \
+               "\\ms Major\n\\s Section\n\\sp Speaker\n\\c 4\n\\p\n\\v 1 c\n"
+        parse(text)
+        header = "\\id JHN test\n"
+        self.assert_excerpt("JHN 3:15", header + "\\p\n\\v 15 a\n", text=text)
+        self.assert_excerpt("JHN 3:15-16", header + "\\p\n\\v 15 a\n\\s Heading\n\\p\n"
+                                                    "\\v 16 b\n", text=text)
+        self.assert_excerpt("JHN 3:16", header + "\\p\n\\v 16 b\n", text=text)
+
+    def test_table_of_contents(self):
+        book = IndexedBook(self.text, VerseIndex.build(self.text))
+        document = book.parse_passage("JHN 3:19")
+        self.assertEqual(document.table_of_contents.long_description, "John")
+
+    def test_missing(self):
+        book = IndexedBook(self.text, VerseIndex.build(self.text))
+        self.assertRaises(KeyError, book.parse_passage, "JHN 5:1")
+        self.assertRaises(KeyError, book.parse_passage, "JHN 3:21")
+        self.assertRaises(KeyError, book.parse_passage, "GEN 3:16")
+        self.assertRaises(ValueError, book.parse_passage, "JHN three")
+
+    def test_book(self):
+        text = test_utils.book(num_chapters=4, verses_per_chapter=15)
+        book = IndexedBook(text, VerseIndex.build(text))
+        self.assertEqual(book.index.chapters(), [1, 2, 3, 4])
+        for chapter in range(1, 5):
+            for verse in range(1, 16):
+                reference = "GEN {}:{}".format(chapter, verse)
+                document = book.parse_passage(reference)
+                self.assertEqual(self.verse_numbers(document.elements), [str(verse)],
+                                 reference)
+            document = book.parse_passage("GEN {}:3-5".format(chapter))
+            self.assertEqual(self.verse_numbers(document.elements), ["3", "4", "5"])
+            document = book.parse_passage("GEN {}".format(chapter))
+            self.assertEqual(self.verse_numbers(document.elements),
+                             [str(verse) for verse in range(1, 16)])
+
+    def test_dumps(self):
+        index = VerseIndex.build(test_utils.book(num_chapters=3))
+        loaded = VerseIndex.loads(index.dumps())
+        self.assertEqual(loaded.digest, index.digest)
+        self.assertEqual(loaded.book, index.book)
+        for name in VerseIndex.FIELDS:
+            self.assertEqual(getattr(loaded, name), getattr(index, name), name)
+        self.assertRaises(ValueError, VerseIndex.loads, b"not an index")
+        self.assertRaises(ValueError, VerseIndex.loads, index.dumps()[:-1])
+
+    def test_saved_next_to_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "book.usfm")
+            with io.open(path, "w", encoding="utf-8") as usfm_file:
+                usfm_file.write(self.text)
+            IndexedBook.open(path)
+            self.assertTrue(os.path.exists(index_path(path)))
+            saved = VerseIndex.load(index_path(path))
+            self.assertEqual(IndexedBook.open(path).index.digest, saved.digest)
+
+            # a changed file is prescanned again
+            with io.open(path, "w", encoding="utf-8") as usfm_file:
+                usfm_file.write(self.text.replace("\\v 20 e", "\\v 20 e\n\\v 21 g"))
+            book = IndexedBook.open(path)
+            self.assertNotEqual(book.index.digest, saved.digest)
+            self.assertEqual(VerseIndex.load(index_path(path)).digest, book.index.digest)
+            self.assertEqual(self.verse_numbers(book.parse_passage("JHN 3:21").elements),
+                             ["21"])
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
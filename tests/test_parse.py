@@ -15,7 +15,8 @@ from usfm_utils.usfm.flags import paragraphs, indented_paragraphs, \
     lower_open_closes, higher_open_closes, headings, higher_rest_of_lines, \
     lower_until_next_flags, whitespace, footnotes
 from usfm_utils.usfm.lex import UsfmLexer
-from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.parse import ParseContext, UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
 from usfm_utils.usfm.usfm_error import UsfmInputError
 
 
@@ -45,6 +46,21 @@ class UsfmParserTests(unittest.TestCase):
         self.assertIsInstance(verse, FormattedText)
         self.assertIn("5", verse.children[0].content)
 
+    def test_dollar_sign(self):
+        document = self.parse(r"\p costs $5 \bd or $6\bd*")
+        paragraph = document.elements[0]
+        self.assertIsInstance(paragraph, Paragraph)
+        self.assertEqual(paragraph.children[0].content.strip(), "costs $5")
+        self.assertEqual(paragraph.children[1].children[0].content, "or $6")
+
+    def test_unterminated_last_line(self):
+        word = test_utils.word(allow_empty=False)
+        document = self.parse(r"\p hello", r"\s2 {w} \bd".format(w=word))
+        heading = document.elements[1]
+        self.assertIsInstance(heading, Heading)
+        self.assertEqual(heading.weight, 2)
+        self.assertEqual(heading.children[0].content, r"{w} \bd".format(w=word))
+
     # test chapter labels
 
     def test_chapter_label_before(self):
@@ -325,6 +341,172 @@ class UsfmParserTests(unittest.TestCase):
             )
             self.assert_raises_at(lines, line_no=2, col=len(word) + 2)
 
+    def test_untracked_positions(self):
+        parser = UsfmParser.create(track_positions=False)
+        document = parser.parse_text(r"\p {}".format(test_utils.word()))
+        self.assertEqual(len(document.elements), 1)
+        try:
+            parser.parse_text("\\p\n\\bd hello")
+            self.fail()
+        except UsfmInputError as e:
+            self.assertIsNotNone(e.message)
+            self.assertIsNone(e.position)
+
+    def test_positions(self):
+        lines = (
+            r"\p",
+            r"\v 1 {}".format(test_utils.word()),
+            r"{} \bd hello \bd*".format(test_utils.word())
+        )
+        self.lexer.input("\n".join(lines))
+        token = self.lexer.token()
+        positions = []
+        while token.type != "EOF":
+            positions.append((token.type, token.position.line, token.position.col))
+            token = self.lexer.token()
+        bold_col = len(lines[2]) - len(r"\bd hello \bd*") + 1
+        self.assertIn(("PARAGRAPH", 1, 1), positions)
+        self.assertIn(("VERSE", 2, 1), positions)
+        self.assertIn(("OPEN_BOLD", 3, bold_col), positions)
+        self.assertIn(("CLOSE_BOLD", 3, len(lines[2]) - len(r"\bd*") + 1), positions)
+
+    def test_recovery(self):
+        word = test_utils.word(allow_empty=False)
+        text = "\n".join((
+            r"\p {w} \bd* {w}".format(w=word),
+            r"\p {w}".format(w=word),
+            r"\zzz {w}".format(w=word),
+            r"\c 2",
+            r"\q1 {w} \it {w}".format(w=word)
+        ))
+        for lexer_class in (UsfmLexer, UsfmScanner):
+            parser = UsfmParser.create(lexer_class=lexer_class)
+            document, errors = parser.parse_text_with_errors(text)
+            self.assertEqual([(e.position.line, e.position.col) for e in errors],
+                             [(1, len(word) + 5), (3, 1), (6, 1)])
+            self.assertIn("Unrecognized", errors[1].message)
+            elements = document.elements
+            self.assertEqual([type(element) for element in elements],
+                             [Paragraph, ChapterNumber])
+            self.assertEqual(elements[0].children[0].content.strip(), word)
+            self.assertEqual(elements[0].children[1].content.strip(), word)
+
+    def test_recovery_without_errors(self):
+        text = test_utils.book(num_chapters=2)
+        document, errors = UsfmParser.create().parse_text_with_errors(text)
+        self.assertEqual(errors, [])
+        self.assertEqual(test_utils.structure(document),
+                         test_utils.structure(UsfmParser.create().parse_text(text)))
+
+    def test_recovery_footnote_label(self):
+        text = "\\p a \\f \\ft b\\f*\n\\p c"
+        document, errors = UsfmParser.create().parse_text_with_errors(text)
+        self.assertEqual(errors[0].message, "Expected a footnote label")
+        self.assertIsInstance(document.elements[-1], Paragraph)
+
+    def test_recovery_before_first_element(self):
+        for text in ("\\bogus hi\n\\p a", "\\f + x\\f*\n\\c 1\n\\p a"):
+            for lexer_class in (UsfmLexer, UsfmScanner):
+                parser = UsfmParser.create(lexer_class=lexer_class)
+                document, errors = parser.parse_text_with_errors(text)
+                self.assertEqual(errors[0].position.line, 1, text)
+                self.assertIsInstance(document.elements[-1], Paragraph, text)
+        _, errors = UsfmParser.create().parse_text_with_errors("\\f + x\\f*")
+        self.assertEqual([error.message for error in errors],
+                         ["Unexpected token of type OPEN_FOOTNOTE"])
+
+    def test_recovery_end_of_input(self):
+        for text in ("\\p a \\f ", "\\p a \\f + \\ft b", "\\c 1\n\\p a \\bd b"):
+            for lexer_class in (UsfmLexer, UsfmScanner):
+                parser = UsfmParser.create(lexer_class=lexer_class)
+                document, errors = parser.parse_text_with_errors(text)
+                self.assertIsInstance(document, Document, text)
+                self.assertEqual(len(errors), 1, text)
+                self.assertIsInstance(errors[0], UsfmInputError, text)
+
+    def test_recovery_without_eof_token(self):
+        # the parse is completed even if the input ends where EOF is expected
+        lexer = UsfmLexer.create()
+        lexer.input("\\p a \\bd b")
+        errors = []
+
+        def token_func():
+            token = lexer.token()
+            return None if token is None or token.type == "EOF" else token
+        document = UsfmParser.driver().parse(token_func, errors.append, ParseContext(),
+                                             recover_to="higher_elements")
+        self.assertIsInstance(document, Document)
+        self.assertEqual(errors, [None])
+
+    def test_validate(self):
+        text = test_utils.book(num_chapters=3, verses_per_chapter=5)
+        report = UsfmParser.create().validate(text)
+        self.assertTrue(report.valid)
+        self.assertEqual(report.chapters, 3)
+        self.assertEqual(report.verses, 15)
+        self.assertEqual(report.footnotes, text.count("\\f ") + text.count("\\x "))
+        self.assertGreater(report.paragraphs, 0)
+        self.assertEqual(report.count("CHAPTER", "VERSE"), 18)
+
+    def test_validate_errors(self):
+        text = "\n".join((r"\p a \bd* b", r"\p c", r"\zzz d", r"\c 2", r"\q1 e \it f"))
+        for lexer_class in (UsfmLexer, UsfmScanner):
+            parser = UsfmParser.create(lexer_class=lexer_class)
+            report = parser.validate(text)
+            _, errors = parser.parse_text_with_errors(text)
+            self.assertFalse(report.valid)
+            self.assertEqual([str(error) for error in report.errors],
+                             [str(error) for error in errors])
+            self.assertEqual(report.chapters, 1)
+
+    def test_validate_invalid_first_token(self):
+        for text in ("\\bogus hi", "\\f + x\\f*", "\\f + x\\f*\n\\c 1\n\\p a"):
+            for lexer_class in (UsfmLexer, UsfmScanner):
+                parser = UsfmParser.create(lexer_class=lexer_class)
+                report = parser.validate(text)
+                _, errors = parser.parse_text_with_errors(text)
+                self.assertFalse(report.valid, text)
+                self.assertEqual([str(error) for error in report.errors],
+                                 [str(error) for error in errors], text)
+                self.assertEqual(report.errors[0].position.line, 1, text)
+
+    def test_validate_end_of_input(self):
+        for text in ("\\p a \\f ", "\\p a \\f + \\ft b"):
+            for lexer_class in (UsfmLexer, UsfmScanner):
+                parser = UsfmParser.create(lexer_class=lexer_class)
+                report = parser.validate(text)
+                _, errors = parser.parse_text_with_errors(text)
+                self.assertFalse(report.valid, text)
+                self.assertEqual([str(error) for error in report.errors],
+                                 [str(error) for error in errors], text)
+
+    def test_iter_elements(self):
+        text = test_utils.book(num_chapters=4)
+        parser = UsfmParser.create()
+        expected = parser.parse_text(text)
+        stream = parser.iter_elements(text)
+        self.assertIsNone(stream.table_of_contents)
+        elements = list(stream)
+        self.assertEqual(len(elements), len(expected.elements))
+        for element, expected_element in zip(elements, expected.elements):
+            self.assertEqual(test_utils.structure(element),
+                             test_utils.structure(expected_element))
+        self.assertEqual(stream.heading, expected.heading)
+        self.assertEqual(test_utils.structure(stream.table_of_contents),
+                         test_utils.structure(expected.table_of_contents))
+
+    def test_iter_elements_incremental(self):
+        text = test_utils.book(num_chapters=2)
+        stream = UsfmParser.create().iter_elements(text)
+        iterator = iter(stream)
+        self.assertIsInstance(next(iterator), Element)
+        # the rest of the source has not been consumed yet
+        self.assertIsNone(stream.table_of_contents)
+
+    def test_iter_elements_error(self):
+        stream = UsfmParser.create().iter_elements("\\p {}\\bd*".format(test_utils.word()))
+        self.assertRaises(UsfmInputError, list, stream)
+
     # helper function
 
     def assert_raises_at(self, lines, line_no, col=None):
@@ -0,0 +1,109 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from tests import test_utils
+from usfm_utils.elements.footnote_utils import CustomFootnoteLabel
+from usfm_utils.usfm.flags import paragraphs, indented_paragraphs, \
+    lower_open_closes, headings, higher_rest_of_lines, lower_until_next_flags, \
+    whitespace, footnotes
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+from usfm_utils.usfm.tokens import Token
+from usfm_utils.usfm.usfm_error import UsfmInputError
+
+
+class UsfmScannerTests(unittest.TestCase):
+    longMessage = True
+
+    lexer = UsfmLexer.create()
+    scanner = UsfmScanner.create()
+
+    @staticmethod
+    def describe(token):
+        value = token.value
+        if isinstance(value, CustomFootnoteLabel):
+            value = value.content
+        elif not isinstance(value, (str, type(None))):
+            value = type(value)
+        position = token.position
+        return token.type, value, token.number, position.line, position.col
+
+    @staticmethod
+    def tokens(lexer, text):
+        lexer.input(text)
+        result = []
+        try:
+            token = lexer.token()
+            while token is not None:
+                result.append(UsfmScannerTests.describe(token))
+                token = lexer.token()
+        except UsfmInputError as e:
+            result.append((e.message, e.position.line, e.position.col))
+        return result
+
+    def assert_same_tokens(self, text):
+        expected = self.tokens(self.lexer, text)
+        self.assertEqual(self.tokens(self.scanner, text), expected, text)
+
+    def test_book(self):
+        self.assert_same_tokens(test_utils.book(num_chapters=5))
+
+    def test_flags(self):
+        word = test_utils.word(allow_empty=False)
+        for table in (paragraphs, whitespace):
+            for name, (flag, _) in table.items():
+                self.assert_same_tokens(r"\{f} {w}".format(f=flag, w=word))
+                self.assert_same_tokens(r"\{f}* {w}".format(f=flag, w=word))
+        for name, (flag, _) in indented_paragraphs.items():
+            for indent in ("", "1", "3"):
+                self.assert_same_tokens(r"\{f}{i} {w}".format(f=flag, i=indent, w=word))
+        for name, (flag, _) in headings.items():
+            self.assert_same_tokens(r"\{f}2 {w} \bd x".format(f=flag, w=word))
+        for name, (flag, _) in lower_open_closes.items():
+            self.assert_same_tokens(r"\p \{f} {w}\{f}*".format(f=flag, w=word))
+        for table in (higher_rest_of_lines, lower_until_next_flags):
+            for name, (flag, _) in table.items():
+                self.assert_same_tokens("\\{f}\n{w}\n\\p {w}".format(f=flag, w=word))
+        for name, (flag, _) in footnotes.items():
+            for label in ("+", "-", "a"):
+                self.assert_same_tokens(r"\p \{f}  {l} \ft {w}\{f}*".format(f=flag, l=label, w=word))
+
+    def test_errors(self):
+        for text in (r"\p \{}".format(test_utils.word()),
+                     "\\p\n\\pq2 hello",
+                     "\\f\n\\f*",
+                     "\\f ",
+                     "\\v\n",
+                     "\\bogus hi",
+                     "\\p {} \\{}* more".format("x " * 60, "y" * 120),
+                     "\\p \\bogus {}".format("z" * 90)):
+            self.assert_same_tokens(text)
+        self.lexer.input("\\p \\bogus hi")
+        with self.assertRaises(UsfmInputError) as context:
+            list(iter(self.lexer.token, None))
+        self.assertEqual(context.exception.message, "Unrecognized token: \"\\bogus hi\"")
+
+    def test_compact_tokens(self):
+        for lexer in (self.lexer, self.scanner):
+            lexer.input(test_utils.book(num_chapters=1))
+            token = lexer.token()
+            while token is not None:
+                self.assertIsInstance(token, Token)
+                self.assertFalse(hasattr(token, "__dict__"))
+                self.assertEqual(Token.names[token.kind], token.type)
+                token = lexer.token()
+
+    def test_parse(self):
+        text = test_utils.book(num_chapters=3)
+        parser = UsfmParser.create(lexer_class=UsfmScanner)
+        document = parser.parse_text(text)
+        expected = UsfmParser.create().parse_text(text)
+        self.assertEqual(len(document.elements), len(expected.elements))
+        for element, expected_element in zip(document.elements, expected.elements):
+            self.assertEqual(type(element), type(expected_element))
+
+
+if __name__ == "__main__":
+    unittest.main()
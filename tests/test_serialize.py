@@ -0,0 +1,66 @@
+from __future__ import unicode_literals
+
+import io
+import unittest
+
+from tests import test_utils
+from usfm_utils.elements import serialize
+from usfm_utils.elements.document import Document
+from usfm_utils.elements.element_impls import Text
+from usfm_utils.usfm.parse import parse
+
+
+# a document serialized on Python 3, which loads the same on any interpreter
+SOURCE = "\\id GEN\n\\c 1\n\\p\n\\v 1 In the \\bd beginning\\bd*\\f + \\ft note\\f*\n\\q1 poem"
+SERIALIZED = (
+    b"USFMDOC\x02\x02\x052\x01\x00\x08\x00\t\x00\x04\x00\x05\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x03\x00\x01\x00\x01\x00\x00\x00\x04"
+    b"\x00\x01\x00\x01\x00\x02\x00\x01\x00\x03\x00\x01\x00\x01\x00\x04"
+    b"\x00\x01\x00\x01\x00\x05\x00\x1a\x01\x06\x01\x00\x04\x00\x00\x00"
+    b"\x01 \x00\x00\x01\x01\x00\x07\x02\x00\x01\x16\x00\x04\x04\x00"
+    b"\x00\x00\x1b1 In the beginningnote poem"
+)
+
+
+class SerializeTests(unittest.TestCase):
+    longMessage = True
+
+    def assert_round_trip(self, document):
+        output = io.BytesIO()
+        serialize.dump(document, output)
+        output.seek(0)
+        loaded = serialize.load(output)
+        self.assertEqual(test_utils.structure(loaded), test_utils.structure(document))
+        return output.getvalue()
+
+    def test_every_kind(self):
+        self.assert_round_trip(test_utils.every_kind_document())
+
+    def test_book(self):
+        document = parse(test_utils.book(num_chapters=5))
+        self.assert_round_trip(document)
+
+    def test_empty(self):
+        self.assert_round_trip(Document([]))
+
+    def test_shared_strings(self):
+        word = "word" * 100
+        data = self.assert_round_trip(Document([Text(word) for _ in range(10)]))
+        self.assertLess(len(data), 2 * len(word))
+
+    def test_fixed_data(self):
+        document = parse(SOURCE)
+        loaded = serialize.loads(SERIALIZED)
+        self.assertEqual(test_utils.structure(loaded), test_utils.structure(document))
+        self.assertEqual(serialize.dumps(loaded), SERIALIZED)
+        self.assertEqual(serialize.dumps(document), SERIALIZED)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, serialize.loads, b"not a document")
+        data = serialize.dumps(test_utils.every_kind_document())
+        for length in range(len(data)):
+            self.assertRaises(ValueError, serialize.loads, data[:length])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import io
+import json
+import unittest
+
+from tests import test_utils
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.stats import Stats
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+class StatsTests(unittest.TestCase):
+    longMessage = True
+
+    text = test_utils.book(num_chapters=3, seed=0)
+
+    def test_parse(self):
+        for lexer_class in (None, UsfmScanner):
+            parser = UsfmParser.create(lexer_class=lexer_class)
+            stats = Stats()
+            document = parser.parse_text(self.text, stats=stats)
+            self.assertEqual(test_utils.structure(document),
+                             test_utils.structure(parser.parse_text(self.text)))
+            self.assertEqual(set(stats.phases), {"input", "lex", "parse"})
+            self.assertEqual(stats.token_counts,
+                             parser.validate(self.text).token_counts)
+            self.assertEqual(stats.reductions["higher_element -> CHAPTER lower_elements"], 3)
+            self.assertEqual(stats.reductions["document -> higher_elements EOF"], 1)
+
+    def test_accumulate(self):
+        parser = UsfmParser.create()
+        stats = Stats()
+        parser.parse_text(self.text, stats=stats)
+        once = dict(stats.token_counts)
+        parser.parse_text(self.text, stats=stats)
+        self.assertEqual(stats.token_counts, dict((name, 2 * count)
+                                                  for name, count in once.items()))
+
+        merged = Stats()
+        merged.merge(stats)
+        merged.merge(stats)
+        self.assertEqual(merged.token_counts["VERSE"], 4 * once["VERSE"])
+        self.assertAlmostEqual(merged.phases["lex"], 2 * stats.phases["lex"])
+
+    def test_render(self):
+        document = UsfmParser.create().parse_text(self.text)
+        stats = Stats()
+        output = io.StringIO()
+        HtmlVisitor(output, stats=stats).write(document)
+        self.assertEqual(stats.bytes_written, len(output.getvalue().encode("utf-8")))
+        self.assertEqual(list(stats.phases), ["render"])
+
+    def test_json_line(self):
+        stats = Stats(path="book.usfm")
+        UsfmParser.create().parse_text(self.text, stats=stats)
+        line = stats.to_json_line()
+        self.assertTrue(line.endswith("\n"))
+        self.assertEqual(line.count("\n"), 1)
+        obj = json.loads(line)
+        self.assertEqual(obj["path"], "book.usfm")
+        self.assertEqual(obj["tokens"], stats.token_counts)
+        self.assertEqual(obj["bytes_written"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import warnings
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+from usfm_utils.elements.element_impls import Paragraph
+from usfm_utils.usfm import tables
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.lex_utils import thunk
+from usfm_utils.usfm.parse import UsfmParser
+
+
+class PrebuiltTablesTest(unittest.TestCase):
+
+    def test_checksums(self):
+        for module_name in (tables.LEXTAB, tables.PARSETAB):
+            module = tables.load_table(module_name)
+            self.assertIsNotNone(module, module_name)
+
+    def test_lextab_up_to_date(self):
+        usfm_lexer = UsfmLexer()
+        usfm_lexer.register_rules()
+        lexer = lex.lex(module=usfm_lexer, optimize=False)
+        lextab = tables.load_table(tables.LEXTAB)
+        for state, regexes in lextab._lexstatere.items():
+            self.assertEqual(self.rules(regex for regex, _ in regexes),
+                             self.rules(lexer.lexstateretext[state]))
+
+    def test_parsetab_up_to_date(self):
+        usfm_parser = UsfmParser()
+        usfm_parser.register_rules()
+        pdict = dict((name, getattr(usfm_parser, name)) for name in dir(usfm_parser))
+        pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+        pinfo.get_all()
+        parsetab = tables.load_table(tables.PARSETAB)
+        self.assertEqual(parsetab._lr_signature, pinfo.signature())
+
+    def test_stale_tables(self):
+        checksum = tables._checksum
+        tables._checksum = "stale"
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertIsNone(tables.load_table(tables.PARSETAB))
+                lexer = UsfmLexer.create()
+                parser = UsfmParser.create()
+                lexer.input(r"\p hello")
+                document = parser.parse(lexer)
+            self.assertTrue(len(caught) > 0)
+        finally:
+            tables._checksum = checksum
+        self.assertIsInstance(document.elements[0], Paragraph)
+
+    def test_checksum_covers_rules(self):
+        checksum = tables.flags_checksum()
+        lexical_rules = UsfmLexer.__dict__["lexical_rules"]
+        rule = UsfmParser.__dict__["p_document"]
+        docstring = rule.__doc__
+
+        def changed_lexical_rules():
+            rules = lexical_rules.__func__()
+            name, func, state, discard, next_state = rules[0]
+            rules[0] = (name, thunk(func.__doc__ + "?"), state, discard, next_state)
+            return rules
+
+        try:
+            tables._checksum = None
+            UsfmLexer.lexical_rules = staticmethod(changed_lexical_rules)
+            self.assertNotEqual(tables.flags_checksum(), checksum)
+            UsfmLexer.lexical_rules = lexical_rules
+            tables._checksum = None
+            rule.__doc__ = docstring.replace("EOF", "")
+            self.assertNotEqual(tables.flags_checksum(), checksum)
+        finally:
+            UsfmLexer.lexical_rules = lexical_rules
+            rule.__doc__ = docstring
+            tables._checksum = checksum
+
+    def test_without_prebuilt_lexer(self):
+        # as with Python < 3.5, whose re module cannot compile the shipped master
+        # regex, which has more than 100 groups
+        lextab = tables.load_table(tables.LEXTAB)
+        retext = lextab._lexstatere
+        lextab._lexstatere = dict((state, [("(?P<t_x>" * 101, names) for _, names in regexes])
+                                  for state, regexes in retext.items())
+        try:
+            lexer = UsfmLexer.create()
+        finally:
+            lextab._lexstatere = retext
+        lexer.input(r"\p hello")
+        self.assertEqual(lexer.token().type, "PARAGRAPH")
+
+    @staticmethod
+    def rules(regexes):
+        """
+        :param iterable[str] regexes: master regexes of a PLY lexer
+        :return: the rules they are made of, sorted, as the order of the rules (and
+        how they are split into master regexes) depends on the version of Python
+        :rtype: list[str]
+        """
+        return sorted(rule for regex in regexes
+                      for rule in regex.replace(")|(?P<t_", ")\0(?P<t_").split("\0"))
+
+    def test_lazy_lexer(self):
+        from usfm_utils.usfm.lex import get_lexer, lexer
+        self.assertIs(get_lexer(), get_lexer())
+        fresh_lexer = UsfmLexer.create()
+        for usfm_lexer in (lexer, fresh_lexer):
+            usfm_lexer.input(r"\p hello")
+        self.assertEqual([token.type for token in iter(lexer.token, None)],
+                         [token.type for token in iter(fresh_lexer.token, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from tests import test_utils
+from usfm_utils.elements.document import Document
+from usfm_utils.elements.element_impls import FormattedText, Paragraph, \
+    Reference, Text
+from usfm_utils.elements.element_visitor import ElementVisitor
+from usfm_utils.elements.flat import FlatDocument
+from usfm_utils.elements.traversal import dispatch_table, walk
+from usfm_utils.usfm.parse import parse
+
+METHODS = ("before_paragraph", "after_paragraph", "before_formatted_text",
+           "after_formatted_text", "before_heading", "after_heading", "before_other",
+           "after_other", "before_reference", "after_reference", "before_chapter_no",
+           "after_chapter_no", "before_footnote", "after_footnote", "text", "whitespace")
+
+
+class RecordingVisitor(ElementVisitor):
+    """
+    Records every call of every visitor method
+    """
+    def __init__(self):
+        self.calls = []
+
+
+def recorder(name):
+    def record(self, element):
+        self.calls.append((name, element))
+    return record
+
+
+for _name in METHODS:
+    setattr(RecordingVisitor, _name, recorder(_name))
+
+
+class TextVisitor(ElementVisitor):
+    """
+    Only overrides text
+    """
+    def __init__(self):
+        self.texts = []
+
+    def text(self, raw_text):
+        self.texts.append(raw_text.content)
+
+
+class AcceptingText(Text):
+    """
+    A Text that is visited as its text uppercased
+    """
+    __slots__ = ()
+
+    def accept(self, visitor):
+        visitor.text(Text(self.content.upper()))
+
+
+class TraversalTests(unittest.TestCase):
+    longMessage = True
+
+    def assert_same_calls(self, elements):
+        recursive = RecordingVisitor()
+        for element in elements:
+            element.accept(recursive)
+        walked = RecordingVisitor()
+        walk(elements, walked)
+        self.assertEqual(self.summary(walked.calls), self.summary(recursive.calls))
+        return walked.calls
+
+    @staticmethod
+    def summary(calls):
+        """
+        :return: the calls, with their elements described by their fields (views of
+        FlatDocuments are created anew on each visit)
+        """
+        return [(name, getattr(element, "content", None), getattr(element, "kind", None))
+                for name, element in calls]
+
+    def test_every_kind(self):
+        calls = self.assert_same_calls(test_utils.every_kind_document().elements)
+        self.assertEqual(set(name for name, _ in calls), set(METHODS))
+
+    def test_book(self):
+        document = parse(test_utils.book(num_chapters=3))
+        self.assert_same_calls(document.elements)
+        self.assert_same_calls(FlatDocument.from_document(document).elements)
+
+    def test_reference(self):
+        reference = Reference(Reference.Kind.inline, [Text("a")])
+        calls = self.assert_same_calls([reference])
+        self.assertEqual([name for name, _ in calls],
+                         ["before_reference", "text", "after_reference"])
+        reference.accept(ElementVisitor())
+
+    def test_skipped_methods(self):
+        table = dispatch_table(TextVisitor)
+        self.assertEqual(table[Paragraph], (False, None, None))
+        self.assertIsNotNone(table[Text][1])
+        visitor = TextVisitor()
+        walk(parse("\\id GEN\n\\c 1\n\\p\n\\v 1 a \\bd b\\bd* c").elements, visitor)
+        self.assertEqual(visitor.texts, ["1", "1", " a ", "b", " c"])
+
+    def test_overridden_accept(self):
+        elements = [Paragraph([Text("a"), AcceptingText("b")])]
+        visitor = TextVisitor()
+        walk(elements, visitor)
+        self.assertEqual(visitor.texts, ["a", "B"])
+
+    def test_deep_nesting(self):
+        element = Text("a")
+        for _ in range(10000):
+            element = FormattedText(FormattedText.Kind.bold, [element])
+        visitor = RecordingVisitor()
+        walk(Document([element]).elements, visitor)
+        calls = visitor.calls
+        self.assertEqual(len(calls), 20001)
+        self.assertEqual(calls[10000][0], "text")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,146 @@ Various utilities for tests
 import random
 
 from builtins import chr
+from enum import Enum
 
+from usfm_utils.elements.document import Document, TableOfContentsInfo
+from usfm_utils.elements.element_impls import ChapterNumber, Footnote, \
+    FormattedText, Heading, OtherText, Paragraph, Reference, Text, Whitespace
+from usfm_utils.elements.footnote_utils import AutomaticFootnoteLabel, \
+    CustomFootnoteLabel, NoFootnoteLabel
+from usfm_utils.elements.paragraph_utils import Centered, LeftAligned, \
+    RightAligned
 
-def word(allow_empty=True):
+
+def word(allow_empty=True, rng=random):
     """
+    :param rng: source of randomness, random.Random or the random module
     :return: a randomly generated (non-ASCII) word
     :rtype: unicode
     """
-    length = random.randint(0 if allow_empty else 1, 10)
-    return u"".join(chr(random.randint(256, 512)) for _ in range(length))
+    length = rng.randint(0 if allow_empty else 1, 10)
+    return u"".join(chr(rng.randint(256, 512)) for _ in range(length))
+
+
+def sentence(num_words=8, rng=random):
+    """
+    :param rng: source of randomness, see word
+    :return: a randomly generated sentence of non-empty words
+    :rtype: unicode
+    """
+    return u" ".join(word(allow_empty=False, rng=rng) for _ in range(num_words))
+
+
+def book(num_chapters=10, verses_per_chapter=20, seed=None):
+    """
+    Generates a USFM book exercising headings, paragraphs, poetry, footnotes,
+    cross-references and character formatting
+    :param int num_chapters:
+    :param int verses_per_chapter:
+    :param int seed: if not None, the book is generated deterministically from it,
+    without affecting the state of the random module
+    :rtype: unicode
+    """
+    rng = random if seed is None else random.Random(seed)
+    lines = [
+        u"\\id GEN {}".format(sentence(3, rng=rng)),
+        u"\\ide UTF-8",
+        u"\\h {}".format(word(allow_empty=False, rng=rng)),
+        u"\\toc1 {}".format(sentence(4, rng=rng)),
+        u"\\toc2 {}".format(sentence(2, rng=rng)),
+        u"\\toc3 {}".format(word(allow_empty=False, rng=rng)),
+        u"\\mt1 {}".format(sentence(3, rng=rng)),
+        u"\\ip {} \\bk {}\\bk* {}".format(sentence(rng=rng), word(allow_empty=False, rng=rng),
+                                          sentence(rng=rng)),
+    ]
+    for chapter in range(1, num_chapters + 1):
+        lines.append(u"\\c {}".format(chapter))
+        lines.append(u"\\s1 {}".format(sentence(4, rng=rng)))
+        lines.append(u"\\p")
+        for verse in range(1, verses_per_chapter + 1):
+            choice = rng.random()
+            if choice < 0.15:
+                lines.append(u"\\q{}".format(rng.randint(1, 2)))
+            elif choice < 0.2:
+                lines.append(u"\\p")
+            elif choice < 0.22:
+                lines.append(u"\\nb")
+            text = sentence(rng.randint(4, 16), rng=rng)
+            choice = rng.random()
+            if choice < 0.2:
+                text += u" \\f + \\fr {c}:{v} \\ft {t}\\f*".format(c=chapter, v=verse,
+                                                                  t=sentence(rng=rng))
+            elif choice < 0.3:
+                text += u" \\x - \\xo {c}:{v} \\xq {t}\\x*".format(c=chapter, v=verse,
+                                                                  t=sentence(3, rng=rng))
+            elif choice < 0.45:
+                text += u" \\wj {}\\wj* {}".format(sentence(rng=rng), word(rng=rng))
+            elif choice < 0.5:
+                text += u" \\add {}\\add*".format(sentence(2, rng=rng))
+            lines.append(u"\\v {} {}".format(verse, text))
+    return u"\n".join(lines) + u"\n"
+
+
+def every_kind_document():
+    """
+    :return: a document with an element of every kind, with every combination of
+    paragraph layout and flags, and nested elements
+    :rtype: Document
+    """
+    def text():
+        return Text(word())
+
+    elements = []
+    for kind in FormattedText.Kind:
+        elements.append(FormattedText(kind, [text()]))
+    for kind in Heading.Kind:
+        for weight in (1, 3, 200):
+            elements.append(Heading(kind, [text()], weight=weight,
+                                    introductory=weight == 3))
+    for kind in OtherText.Kind:
+        elements.append(OtherText(kind, [text()]))
+    for kind in Reference.Kind:
+        elements.append(Reference(kind, [text()]))
+    for kind in ChapterNumber.Kind:
+        elements.append(ChapterNumber(kind, [text()]))
+    for kind in Whitespace.Kind:
+        elements.append(Whitespace(kind))
+    for kind in Footnote.Kind:
+        for label in (AutomaticFootnoteLabel(), NoFootnoteLabel(),
+                      CustomFootnoteLabel(word())):
+            elements.append(Footnote(kind, [text()], label))
+    layouts = [Centered(), RightAligned()]
+    for indent in LeftAligned.FirstLineIndent:
+        layouts.append(LeftAligned(indent, left_margin_indent=2))
+    for layout in layouts:
+        for flags in range(16):
+            elements.append(Paragraph([text(), text()], layout=layout,
+                                      embedded=bool(flags & 1),
+                                      introductory=bool(flags & 2),
+                                      poetic=bool(flags & 4),
+                                      continuation=bool(flags & 8)))
+    nested = Paragraph([FormattedText(FormattedText.Kind.bold, elements[:3]),
+                        Footnote(Footnote.Kind.footnote, [Paragraph([])],
+                                 NoFootnoteLabel())])
+    toc = TableOfContentsInfo(word(), None, word())
+    return Document(elements + [nested], heading=word(), table_of_contents=toc)
+
+
+def structure(obj):
+    """
+    :return: a comparable description of an element tree (or any other object
+    built from plain attributes)
+    """
+    if isinstance(obj, (list, tuple)):
+        return [structure(child) for child in obj]
+    elif isinstance(obj, Enum):
+        return obj
+    elif hasattr(obj, "__dict__"):
+        return type(obj), dict((key, structure(value))
+                               for key, value in vars(obj).items())
+    elif hasattr(type(obj), "__slots__"):
+        return type(obj), dict((key, structure(getattr(obj, key)))
+                               for cls in type(obj).__mro__
+                               for key in cls.__dict__.get("__slots__", ())
+                               if key != "__weakref__" and hasattr(obj, key))
+    return obj
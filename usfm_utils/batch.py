@@ -0,0 +1,164 @@
+"""
+Parsing of many USFM files at once, using a pool of worker processes.
+
+Each worker process creates its parser once, and then parses (and optionally
+renders) the files it is handed. A file that cannot be read, parsed or rendered
+does not abort the batch: its result carries the error instead of a document.
+"""
+from __future__ import unicode_literals
+
+import io
+import multiprocessing
+
+from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.stats import Stats
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
+
+
+class BatchResult(object):
+    """
+    The outcome of parsing one file of a batch
+    """
+    def __init__(self, path, document=None, output=None, error=None, stats=None):
+        """
+        :param str|unicode path: path of the parsed file
+        :param Document document: the parsed document, unless the batch was
+        rendered, or the file could not be parsed
+        :param output: the rendered document, if the batch was rendered
+        :param Exception error: error raised for this file, e.g. UsfmInputError,
+        IOError, or UnicodeDecodeError
+        :param Stats stats: stats of this file, if the batch collected them
+        """
+        self._path = path
+        self._document = document
+        self._output = output
+        self._error = error
+        self._stats = stats
+
+    @property
+    def path(self):
+        """
+        :rtype: str|unicode
+        """
+        return self._path
+
+    @property
+    def document(self):
+        """
+        :rtype: Document
+        """
+        return self._document
+
+    @property
+    def output(self):
+        return self._output
+
+    @property
+    def error(self):
+        """
+        :return: the error raised for this file, or None if it was parsed
+        :rtype: Exception
+        """
+        return self._error
+
+    @property
+    def stats(self):
+        """
+        :rtype: Stats
+        """
+        return self._stats
+
+    @property
+    def ok(self):
+        """
+        :rtype: bool
+        """
+        return self._error is None
+
+
+def render_html(document):
+    """
+    Renders a document to HTML. Can be passed to parse_many as render, so that
+    workers send back HTML rather than whole documents
+    :param Document document:
+    :rtype: str|unicode
+    """
+    output = io.StringIO()
+    HtmlVisitor(output).write(document)
+    return output.getvalue()
+
+
+def parse_many(paths, workers=None, render=None, ordered=True, chunksize=1,
+               collect_stats=False):
+    """
+    Parses USFM files in parallel, yielding a BatchResult for each of them
+    :param iterable[str|unicode] paths: paths of the (UTF-8) files to parse
+    :param int workers: number of worker processes, the number of CPUs if None.
+    With a single worker, files are parsed in the calling process
+    :param callable[Document -> object] render: if not None, workers apply it to
+    each document and send back its (picklable) result as output, instead of the
+    document itself. Must be a module-level function, e.g. render_html
+    :param bool ordered: whether results come in the order of paths, or as soon
+    as they are ready
+    :param int chunksize: number of files handed to a worker at once
+    :param bool collect_stats: whether each result should carry the Stats of its
+    file (labelled with its path, so that they can be written as JSON lines)
+    :rtype: iterable[BatchResult]
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers <= 1:
+        init_worker()
+        for path in paths:
+            yield parse_file((path, render, collect_stats))
+        return
+
+    pool = multiprocessing.Pool(workers, initializer=init_worker)
+    try:
+        tasks = ((path, render, collect_stats) for path in paths)
+        if ordered:
+            results = pool.imap(parse_file, tasks, chunksize)
+        else:
+            results = pool.imap_unordered(parse_file, tasks, chunksize)
+        for result in results:
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+# parser of the current (worker) process
+_parser = None
+
+
+def init_worker():
+    global _parser
+    if _parser is None:
+        _parser = UsfmParser.create(lexer_class=UsfmScanner)
+
+
+def parse_file(task):
+    """
+    :param (str|unicode, callable, bool) task: path of the file to parse, render
+    function (or None), and whether to collect stats
+    :rtype: BatchResult
+    """
+    path, render, collect_stats = task
+    stats = Stats(path=path) if collect_stats else None
+    try:
+        with io.open(path, encoding="utf-8") as usfm_file:
+            document = _parser.parse_text(usfm_file.read(), stats=stats)
+        if render is None:
+            return BatchResult(path, document=document, stats=stats)
+        if stats is None:
+            return BatchResult(path, output=render(document))
+        with stats.timer("render"):
+            output = render(document)
+    except Exception as e:
+        # any failure is this file's own, and must not abort the batch
+        return BatchResult(path, error=e, stats=stats)
+    if isinstance(output, type("")):
+        stats.add_bytes(len(output.encode("utf-8")))
+    return BatchResult(path, output=output, stats=stats)
@@ -4,8 +4,10 @@ from usfm_utils.elements.document import Document, TableOfContentsInfo
 from usfm_utils.elements.element_impls import ChapterNumber, Footnote, \
     FormattedText, Heading, OtherText, Paragraph, Reference, Text, Whitespace
 from usfm_utils.elements.element_visitor import ElementVisitor
+from usfm_utils.elements.flat import FlatDocument
 from usfm_utils.elements.footnote_utils import FootnoteLabel, \
     AutomaticFootnoteLabel, CustomFootnoteLabel, NoFootnoteLabel, \
     FootnoteLabelVisitor
 from usfm_utils.elements.paragraph_utils import ParagraphLayout, LeftAligned, \
     Centered, RightAligned, ParagraphLayoutVisitor
+from usfm_utils.elements.traversal import walk
@@ -1,6 +1,39 @@
+import sys
+
+import enum
+
+
+class NestedEnum(enum.Enum):
+    """
+    An enum defined within a class, such as the kinds of an element. Its members
+    pickle as attributes of that class: Python 2 looks classes up by their
+    unqualified name, so it cannot find the enum itself
+    """
+    def __reduce_ex__(self, protocol):
+        enum_class = type(self)
+        module = sys.modules[enum_class.__module__]
+        for owner in vars(module).values():
+            if isinstance(owner, type) and owner.__dict__.get(enum_class.__name__) is enum_class:
+                return nested_enum_member, (owner, enum_class.__name__, self.name)
+        return enum.Enum.__reduce_ex__(self, protocol)
+
+
+def nested_enum_member(owner, enum_name, name):
+    """
+    :param type owner: class in which the enum is defined
+    :param str enum_name: name of the enum
+    :param str name: name of the member
+    :rtype: NestedEnum
+    """
+    return getattr(owner.__dict__[enum_name], name)
 
 
 class Element(object):
+    # Elements are slotted: the classes below only declare empty __slots__, so
+    # that they can be combined, and each concrete element class declares the
+    # slots of all its bases
+    __slots__ = ()
+
     def accept(self, visitor):
         """
         :param ElementVisitor visitor:
@@ -9,6 +42,8 @@ class Element(object):
 
 
 class MaybeIntroductoryElement(Element):
+    __slots__ = ()
+
     def __init__(self, introductory=False):
         """
         :param bool introductory:
@@ -24,6 +59,8 @@ class MaybeIntroductoryElement(Element):
 
 
 class WeightedElement(Element):
+    __slots__ = ()
+
     def __init__(self, weight=1):
         """
         :param int weight:
@@ -36,6 +73,8 @@ class WeightedElement(Element):
 
 
 class ParentElement(Element):
+    __slots__ = ()
+
     def __init__(self, children):
         """
         :param Iterable[Element] children:
@@ -55,6 +94,8 @@ class ParentElement(Element):
 
 
 class KindedElement(Element):
+    __slots__ = ()
+
     def __init__(self, kind):
         self._kind = kind
 
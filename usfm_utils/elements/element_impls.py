@@ -3,12 +3,14 @@ import itertools
 import enum
 
 from usfm_utils.elements.abstract_elements import Element, KindedElement, MaybeIntroductoryElement,\
-    ParentElement, WeightedElement
+    NestedEnum, ParentElement, WeightedElement
 from usfm_utils.elements.footnote_utils import FootnoteLabel
 from usfm_utils.elements.paragraph_utils import LeftAligned
 
 
 class Text(Element):
+    __slots__ = ("_content",)
+
     def __init__(self, content):
         """
         :param str|unicode content:
@@ -27,6 +29,8 @@ class Text(Element):
 
 
 class FormattedText(KindedElement, ParentElement):
+    __slots__ = ("_kind", "_children")
+
     def __init__(self, kind, children):
         KindedElement.__init__(self, kind)
         ParentElement.__init__(self, children)
@@ -37,7 +41,7 @@ class FormattedText(KindedElement, ParentElement):
         visitor.after_formatted_text(self)
 
     @enum.unique
-    class Kind(enum.Enum):
+    class Kind(NestedEnum):
         c = itertools.count()  # for generating unique numbers
 
         # text formatting
@@ -90,6 +94,8 @@ class FormattedText(KindedElement, ParentElement):
 
 
 class Heading(KindedElement, MaybeIntroductoryElement, ParentElement, WeightedElement):
+    __slots__ = ("_kind", "_children", "_weight", "_introductory")
+
     def __init__(self, kind, children, weight=1, introductory=False):
         KindedElement.__init__(self, kind)
         ParentElement.__init__(self, children)
@@ -102,7 +108,7 @@ class Heading(KindedElement, MaybeIntroductoryElement, ParentElement, WeightedEl
         visitor.after_heading(self)
 
     @enum.unique
-    class Kind(enum.Enum):
+    class Kind(NestedEnum):
         major_title = 0
         major_title_end = 1
         major_section = 2
@@ -125,6 +131,8 @@ class Heading(KindedElement, MaybeIntroductoryElement, ParentElement, WeightedEl
 
 
 class OtherText(KindedElement, ParentElement):
+    __slots__ = ("_kind", "_children")
+
     def __init__(self, kind, children):
         KindedElement.__init__(self, kind)
         ParentElement.__init__(self, children)
@@ -135,7 +143,7 @@ class OtherText(KindedElement, ParentElement):
         visitor.after_other(self)
 
     @enum.unique
-    class Kind(enum.Enum):
+    class Kind(NestedEnum):
         selah = 0
         acrostic_heading = 1
         explanatory = 2
@@ -147,6 +155,8 @@ class OtherText(KindedElement, ParentElement):
 
 
 class Paragraph(MaybeIntroductoryElement, ParentElement):
+    __slots__ = ("_children", "_layout", "_embedded", "_introductory", "_poetic",
+                 "_continuation")
 
     def __init__(self, children, layout=None, embedded=False,
                  introductory=False, poetic=False, continuation=False):
@@ -159,11 +169,7 @@ class Paragraph(MaybeIntroductoryElement, ParentElement):
         :param bool continuation:
         """
         ParentElement.__init__(self, children)
-        self._children = tuple(children)
-        if layout is None:
-            self._layout = LeftAligned(LeftAligned.FirstLineIndent.default)
-        else:
-            self._layout = layout
+        self._layout = LeftAligned() if layout is None else layout
         self._embedded = embedded
         MaybeIntroductoryElement.__init__(self, introductory)
         self._poetic = poetic
@@ -225,6 +231,8 @@ class Reference(KindedElement, ParentElement):
     """
     Different than cross-references
     """
+    __slots__ = ("_kind", "_children")
+
     def __init__(self, kind, children):
         KindedElement.__init__(self, kind)
         ParentElement.__init__(self, children)
@@ -232,16 +240,18 @@ class Reference(KindedElement, ParentElement):
     def accept(self, visitor):
         visitor.before_reference(self)
         self.visit_children(visitor)
-        visitor.after_refence(self)
+        visitor.after_reference(self)
 
     @enum.unique
-    class Kind(enum.Enum):
+    class Kind(NestedEnum):
         section_range = 0
         parallel = 1
         inline = 2
 
 
 class ChapterNumber(KindedElement, ParentElement):
+    __slots__ = ("_kind", "_children")
+
     def __init__(self, kind, children):
         KindedElement.__init__(self, kind)
         ParentElement.__init__(self, children)
@@ -252,7 +262,7 @@ class ChapterNumber(KindedElement, ParentElement):
         visitor.after_chapter_no(self)
 
     @enum.unique
-    class Kind(enum.Enum):
+    class Kind(NestedEnum):
         standard = 0
         alternate = 1
 
@@ -261,6 +271,8 @@ class ChapterNumber(KindedElement, ParentElement):
 
 
 class Footnote(KindedElement, ParentElement):
+    __slots__ = ("_kind", "_children", "_label")
+
     def __init__(self, kind, children, label):
         """
         :param Iterable[Element] children:
@@ -281,13 +293,15 @@ class Footnote(KindedElement, ParentElement):
         visitor.after_footnote(self)
 
     @enum.unique
-    class Kind(enum.Enum):
+    class Kind(NestedEnum):
         footnote = 1
         endnote = 2
         cross_reference = 3
 
 
 class Whitespace(KindedElement):
+    __slots__ = ("_kind",)
+
     def __init__(self, kind):
         KindedElement.__init__(self, kind)
 
@@ -295,7 +309,7 @@ class Whitespace(KindedElement):
         visitor.whitespace(self)
 
     @enum.unique
-    class Kind(enum.Enum):
+    class Kind(NestedEnum):
         new_line = 0
         page_break = 1
 
@@ -36,15 +36,57 @@ class ElementVisitor(object):
         """
         pass
 
+    def before_other(self, other):
+        """
+        :param OtherText other:
+        """
+        pass
+
+    def after_other(self, other):
+        """
+        :param OtherText other:
+        """
+        pass
+
+    def before_reference(self, reference):
+        """
+        :param Reference reference:
+        """
+        pass
+
+    def after_reference(self, reference):
+        """
+        :param Reference reference:
+        """
+        pass
+
+    def before_chapter_no(self, chapter_no):
+        """
+        :param ChapterNumber chapter_no:
+        """
+        pass
+
+    def after_chapter_no(self, chapter_no):
+        """
+        :param ChapterNumber chapter_no:
+        """
+        pass
+
     def before_footnote(self, footnote):
+        """
+        :param Footnote footnote:
+        """
         pass
 
     def after_footnote(self, footnote):
+        """
+        :param Footnote footnote:
+        """
         pass
 
     def text(self, raw_text):
         """
-        :param RawText raw_text:
+        :param Text raw_text:
         """
         pass
 
@@ -52,4 +94,4 @@ class ElementVisitor(object):
         """
         :param Whitespace whitespace:
         """
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,468 @@
+"""
+A flat representation of documents, as parallel arrays rather than a tree of
+element objects.
+
+Element i of a FlatDocument is described by the i-th entry of each of its
+FIELDS (see FlatDocument). Elements are numbered in preorder, so the elements
+within element i are those from i + 1 up to the next element that is not one of
+its descendants, and the top-level elements are 0 and its next siblings. The
+text of every Text element is a slice of a single string.
+
+Keeping, garbage-collecting and pickling a FlatDocument involve a handful of
+objects, whatever the size of the document. Element views give access
+to it through the usual element interface: a view is an instance of the element
+class it stands for (e.g. a ParagraphView is a Paragraph) whose fields are read
+from the arrays, so visitors such as HtmlVisitor accept views as they are.
+Views are created on demand, and are not kept by the document.
+"""
+import array
+
+from usfm_utils.elements.document import Document
+from usfm_utils.elements.element_impls import ChapterNumber, Footnote, \
+    FormattedText, Heading, OtherText, Paragraph, Reference, Text, Whitespace
+from usfm_utils.elements.serialize import CHAPTER_NUMBER, CHAPTER_NUMBER_KINDS, \
+    CONTINUATION, EMBEDDED, FOOTNOTE, FOOTNOTE_KINDS, FORMATTED_TEXT, \
+    FORMATTED_TEXT_KINDS, HEADING, HEADING_KINDS, INTRODUCTORY, OTHER_TEXT, \
+    OTHER_TEXT_KINDS, PARAGRAPH, POETIC, REFERENCE, REFERENCE_KINDS, TEXT, \
+    WHITESPACE, WHITESPACE_KINDS
+
+# array typecode of (signed, 32-bit) element indices and offsets
+INDEX_TYPECODE = "i"
+
+# index of no element, e.g. the parent of top-level elements
+NO_INDEX = -1
+
+# kind codes of each element type, indexed by type code
+ELEMENT_KINDS = {
+    FORMATTED_TEXT: FORMATTED_TEXT_KINDS,
+    HEADING: HEADING_KINDS,
+    OTHER_TEXT: OTHER_TEXT_KINDS,
+    REFERENCE: REFERENCE_KINDS,
+    CHAPTER_NUMBER: CHAPTER_NUMBER_KINDS,
+    FOOTNOTE: FOOTNOTE_KINDS,
+    WHITESPACE: WHITESPACE_KINDS,
+}
+
+TYPE_CODES = {
+    Text: TEXT,
+    FormattedText: FORMATTED_TEXT,
+    Heading: HEADING,
+    OtherText: OTHER_TEXT,
+    Paragraph: PARAGRAPH,
+    Reference: REFERENCE,
+    ChapterNumber: CHAPTER_NUMBER,
+    Footnote: FOOTNOTE,
+    Whitespace: WHITESPACE,
+}
+
+ELEMENT_TYPES = dict((code, element_type) for element_type, code in TYPE_CODES.items())
+
+
+class FlatDocument(object):
+    """
+    A document as parallel arrays. For element i:
+    - types[i]: its type code (see usfm_utils.elements.serialize)
+    - kinds[i]: the index of its kind in its Kind enum, for elements with a kind
+    - flags[i]: for paragraphs and headings, their boolean fields (EMBEDDED,
+      INTRODUCTORY, POETIC, CONTINUATION)
+    - values[i]: for paragraphs the index of their layout in layouts, for
+      headings their weight, for footnotes the index of their label in labels
+    - parents[i], first_children[i], next_siblings[i]: indices of its parent,
+      first child and next sibling, or NO_INDEX
+    - text_offsets[i], text_lengths[i]: for Text elements, where their content
+      is within text
+    """
+    FIELDS = ("types", "kinds", "flags", "values", "parents", "first_children",
+              "next_siblings", "text_offsets", "text_lengths")
+
+    def __init__(self, text, layouts, labels, heading=None, table_of_contents=None,
+                 **fields):
+        """
+        :param str|unicode text: the contents of all Text elements, concatenated
+        :param tuple[ParagraphLayout] layouts: the layouts of paragraphs
+        :param tuple[FootnoteLabel] labels: the labels of footnotes
+        :param str|unicode heading:
+        :param TableOfContentsInfo table_of_contents:
+        :param fields: bytearrays for types, kinds and flags, and arrays (of
+        INDEX_TYPECODE) for the others of FIELDS, empty if omitted
+        """
+        self.text = text
+        self.layouts = layouts
+        self.labels = labels
+        self._heading = heading
+        self._table_of_contents = table_of_contents
+        for name in self.FIELDS[:3]:
+            setattr(self, name, fields.get(name, bytearray()))
+        for name in self.FIELDS[3:]:
+            setattr(self, name, fields.get(name, array.array(INDEX_TYPECODE)))
+
+    @property
+    def heading(self):
+        return self._heading
+
+    @property
+    def table_of_contents(self):
+        return self._table_of_contents
+
+    @property
+    def elements(self):
+        """
+        :return: views of the top-level elements
+        :rtype: list[Element]
+        """
+        return self.siblings(0 if len(self.types) > 0 else NO_INDEX)
+
+    def __len__(self):
+        """
+        :return: the number of elements, at every level
+        :rtype: int
+        """
+        return len(self.types)
+
+    def view(self, index):
+        """
+        :param int index: index of an element
+        :return: a view of the element
+        :rtype: Element
+        """
+        return VIEWS[self.types[index]](self, index)
+
+    def siblings(self, index):
+        """
+        :param int index: index of an element, or NO_INDEX
+        :return: views of the element and its next siblings
+        :rtype: list[Element]
+        """
+        types = self.types
+        next_siblings = self.next_siblings
+        views = []
+        while index != NO_INDEX:
+            views.append(VIEWS[types[index]](self, index))
+            index = next_siblings[index]
+        return views
+
+    def content(self, index):
+        """
+        :param int index: index of a Text element
+        :rtype: str|unicode
+        """
+        offset = self.text_offsets[index]
+        return self.text[offset:offset + self.text_lengths[index]]
+
+    def element(self, index):
+        """
+        :param int index: index of an element
+        :return: the element, as a tree of element objects
+        :rtype: Element
+        """
+        element_type = self.types[index]
+        if element_type == TEXT:
+            return Text(self.content(index))
+        elif element_type == WHITESPACE:
+            return Whitespace(WHITESPACE_KINDS.members[self.kinds[index]])
+        children = []
+        child = self.first_children[index]
+        while child != NO_INDEX:
+            children.append(self.element(child))
+            child = self.next_siblings[child]
+        if element_type == PARAGRAPH:
+            flags = self.flags[index]
+            return Paragraph(children,
+                             layout=self.layouts[self.values[index]],
+                             embedded=bool(flags & EMBEDDED),
+                             introductory=bool(flags & INTRODUCTORY),
+                             poetic=bool(flags & POETIC),
+                             continuation=bool(flags & CONTINUATION))
+        kind = ELEMENT_KINDS[element_type].members[self.kinds[index]]
+        if element_type == HEADING:
+            return Heading(kind, children, weight=self.values[index],
+                           introductory=bool(self.flags[index] & INTRODUCTORY))
+        elif element_type == FOOTNOTE:
+            return Footnote(kind, children, self.labels[self.values[index]])
+        return ELEMENT_TYPES[element_type](kind, children)
+
+    def to_document(self):
+        """
+        :return: the document, as a tree of element objects
+        :rtype: Document
+        """
+        elements = []
+        index = 0 if len(self.types) > 0 else NO_INDEX
+        while index != NO_INDEX:
+            elements.append(self.element(index))
+            index = self.next_siblings[index]
+        return Document(elements, heading=self._heading,
+                        table_of_contents=self._table_of_contents)
+
+    @staticmethod
+    def from_document(document):
+        """
+        :param Document document:
+        :rtype: FlatDocument
+        """
+        builder = FlatDocument.Builder()
+        for element in document.elements:
+            builder.add(element)
+        return builder.build(heading=document.heading,
+                             table_of_contents=document.table_of_contents)
+
+    class Builder(object):
+        """
+        Builds a FlatDocument from its top-level elements, one at a time. The
+        builder keeps no reference to the elements added to it
+        """
+        def __init__(self):
+            self._types = bytearray()
+            self._kinds = bytearray()
+            self._flags = bytearray()
+            self._values = array.array(INDEX_TYPECODE)
+            self._parents = array.array(INDEX_TYPECODE)
+            self._first_children = array.array(INDEX_TYPECODE)
+            self._next_siblings = array.array(INDEX_TYPECODE)
+            self._text_offsets = array.array(INDEX_TYPECODE)
+            self._text_lengths = array.array(INDEX_TYPECODE)
+            self._text = []
+            self._text_length = 0
+            self._layouts = []
+            self._layout_indices = {}
+            self._labels = []
+            self._label_indices = {}
+            self._last_root = NO_INDEX
+
+        def add(self, element):
+            """
+            Adds a top-level element, and everything within it
+            :param Element element:
+            """
+            index = self.add_element(element, NO_INDEX)
+            if self._last_root != NO_INDEX:
+                self._next_siblings[self._last_root] = index
+            self._last_root = index
+
+        def add_element(self, element, parent):
+            """
+            :param Element element:
+            :param int parent: index of the parent of element, or NO_INDEX
+            :return: the index of element
+            :rtype: int
+            """
+            index = len(self._types)
+            element_type = TYPE_CODES.get(type(element))
+            if element_type is None:
+                raise TypeError("Cannot flatten {}".format(type(element).__name__))
+            kind = flags = value = text_offset = text_length = 0
+            if element_type == TEXT:
+                content = element.content
+                text_offset = self._text_length
+                text_length = len(content)
+                self._text.append(content)
+                self._text_length += text_length
+            elif element_type == PARAGRAPH:
+                flags = EMBEDDED * element.embedded | \
+                    INTRODUCTORY * element.introductory | \
+                    POETIC * element.poetic | \
+                    CONTINUATION * element.continuation
+                value = self.index_of(element.layout, self._layouts, self._layout_indices)
+            else:
+                kind = ELEMENT_KINDS[element_type].codes[element.kind]
+                if element_type == HEADING:
+                    flags = INTRODUCTORY * element.introductory
+                    value = element.weight
+                elif element_type == FOOTNOTE:
+                    value = self.index_of(element.label, self._labels, self._label_indices)
+            self._types.append(element_type)
+            self._kinds.append(kind)
+            self._flags.append(flags)
+            self._values.append(value)
+            self._parents.append(parent)
+            self._first_children.append(NO_INDEX)
+            self._next_siblings.append(NO_INDEX)
+            self._text_offsets.append(text_offset)
+            self._text_lengths.append(text_length)
+
+            if element_type != TEXT and element_type != WHITESPACE:
+                previous = NO_INDEX
+                for child in element.children:
+                    child_index = self.add_element(child, index)
+                    if previous == NO_INDEX:
+                        self._first_children[index] = child_index
+                    else:
+                        self._next_siblings[previous] = child_index
+                    previous = child_index
+            return index
+
+        @staticmethod
+        def index_of(value, values, indices):
+            """
+            :return: the index of value in values, to which it is added if needed
+            :rtype: int
+            """
+            index = indices.get(value)
+            if index is None:
+                index = indices[value] = len(values)
+                values.append(value)
+            return index
+
+        def build(self, heading=None, table_of_contents=None):
+            """
+            :param str|unicode heading:
+            :param TableOfContentsInfo table_of_contents:
+            :rtype: FlatDocument
+            """
+            return FlatDocument(u"".join(self._text), tuple(self._layouts),
+                                tuple(self._labels), heading=heading,
+                                table_of_contents=table_of_contents,
+                                types=self._types, kinds=self._kinds, flags=self._flags,
+                                values=self._values, parents=self._parents,
+                                first_children=self._first_children,
+                                next_siblings=self._next_siblings,
+                                text_offsets=self._text_offsets,
+                                text_lengths=self._text_lengths)
+
+
+class ElementView(object):
+    """
+    Base of the views of the elements of a FlatDocument. Each view class derives
+    from this and from the element class it stands for, and overrides its fields
+    """
+    __slots__ = ()
+
+    def __init__(self, document, index):
+        """
+        :param FlatDocument document:
+        :param int index: index of the element in document
+        """
+        self._document = document
+        self._index = index
+
+    @property
+    def document(self):
+        """
+        :rtype: FlatDocument
+        """
+        return self._document
+
+    @property
+    def index(self):
+        """
+        :rtype: int
+        """
+        return self._index
+
+
+class ParentView(ElementView):
+    """
+    Base of the views of parent elements
+    """
+    __slots__ = ()
+
+    @property
+    def children(self):
+        """
+        :rtype: list[Element]
+        """
+        return self._document.siblings(self._document.first_children[self._index])
+
+    def visit_children(self, visitor):
+        document = self._document
+        types = document.types
+        next_siblings = document.next_siblings
+        child = document.first_children[self._index]
+        while child != NO_INDEX:
+            VIEWS[types[child]](document, child).accept(visitor)
+            child = next_siblings[child]
+
+
+def kind_property(element_kinds):
+    """
+    :param EnumCodes element_kinds: kind codes of the element type
+    :return: a property reading the kind of an element from its FlatDocument
+    :rtype: property
+    """
+    members = element_kinds.members
+    return property(lambda self: members[self._document.kinds[self._index]])
+
+
+def flag_property(flag):
+    """
+    :param int flag: one of the flags of FlatDocument.flags
+    :rtype: property
+    """
+    return property(lambda self: bool(self._document.flags[self._index] & flag))
+
+
+class TextView(ElementView, Text):
+    __slots__ = ("_document", "_index")
+
+    @property
+    def content(self):
+        return self._document.content(self._index)
+
+
+class FormattedTextView(ParentView, FormattedText):
+    __slots__ = ("_document", "_index")
+
+    kind = kind_property(FORMATTED_TEXT_KINDS)
+
+
+class HeadingView(ParentView, Heading):
+    __slots__ = ("_document", "_index")
+
+    kind = kind_property(HEADING_KINDS)
+    introductory = flag_property(INTRODUCTORY)
+
+    @property
+    def weight(self):
+        return self._document.values[self._index]
+
+
+class OtherTextView(ParentView, OtherText):
+    __slots__ = ("_document", "_index")
+
+    kind = kind_property(OTHER_TEXT_KINDS)
+
+
+class ParagraphView(ParentView, Paragraph):
+    __slots__ = ("_document", "_index")
+
+    embedded = flag_property(EMBEDDED)
+    introductory = flag_property(INTRODUCTORY)
+    poetic = flag_property(POETIC)
+    continuation = flag_property(CONTINUATION)
+
+    @property
+    def layout(self):
+        return self._document.layouts[self._document.values[self._index]]
+
+
+class ReferenceView(ParentView, Reference):
+    __slots__ = ("_document", "_index")
+
+    kind = kind_property(REFERENCE_KINDS)
+
+
+class ChapterNumberView(ParentView, ChapterNumber):
+    __slots__ = ("_document", "_index")
+
+    kind = kind_property(CHAPTER_NUMBER_KINDS)
+
+
+class FootnoteView(ParentView, Footnote):
+    __slots__ = ("_document", "_index")
+
+    kind = kind_property(FOOTNOTE_KINDS)
+
+    @property
+    def label(self):
+        return self._document.labels[self._document.values[self._index]]
+
+
+class WhitespaceView(ElementView, Whitespace):
+    __slots__ = ("_document", "_index")
+
+    kind = kind_property(WHITESPACE_KINDS)
+
+
+# view classes, indexed by type code
+VIEWS = (TextView, FormattedTextView, HeadingView, OtherTextView, ParagraphView,
+         ReferenceView, ChapterNumberView, FootnoteView, WhitespaceView)
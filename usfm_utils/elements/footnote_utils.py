@@ -1,23 +1,66 @@
+import weakref
 
 
 class FootnoteLabel(object):
+    """
+    Labels are immutable values, and identical labels are shared: constructing
+    a label equal to an existing one returns the existing one. Custom labels are
+    only kept while in use, so that parsing arbitrary documents does not grow the
+    set of shared labels without bound
+    """
+    __slots__ = ()
+
     def accept(self, visitor):
         raise NotImplementedError()
 
 
 class AutomaticFootnoteLabel(FootnoteLabel):
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = FootnoteLabel.__new__(cls)
+        return cls._instance
+
     def accept(self, visitor):
         visitor.automatic(self)
 
+    def __reduce__(self):
+        return type(self), ()
+
 
 class NoFootnoteLabel(FootnoteLabel):
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = FootnoteLabel.__new__(cls)
+        return cls._instance
+
     def accept(self, visitor):
         visitor.no_label(self)
 
+    def __reduce__(self):
+        return type(self), ()
+
 
 class CustomFootnoteLabel(FootnoteLabel):
-    def __init__(self, content):
-        self._content = content
+    __slots__ = ("_content", "__weakref__")
+
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, content):
+        key = (cls, content)
+        label = cls._instances.get(key)
+        if label is None:
+            label = FootnoteLabel.__new__(cls)
+            label._content = content
+            label = cls._instances.setdefault(key, label)
+        return label
 
     @property
     def content(self):
@@ -26,6 +69,18 @@ class CustomFootnoteLabel(FootnoteLabel):
     def accept(self, visitor):
         visitor.custom(self)
 
+    def __reduce__(self):
+        return type(self), (self._content,)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self._content == other._content
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._content)
+
 
 class FootnoteLabelVisitor(object):
     def automatic(self, automatic):
@@ -1,17 +1,37 @@
-import enum
+import weakref
+
+from usfm_utils.elements.abstract_elements import NestedEnum
 
 
 class ParagraphLayout(object):
+    """
+    Layouts are immutable values, and identical layouts are shared: constructing
+    a layout equal to an existing one returns the existing one. Left-aligned
+    layouts, whose indents come from the source, are only kept while in use
+    """
+    __slots__ = ()
+
     def accept(self, visitor):
         raise NotImplementedError()
 
 
 class LeftAligned(ParagraphLayout):
-    def __init__(self, first_line_indent=None, left_margin_indent=0):
+    __slots__ = ("_first_line_indent", "_left_margin_indent", "_hash", "__weakref__")
+
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, first_line_indent=None, left_margin_indent=0):
         if first_line_indent is None:
             first_line_indent = LeftAligned.FirstLineIndent.default
-        self._first_line_indent = first_line_indent
-        self._left_margin_indent = left_margin_indent
+        key = (cls, first_line_indent, left_margin_indent)
+        layout = cls._instances.get(key)
+        if layout is None:
+            layout = ParagraphLayout.__new__(cls)
+            layout._first_line_indent = first_line_indent
+            layout._left_margin_indent = left_margin_indent
+            layout._hash = hash((first_line_indent, left_margin_indent))
+            layout = cls._instances.setdefault(key, layout)
+        return layout
 
     @property
     def first_line_indent(self):
@@ -24,21 +44,59 @@ class LeftAligned(ParagraphLayout):
     def accept(self, visitor):
         visitor.left_aligned(self)
 
-    class FirstLineIndent(enum.Enum):
+    def __reduce__(self):
+        return type(self), (self._first_line_indent, self._left_margin_indent)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and \
+            self._first_line_indent == other._first_line_indent and \
+            self._left_margin_indent == other._left_margin_indent
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return self._hash
+
+    class FirstLineIndent(NestedEnum):
         none = 0
         default = 1
         outdent = 2
 
 
 class Centered(ParagraphLayout):
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = ParagraphLayout.__new__(cls)
+        return cls._instance
+
     def accept(self, visitor):
         visitor.centered(self)
 
+    def __reduce__(self):
+        return type(self), ()
+
 
 class RightAligned(ParagraphLayout):
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = ParagraphLayout.__new__(cls)
+        return cls._instance
+
     def accept(self, visitor):
         visitor.right_aligned(self)
 
+    def __reduce__(self):
+        return type(self), ()
+
 
 
 class ParagraphLayoutVisitor(object):
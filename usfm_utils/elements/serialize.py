@@ -0,0 +1,436 @@
+"""
+A compact binary format for documents.
+
+A document is written as two streams of integers, plus its strings:
+- codes: small values (element types, kinds, flags, layouts and footnote labels),
+  one byte each. Kinds and other enum values are written as their index in their
+  enum, with its members in order of name
+- integers: every other value (numbers of children, weights, indents and
+  references to strings), as unsigned 16-bit or (if needed) 32-bit integers
+- strings: each distinct string once, concatenated and encoded as UTF-8. Their
+  lengths (in characters) are the first integers; a string is then referenced by
+  i + 1 for the i-th string, or 0 for None
+
+The streams are laid out as: MAGIC, the format VERSION, the width of the integers,
+then for each of integers, codes and strings its length as a varint and its
+bytes (integers in little-endian order).
+
+Following the strings, the heading of the document is written, then whether it
+has a table of contents and its three fields, then the number of top-level
+elements and the element trees in preorder: each element as its type code, its
+fields, and (for parent elements) its number of children followed by its
+children. Splitting values into two fixed-width streams lets them be decoded
+natively, rather than one at a time in Python. Building the elements still
+takes Python code, so documents load somewhat slower than they unpickle; the
+format is meant to be compact, and safe to load from untrusted sources.
+"""
+import array
+import sys
+
+from usfm_utils.elements.document import Document, TableOfContentsInfo
+from usfm_utils.elements.element_impls import ChapterNumber, Footnote, \
+    FormattedText, Heading, OtherText, Paragraph, Reference, Text, Whitespace
+from usfm_utils.elements.footnote_utils import AutomaticFootnoteLabel, \
+    CustomFootnoteLabel, NoFootnoteLabel
+from usfm_utils.elements.paragraph_utils import Centered, LeftAligned, \
+    RightAligned
+
+MAGIC = b"USFMDOC"
+VERSION = 2
+
+# array typecodes for unsigned 16 and 32-bit integers
+INTEGER_TYPECODES = ("H", "I" if array.array("I").itemsize == 4 else "L")
+
+# element type codes
+TEXT = 0
+FORMATTED_TEXT = 1
+HEADING = 2
+OTHER_TEXT = 3
+PARAGRAPH = 4
+REFERENCE = 5
+CHAPTER_NUMBER = 6
+FOOTNOTE = 7
+WHITESPACE = 8
+
+# paragraph layout codes
+LEFT_ALIGNED = 0
+CENTERED = 1
+RIGHT_ALIGNED = 2
+
+# footnote label codes
+AUTOMATIC_LABEL = 0
+NO_LABEL = 1
+CUSTOM_LABEL = 2
+
+# paragraph flags
+EMBEDDED = 1
+INTRODUCTORY = 2
+POETIC = 4
+CONTINUATION = 8
+
+
+class EnumCodes(object):
+    """
+    Two-way mapping between the members of an enum and small integers. Members
+    are numbered in order of name, as the order in which they are defined is not
+    kept on Python 2
+    """
+    def __init__(self, enum_class):
+        """
+        :param type enum_class: subclass of enum.Enum
+        """
+        self.members = tuple(sorted(enum_class, key=lambda member: member.name))
+        self.codes = dict((member, code) for code, member in enumerate(self.members))
+
+
+FORMATTED_TEXT_KINDS = EnumCodes(FormattedText.Kind)
+HEADING_KINDS = EnumCodes(Heading.Kind)
+OTHER_TEXT_KINDS = EnumCodes(OtherText.Kind)
+REFERENCE_KINDS = EnumCodes(Reference.Kind)
+CHAPTER_NUMBER_KINDS = EnumCodes(ChapterNumber.Kind)
+FOOTNOTE_KINDS = EnumCodes(Footnote.Kind)
+WHITESPACE_KINDS = EnumCodes(Whitespace.Kind)
+FIRST_LINE_INDENTS = EnumCodes(LeftAligned.FirstLineIndent)
+
+
+def dump(document, fp):
+    """
+    :param Document document: document to serialize
+    :param fp: binary file to write to
+    """
+    fp.write(dumps(document))
+
+
+def dumps(document):
+    """
+    :param Document document: document to serialize
+    :rtype: bytes
+    """
+    return Writer().write_document(document)
+
+
+def load(fp):
+    """
+    :param fp: binary file to read from
+    :rtype: Document
+    """
+    return loads(fp.read())
+
+
+def loads(data):
+    """
+    :param bytes data: serialized document
+    :rtype: Document
+    """
+    return Reader(data).read_document()
+
+
+class Writer(object):
+    def __init__(self):
+        self._codes = bytearray()
+        self._integers = array.array(INTEGER_TYPECODES[-1])
+        self._strings = []
+        self._string_refs = {}
+
+    def write_document(self, document):
+        """
+        :param Document document:
+        :rtype: bytes
+        """
+        toc = document.table_of_contents
+        self.write_string(document.heading)
+        if toc is None:
+            self._codes.append(0)
+        else:
+            self._codes.append(1)
+            self.write_string(toc.long_description)
+            self.write_string(toc.short_description)
+            self.write_string(toc.abbreviation)
+        self.write_elements(document.elements)
+
+        integers = array.array(INTEGER_TYPECODES[-1], [len(string) for string in self._strings])
+        integers.extend(self._integers)
+        if len(integers) == 0 or max(integers) <= 0xffff:
+            integers = array.array(INTEGER_TYPECODES[0], integers)
+        if sys.byteorder == "big":
+            integers.byteswap()
+
+        result = bytearray(MAGIC)
+        result.append(VERSION)
+        result.append(integers.itemsize)
+        write_varint(result, len(self._strings))
+        for stream in (to_bytes(integers), self._codes,
+                       u"".join(self._strings).encode("utf-8")):
+            write_varint(result, len(stream))
+            result.extend(stream)
+        return bytes(result)
+
+    def write_string(self, string):
+        """
+        :param str|unicode string: string to write a reference to, or None
+        """
+        if string is None:
+            self._integers.append(0)
+            return
+        ref = self._string_refs.get(string)
+        if ref is None:
+            self._strings.append(string)
+            ref = self._string_refs[string] = len(self._strings)
+        self._integers.append(ref)
+
+    def write_elements(self, elements):
+        self._integers.append(len(elements))
+        for element in elements:
+            self.write_element(element)
+
+    def write_element(self, element):
+        codes = self._codes
+        element_type = type(element)
+        if element_type is Text:
+            codes.append(TEXT)
+            self.write_string(element.content)
+            return
+        elif element_type is FormattedText:
+            codes.append(FORMATTED_TEXT)
+            codes.append(FORMATTED_TEXT_KINDS.codes[element.kind])
+        elif element_type is Paragraph:
+            codes.append(PARAGRAPH)
+            codes.append(EMBEDDED * element.embedded |
+                         INTRODUCTORY * element.introductory |
+                         POETIC * element.poetic |
+                         CONTINUATION * element.continuation)
+            self.write_layout(element.layout)
+        elif element_type is Heading:
+            codes.append(HEADING)
+            codes.append(HEADING_KINDS.codes[element.kind])
+            codes.append(INTRODUCTORY * element.introductory)
+            self._integers.append(element.weight)
+        elif element_type is OtherText:
+            codes.append(OTHER_TEXT)
+            codes.append(OTHER_TEXT_KINDS.codes[element.kind])
+        elif element_type is Reference:
+            codes.append(REFERENCE)
+            codes.append(REFERENCE_KINDS.codes[element.kind])
+        elif element_type is ChapterNumber:
+            codes.append(CHAPTER_NUMBER)
+            codes.append(CHAPTER_NUMBER_KINDS.codes[element.kind])
+        elif element_type is Footnote:
+            codes.append(FOOTNOTE)
+            codes.append(FOOTNOTE_KINDS.codes[element.kind])
+            self.write_label(element.label)
+        elif element_type is Whitespace:
+            codes.append(WHITESPACE)
+            codes.append(WHITESPACE_KINDS.codes[element.kind])
+            return
+        else:
+            raise TypeError("Cannot serialize {}".format(element_type.__name__))
+        self.write_elements(element.children)
+
+    def write_layout(self, layout):
+        layout_type = type(layout)
+        if layout_type is LeftAligned:
+            self._codes.append(LEFT_ALIGNED)
+            self._codes.append(FIRST_LINE_INDENTS.codes[layout.first_line_indent])
+            self._integers.append(layout.left_margin_indent)
+        elif layout_type is Centered:
+            self._codes.append(CENTERED)
+        elif layout_type is RightAligned:
+            self._codes.append(RIGHT_ALIGNED)
+        else:
+            raise TypeError("Cannot serialize {}".format(layout_type.__name__))
+
+    def write_label(self, label):
+        label_type = type(label)
+        if label_type is AutomaticFootnoteLabel:
+            self._codes.append(AUTOMATIC_LABEL)
+        elif label_type is NoFootnoteLabel:
+            self._codes.append(NO_LABEL)
+        elif label_type is CustomFootnoteLabel:
+            self._codes.append(CUSTOM_LABEL)
+            self.write_string(label.content)
+        else:
+            raise TypeError("Cannot serialize {}".format(label_type.__name__))
+
+
+class Reader(object):
+    def __init__(self, data):
+        """
+        :param bytes data: serialized document
+        """
+        self._data = bytearray(data)
+        self._index = 0
+        self._code = None
+        self._integer = None
+        self._strings = None
+
+    def read_document(self):
+        """
+        :rtype: Document
+        """
+        data = self._data
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a serialized document")
+        try:
+            version, itemsize = data[len(MAGIC)], data[len(MAGIC) + 1]
+            if version != VERSION:
+                raise ValueError("Unsupported version {}".format(version))
+            typecodes = [typecode for typecode in INTEGER_TYPECODES
+                         if array.array(typecode).itemsize == itemsize]
+            if not typecodes:
+                raise ValueError("Unsupported integer width {}".format(itemsize))
+            self._index = len(MAGIC) + 2
+            num_strings = self.read_varint()
+
+            integers = array.array(typecodes[0])
+            from_bytes(integers, self.read_stream())
+            codes = self.read_stream()
+            text = self.read_stream().decode("utf-8")
+        except IndexError:
+            raise ValueError("Truncated document")
+        if sys.byteorder == "big":
+            integers.byteswap()
+        if self._index != len(data):
+            raise ValueError("Trailing data after document")
+
+        integers = iter(integers)
+        self._integer = getattr(integers, "__next__", None) or integers.next
+        # iterating over bytes yields 1-character strings on Python 2
+        codes = iter(bytearray(codes))
+        self._code = getattr(codes, "__next__", None) or codes.next
+        strings = [None]
+        offset = 0
+        for _ in range(num_strings):
+            length = self._integer()
+            strings.append(text[offset:offset + length])
+            offset += length
+        self._strings = strings
+
+        try:
+            heading = self.read_string()
+            toc = None
+            if self._code():
+                toc = TableOfContentsInfo(long_description=self.read_string(),
+                                          short_description=self.read_string(),
+                                          abbreviation=self.read_string())
+            elements = self.read_elements()
+        except (StopIteration, IndexError):
+            raise ValueError("Truncated document")
+        return Document(elements, heading=heading, table_of_contents=toc)
+
+    def read_varint(self):
+        data = self._data
+        result = 0
+        shift = 0
+        while True:
+            byte = data[self._index]
+            self._index += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_stream(self):
+        length = self.read_varint()
+        start = self._index
+        self._index += length
+        if self._index > len(self._data):
+            raise ValueError("Truncated document")
+        return bytes(self._data[start:self._index])
+
+    def read_string(self):
+        return self._strings[self._integer()]
+
+    def read_elements(self):
+        return [self.read_element() for _ in range(self._integer())]
+
+    def read_element(self):
+        code = self._code
+        element_type = code()
+        if element_type == TEXT:
+            return Text(self._strings[self._integer()])
+        elif element_type == FORMATTED_TEXT:
+            kind = FORMATTED_TEXT_KINDS.members[code()]
+            return FormattedText(kind, self.read_elements())
+        elif element_type == PARAGRAPH:
+            flags = code()
+            layout = self.read_layout()
+            return Paragraph(self.read_elements(),
+                             layout=layout,
+                             embedded=bool(flags & EMBEDDED),
+                             introductory=bool(flags & INTRODUCTORY),
+                             poetic=bool(flags & POETIC),
+                             continuation=bool(flags & CONTINUATION))
+        elif element_type == HEADING:
+            kind = HEADING_KINDS.members[code()]
+            introductory = bool(code() & INTRODUCTORY)
+            weight = self._integer()
+            return Heading(kind, self.read_elements(), weight=weight,
+                           introductory=introductory)
+        elif element_type == OTHER_TEXT:
+            kind = OTHER_TEXT_KINDS.members[code()]
+            return OtherText(kind, self.read_elements())
+        elif element_type == REFERENCE:
+            kind = REFERENCE_KINDS.members[code()]
+            return Reference(kind, self.read_elements())
+        elif element_type == CHAPTER_NUMBER:
+            kind = CHAPTER_NUMBER_KINDS.members[code()]
+            return ChapterNumber(kind, self.read_elements())
+        elif element_type == FOOTNOTE:
+            kind = FOOTNOTE_KINDS.members[code()]
+            label = self.read_label()
+            return Footnote(kind, self.read_elements(), label)
+        elif element_type == WHITESPACE:
+            return Whitespace(WHITESPACE_KINDS.members[code()])
+        raise ValueError("Unknown element type {}".format(element_type))
+
+    def read_layout(self):
+        layout_type = self._code()
+        if layout_type == LEFT_ALIGNED:
+            first_line_indent = FIRST_LINE_INDENTS.members[self._code()]
+            return LeftAligned(first_line_indent, self._integer())
+        elif layout_type == CENTERED:
+            return Centered()
+        elif layout_type == RIGHT_ALIGNED:
+            return RightAligned()
+        raise ValueError("Unknown paragraph layout {}".format(layout_type))
+
+    def read_label(self):
+        label_type = self._code()
+        if label_type == AUTOMATIC_LABEL:
+            return AutomaticFootnoteLabel()
+        elif label_type == NO_LABEL:
+            return NoFootnoteLabel()
+        elif label_type == CUSTOM_LABEL:
+            return CustomFootnoteLabel(self.read_string())
+        raise ValueError("Unknown footnote label {}".format(label_type))
+
+
+def write_varint(buffer, value):
+    """
+    Appends an unsigned LEB128 varint to buffer
+    :param bytearray buffer:
+    :param int value: non-negative integer
+    """
+    while value >= 0x80:
+        buffer.append(value & 0x7f | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def to_bytes(integers):
+    """
+    :param array.array integers:
+    :rtype: bytes
+    """
+    return integers.tobytes() if hasattr(integers, "tobytes") else integers.tostring()
+
+
+def from_bytes(integers, data):
+    """
+    :param array.array integers: array to extend
+    :param bytes data:
+    """
+    if hasattr(integers, "frombytes"):
+        integers.frombytes(data)
+    else:
+        integers.fromstring(data)
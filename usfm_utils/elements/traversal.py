@@ -0,0 +1,152 @@
+"""
+Traversal of element trees without recursion.
+
+walk(elements, visitor) calls the same visitor methods, in the same order, as
+calling accept(visitor) on each of the elements, but visits the trees with an
+explicit stack instead of recursive accept and visit_children calls. Visitor
+methods are looked up in a table computed once per visitor class, which leaves
+out the methods the class does not override from ElementVisitor (which do
+nothing), so they are not called at all.
+
+Elements whose class overrides the accept method of the element class it
+derives from are visited through their accept method instead.
+"""
+from usfm_utils.elements.element_impls import ChapterNumber, Footnote, \
+    FormattedText, Heading, OtherText, Paragraph, Reference, Text, Whitespace
+from usfm_utils.elements.element_visitor import ElementVisitor
+
+# names of the visitor methods called for each element class: the method called
+# for elements without children, or the methods called before and after the
+# children of parent elements
+VISITOR_METHODS = {
+    Text: ("text",),
+    Whitespace: ("whitespace",),
+    FormattedText: ("before_formatted_text", "after_formatted_text"),
+    Heading: ("before_heading", "after_heading"),
+    OtherText: ("before_other", "after_other"),
+    Paragraph: ("before_paragraph", "after_paragraph"),
+    Reference: ("before_reference", "after_reference"),
+    ChapterNumber: ("before_chapter_no", "after_chapter_no"),
+    Footnote: ("before_footnote", "after_footnote"),
+}
+
+# dispatch tables, by visitor class
+_tables = {}
+
+
+def walk(elements, visitor):
+    """
+    Visits element trees, as calling accept(visitor) on each of them would
+    :param Iterable[Element] elements: roots of the trees to visit
+    :param ElementVisitor visitor:
+    """
+    table = dispatch_table(type(visitor))
+    get_entry = table.get
+    # the iterators over the children of the elements being visited, and the
+    # elements themselves with their "after" methods
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    children = iter(elements)
+    while True:
+        for element in children:
+            entry = get_entry(type(element))
+            if entry is None:
+                entry = table.resolve(type(element))
+            leaf, method, after = entry
+            if leaf:
+                if method is not None:
+                    method(visitor, element)
+                elif after:
+                    element.accept(visitor)
+                continue
+            if method is not None:
+                method(visitor, element)
+            push((children, element, after))
+            children = iter(element.children)
+            break
+        else:
+            if not stack:
+                return
+            children, element, after = pop()
+            if after is not None:
+                after(visitor, element)
+
+
+def dispatch_table(visitor_class):
+    """
+    :param type visitor_class:
+    :return: the dispatch table of visitor_class, computed on first use
+    :rtype: DispatchTable
+    """
+    table = _tables.get(visitor_class)
+    if table is None:
+        table = _tables.setdefault(visitor_class, DispatchTable(visitor_class))
+    return table
+
+
+# entry of element classes visited through their accept method
+ACCEPT = (True, None, True)
+
+
+class DispatchTable(dict):
+    """
+    Entries (see DispatchTable.entry) of a visitor class, by element class
+    """
+    def __init__(self, visitor_class):
+        """
+        :param type visitor_class:
+        """
+        dict.__init__(self)
+        self._visitor_class = visitor_class
+        for element_class in VISITOR_METHODS:
+            self[element_class] = self.entry(element_class)
+
+    def method(self, name):
+        """
+        :return: the visitor class's method of the given name, as a plain
+        function, or None if it is ElementVisitor's
+        """
+        method = getattr(self._visitor_class, name, None)
+        if method is None:
+            # looked up on the visitor when called, so that visitors lacking the
+            # method only fail on elements that need it, as with accept
+            return lambda visitor, element: getattr(visitor, name)(element)
+        function = plain_function(method)
+        if function is plain_function(getattr(ElementVisitor, name, None)):
+            return None
+        return function
+
+    def entry(self, element_class):
+        """
+        :return: (whether element_class is a leaf, its method (the "before" method
+        of parents), and the "after" method of parents, or for leaves whether to
+        visit them through their accept method)
+        :rtype: (bool, function, function|bool)
+        """
+        names = VISITOR_METHODS[element_class]
+        if len(names) == 1:
+            return True, self.method(names[0]), False
+        return False, self.method(names[0]), self.method(names[1])
+
+    def resolve(self, element_class):
+        """
+        :param type element_class: a class of elements without an entry yet
+        :return: the entry of element_class, which is also added to the table
+        :rtype: tuple
+        """
+        entry = ACCEPT
+        for base in element_class.__mro__:
+            if base in VISITOR_METHODS:
+                if plain_function(element_class.accept) is plain_function(base.accept):
+                    entry = self[base]
+                break
+        self[element_class] = entry
+        return entry
+
+
+def plain_function(method):
+    """
+    :return: the function of method, if it is an (unbound) method
+    """
+    return getattr(method, "__func__", method)
@@ -1 +1,3 @@
 from usfm_utils.html.html_visitor import HtmlVisitor
+from usfm_utils.html.html_stream import HtmlStreamWriter, write_html_stream
+from usfm_utils.html.html_pages import split_chapters, write_pages
@@ -0,0 +1,150 @@
+"""
+Rendering to HTML for asyncio servers (Python 3.5+).
+
+Parsing and rendering are CPU-bound, so they do not run on the event loop, but
+in an executor, one step at a time: each step renders up to the next chunk of
+output (a chapter, when streaming a USFM source, or a full buffer, see
+OutputBuffer). The event loop writes each chunk to an asyncio.StreamWriter (or
+any object with write(bytes) and a drain() coroutine), and the next chunk is
+rendered while it drains.
+
+A response therefore never holds more than two chunks (the one being drained,
+and the next), and renders no faster than its client reads. As no step holds an
+executor thread for more than one chunk, and an executor runs steps in the order
+they are submitted, concurrent responses take turns, and each of them gets its
+first bytes out early, however many there are.
+"""
+import asyncio
+
+from usfm_utils.html.html_buffer import DEFAULT_BUFFER_SIZE
+from usfm_utils.html.html_stream import HtmlStreamWriter
+from usfm_utils.html.html_visitor import HtmlVisitor
+
+# the event loop running the current coroutine (get_running_loop is Python 3.7+)
+_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+async def write_html_async(text, writer, parser=None, executor=None, **kwargs):
+    """
+    Parses and renders a USFM source to UTF-8 HTML, writing each chapter to writer
+    as soon as it is parsed. See HtmlStreamWriter
+    :param str text: USFM source
+    :param asyncio.StreamWriter writer: where the HTML is written
+    :param UsfmParser parser: parser to parse text with, the default one if None
+    :param concurrent.futures.Executor executor: executor to parse and render in,
+    the event loop's default one if None
+    :param kwargs: arguments for HtmlStreamWriter, other than encoding
+    """
+    await write_async(html_chunks(text, parser=parser, **kwargs), writer,
+                      executor=executor)
+
+
+async def write_document_async(document, writer, executor=None, stylesheets=(),
+                               buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Renders a document to UTF-8 HTML, in chunks of about buffer_size characters
+    :param Document document:
+    :param asyncio.StreamWriter writer: where the HTML is written
+    :param concurrent.futures.Executor executor: executor to render in, the event
+    loop's default one if None
+    :param iterable[str] stylesheets: filenames for stylesheets
+    :param int buffer_size: number of characters of each chunk
+    """
+    chunks = document_chunks(document, stylesheets=stylesheets, buffer_size=buffer_size)
+    await write_async(chunks, writer, executor=executor)
+
+
+async def write_async(chunks, writer, executor=None):
+    """
+    Writes chunks to writer, producing each of them in executor while the previous
+    one drains
+    :param iterable[bytes] chunks: e.g. a generator rendering a chunk at a time
+    :param asyncio.StreamWriter writer: where the chunks are written
+    :param concurrent.futures.Executor executor: executor to produce chunks in, the
+    event loop's default one if None
+    """
+    loop = _running_loop()
+    chunks = iter(chunks)
+    pending = loop.run_in_executor(executor, next, chunks, None)
+    try:
+        while True:
+            chunk = await pending
+            if chunk is None:
+                break
+            writer.write(chunk)
+            pending = loop.run_in_executor(executor, next, chunks, None)
+            await writer.drain()
+    except BaseException:
+        pending.cancel()
+        raise
+
+
+def html_chunks(text, parser=None, **kwargs):
+    """
+    Parses and renders a USFM source to UTF-8 HTML, a chapter at a time. See
+    HtmlStreamWriter
+    :param str text: USFM source
+    :param UsfmParser parser: parser to parse text with, the default one if None
+    :param kwargs: arguments for HtmlStreamWriter, other than encoding
+    :return: chunks of HTML, as they are written out
+    :rtype: iterable[bytes]
+    """
+    if parser is None:
+        from usfm_utils.usfm.parse import UsfmParser
+        parser = UsfmParser.create()
+    output = ChunkList()
+    stream_writer = HtmlStreamWriter(output, encoding="utf-8", **kwargs)
+    stream = parser.iter_elements(text)
+    for element in stream:
+        if not stream_writer.started:
+            stream_writer.start(stream.heading)
+        stream_writer.add(element)
+        if output:
+            yield output.take()
+    stream_writer.finish()
+    if output:
+        yield output.take()
+
+
+def document_chunks(document, stylesheets=(), buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Renders a document to UTF-8 HTML, a top-level element at a time
+    :param Document document:
+    :param iterable[str] stylesheets: filenames for stylesheets
+    :param int buffer_size: number of characters of each chunk
+    :return: chunks of HTML, as they are written out
+    :rtype: iterable[bytes]
+    """
+    output = ChunkList()
+    visitor = HtmlVisitor(output, stylesheets=stylesheets, buffer_size=buffer_size,
+                          encoding="utf-8")
+    visitor.write_header(document.heading)
+    for element in document.elements:
+        visitor.write_elements((element,))
+        if output:
+            yield output.take()
+    visitor.write_footnotes()
+    visitor.write_footer()
+    visitor.flush()
+    if output:
+        yield output.take()
+
+
+class ChunkList(list):
+    """
+    A file-like list collecting the chunks written to it
+    """
+    def write(self, chunk):
+        """
+        :param bytes chunk:
+        """
+        self.append(chunk)
+
+    def take(self):
+        """
+        :return: the chunks written since the last call, joined
+        :rtype: bytes
+        """
+        chunk = b"".join(self)
+        del self[:]
+        return chunk
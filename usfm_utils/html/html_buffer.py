@@ -0,0 +1,50 @@
+"""
+Buffering of rendered output.
+
+Renderers produce output as many small fragments (tags, and the text between
+them). An OutputBuffer collects them in a list and writes them to its file as
+one joined chunk whenever the buffered fragments reach a number of characters,
+so that the file sees a few large writes instead of one per fragment.
+"""
+from __future__ import unicode_literals
+
+# number of buffered characters at which an OutputBuffer writes to its file
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+class OutputBuffer(object):
+    def __init__(self, writable_file, buffer_size=DEFAULT_BUFFER_SIZE, encoding=None):
+        """
+        :param file writable_file: file to write to
+        :param int buffer_size: number of buffered characters at which they are
+        written to the file
+        :param str encoding: if not None, chunks are encoded (e.g. "utf-8") before
+        they are written, for files that take bytes
+        """
+        self._file = writable_file
+        self._buffer_size = buffer_size
+        self._encoding = encoding
+        self._fragments = []
+        self._size = 0
+
+    def write(self, s):
+        """
+        :param str|unicode s: fragment of output
+        """
+        self._fragments.append(s)
+        self._size += len(s)
+        if self._size >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered fragments to the file, as one chunk
+        """
+        if not self._fragments:
+            return
+        chunk = "".join(self._fragments)
+        del self._fragments[:]
+        self._size = 0
+        if self._encoding is not None:
+            chunk = chunk.encode(self._encoding)
+        self._file.write(chunk)
@@ -0,0 +1,243 @@
+"""
+Rendering of a document to one HTML page per chapter, in parallel.
+
+A document is cut before each standard ChapterNumber; elements preceding the
+first chapter (titles, introduction) make a page of their own. Each page holds
+its chapter and the footnotes of that chapter. Chapter pages are named after
+their position in the book, as chapter labels (e.g. "Psalm 1", from a \\cl
+marker) are arbitrary text.
+
+A serial render numbers footnotes throughout the document, so the first
+footnote of a chapter depends on every chapter before it. A prepass counts the
+footnotes of each chapter, which gives each page the number of its first
+footnote, so that pages can be rendered independently (in a pool of worker
+processes), and still be byte-identical to those of a serial render.
+
+Alongside the pages, an index page lists the book, from its
+TableOfContentsInfo, and links to each page.
+"""
+from __future__ import unicode_literals
+
+import io
+import multiprocessing
+import os
+
+from usfm_utils.elements import serialize
+from usfm_utils.elements.document import Document
+from usfm_utils.elements.element_impls import ChapterNumber
+from usfm_utils.elements.element_visitor import ElementVisitor
+from usfm_utils.elements.traversal import walk
+from usfm_utils.html.html_utils import open_tag, close_tag, escape
+from usfm_utils.html.html_visitor import HtmlVisitor, html_header, html_footer
+
+INDEX_FILENAME = "index.html"
+INTRODUCTION_FILENAME = "introduction.html"
+
+
+class Page(object):
+    """
+    A part of a document rendered to its own HTML file
+    """
+    def __init__(self, chapter, elements, first_footnote_id, number=None):
+        """
+        :param str|unicode chapter: label of the chapter, None for the elements
+        preceding the first chapter
+        :param list[Element] elements: the elements of the page
+        :param int first_footnote_id: number of the first footnote of the page
+        :param int number: position of the chapter in the book, from 1, None for
+        the elements preceding the first chapter
+        """
+        self._chapter = chapter
+        self._elements = elements
+        self._first_footnote_id = first_footnote_id
+        self._number = number
+
+    @property
+    def chapter(self):
+        """
+        :return: label of the chapter (e.g. "1", or "Psalm 1")
+        :rtype: str|unicode
+        """
+        return self._chapter
+
+    @property
+    def number(self):
+        """
+        :rtype: int
+        """
+        return self._number
+
+    @property
+    def elements(self):
+        """
+        :rtype: list[Element]
+        """
+        return self._elements
+
+    @property
+    def first_footnote_id(self):
+        """
+        :rtype: int
+        """
+        return self._first_footnote_id
+
+    @property
+    def filename(self):
+        """
+        :rtype: str|unicode
+        """
+        if self._number is None:
+            return INTRODUCTION_FILENAME
+        return "chapter_{}.html".format(self._number)
+
+    def title(self, heading):
+        """
+        :param str|unicode heading: heading of the document, or None
+        :return: title of the page
+        :rtype: str|unicode
+        """
+        if heading is None:
+            return self._chapter
+        if self._chapter is None:
+            return heading
+        return "{} {}".format(heading, self._chapter)
+
+
+def split_chapters(document):
+    """
+    Cuts a document into pages at its (standard) chapter numbers, numbering their
+    footnotes as a serial render of the document would
+    :param Document document:
+    :rtype: list[Page]
+    """
+    parts = [(None, [])]
+    for element in document.elements:
+        if isinstance(element, ChapterNumber) and element.kind == ChapterNumber.Kind.standard:
+            parts.append((text_content(element), []))
+        parts[-1][1].append(element)
+    if not parts[0][1]:
+        del parts[0]
+    pages = []
+    counter = FootnoteCounter()
+    number = 0
+    for chapter, elements in parts:
+        if chapter is not None:
+            number += 1
+        pages.append(Page(chapter, elements, counter.count + 1,
+                          None if chapter is None else number))
+        walk(elements, counter)
+    return pages
+
+
+def write_pages(document, directory, workers=None, stylesheets=()):
+    """
+    Renders a document to one UTF-8 HTML file per chapter, and an index page
+    :param Document document:
+    :param str|unicode directory: existing directory to write the files to
+    :param int workers: number of worker processes, the number of CPUs if None.
+    With a single worker, pages are rendered in the calling process
+    :param iterable[str|unicode] stylesheets: filenames for stylesheets
+    :return: paths of the written pages, in document order, followed by the path
+    of the index page
+    :rtype: list[str|unicode]
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    pages = split_chapters(document)
+    stylesheets = tuple(stylesheets)
+    heading = document.heading
+    if workers <= 1:
+        paths = [write_page(os.path.join(directory, page.filename), page.title(heading),
+                            page.elements, page.first_footnote_id, stylesheets)
+                 for page in pages]
+    else:
+        # pages are sent to workers serialized, which is more compact and quicker
+        # to load than a pickled element tree
+        tasks = [(os.path.join(directory, page.filename), page.title(heading),
+                  serialize.dumps(Document(page.elements)), page.first_footnote_id,
+                  stylesheets)
+                 for page in pages]
+        pool = multiprocessing.Pool(workers)
+        try:
+            paths = pool.map(write_serialized_page, tasks)
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+    index_path = os.path.join(directory, INDEX_FILENAME)
+    with io.open(index_path, "w", encoding="utf-8") as index_file:
+        index_file.write(render_index(document, pages, stylesheets))
+    paths.append(index_path)
+    return paths
+
+
+def write_page(path, title, elements, first_footnote_id, stylesheets=()):
+    """
+    :return: path
+    :rtype: str|unicode
+    """
+    with io.open(path, "wb") as page_file:
+        visitor = HtmlVisitor(page_file, stylesheets=stylesheets, encoding="utf-8",
+                              first_footnote_id=first_footnote_id)
+        visitor.write(Document(elements, heading=title))
+    return path
+
+
+def write_serialized_page(task):
+    """
+    :param (str|unicode, str|unicode, bytes, int, tuple) task: path, title,
+    serialized elements, first footnote id and stylesheets of a page
+    :rtype: str|unicode
+    """
+    path, title, data, first_footnote_id, stylesheets = task
+    elements = serialize.loads(data).elements
+    return write_page(path, title, elements, first_footnote_id, stylesheets)
+
+
+def render_index(document, pages, stylesheets=()):
+    """
+    :param Document document:
+    :param list[Page] pages: pages of the document
+    :param iterable[str|unicode] stylesheets: filenames for stylesheets
+    :return: an HTML page describing the document and linking to its pages
+    :rtype: str|unicode
+    """
+    fragments = [html_header(title=document.heading, stylesheets=stylesheets)]
+    toc = document.table_of_contents
+    if toc is not None:
+        for clazz, value in (("long_description", toc.long_description),
+                             ("short_description", toc.short_description),
+                             ("abbreviation", toc.abbreviation)):
+            if value is not None:
+                fragments.append("{}{}{}".format(open_tag("p", clazz=clazz), escape(value),
+                                                 close_tag("p")))
+    fragments.append(open_tag("ul", clazz="chapters"))
+    for page in pages:
+        label = "Introduction" if page.chapter is None else page.chapter
+        fragments.append("<li><a href=\"{}\">{}</a></li>".format(escape(page.filename),
+                                                                 escape(label)))
+    fragments.append(close_tag("ul"))
+    fragments.append(html_footer())
+    return "".join(fragments)
+
+
+def text_content(element):
+    """
+    :return: the text of an element and its descendants
+    :rtype: str|unicode
+    """
+    content = getattr(element, "content", None)
+    if content is not None:
+        return content
+    return "".join(text_content(child) for child in getattr(element, "children", ()))
+
+
+class FootnoteCounter(ElementVisitor):
+    """
+    Counts footnotes (nested ones included), as HtmlVisitor numbers them
+    """
+    def __init__(self):
+        self.count = 0
+
+    def before_footnote(self, footnote):
+        self.count += 1
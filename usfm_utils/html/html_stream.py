@@ -0,0 +1,144 @@
+"""
+Streaming HTML rendering.
+
+An HtmlStreamWriter renders elements as they are parsed, instead of a whole
+Document: the header is written when the first element arrives, and each
+chapter's HTML is written out as soon as the chapter is complete (that is, when
+the next chapter starts). Footnotes are written either after each chapter, or
+all at the end of the document.
+
+Together with UsfmParser.iter_elements, which yields elements as soon as they
+are parsed, only the chapter being rendered is kept in memory (and, with
+footnotes at the end, the footnotes of the document).
+"""
+from __future__ import unicode_literals
+
+import enum
+
+from usfm_utils.elements.element_impls import ChapterNumber
+from usfm_utils.html.html_buffer import DEFAULT_BUFFER_SIZE
+from usfm_utils.html.html_visitor import HtmlVisitor
+
+
+class HtmlStreamWriter(object):
+    def __init__(self, writable_file, stylesheets=(), footnotes=None,
+                 buffer_size=DEFAULT_BUFFER_SIZE, encoding=None):
+        """
+        :param file writable_file: file to write to
+        :param iterable[str|unicode] stylesheets: filenames for stylesheets
+        :param HtmlStreamWriter.Footnotes footnotes: where footnotes are written,
+        after each chapter by default
+        :param int buffer_size: number of characters of output that are buffered
+        before they are written, within a chapter (see OutputBuffer)
+        :param str encoding: if not None, the output is encoded (e.g. "utf-8") and
+        written to writable_file as bytes
+        """
+        self._file = writable_file
+        self._footnotes = HtmlStreamWriter.Footnotes.per_chapter if footnotes is None \
+            else footnotes
+        self._visitor = HtmlVisitor(writable_file, stylesheets=stylesheets,
+                                    buffer_size=buffer_size, encoding=encoding)
+        self._started = False
+        self._finished = False
+
+    @property
+    def started(self):
+        """
+        :return: whether the header has been written
+        :rtype: bool
+        """
+        return self._started
+
+    def write_text(self, text, parser=None):
+        """
+        Parses and renders a USFM source, writing out each chapter as soon as it
+        is parsed
+        :param str|unicode text: USFM source
+        :param UsfmParser parser: parser to parse text with, the default one if None
+        """
+        if parser is None:
+            from usfm_utils.usfm.parse import UsfmParser
+            parser = UsfmParser.create()
+        self.write_stream(parser.iter_elements(text))
+
+    def write_stream(self, stream):
+        """
+        Renders a stream of elements, then finishes the document
+        :param ElementStream stream: e.g. from UsfmParser.iter_elements, whose
+        heading is the title of the page
+        """
+        for element in stream:
+            if not self._started:
+                self.start(stream.heading)
+            self.add(element)
+        if not self._started:
+            self.start(stream.heading)
+        self.finish()
+
+    def start(self, title=None):
+        """
+        Writes the header, and writes it out
+        :param str|unicode title: title of the page
+        """
+        if self._started:
+            raise ValueError("Already started")
+        self._started = True
+        self._visitor.write_header(title)
+        self.flush()
+
+    def add(self, element):
+        """
+        Renders a top-level element. When it starts a chapter, the previous
+        chapter is complete, and is written out first
+        :param Element element:
+        """
+        if not self._started:
+            self.start()
+        if isinstance(element, ChapterNumber) and element.kind == ChapterNumber.Kind.standard:
+            self.end_chapter()
+        self._visitor.write_elements((element,))
+
+    def end_chapter(self):
+        """
+        Writes out everything rendered so far, with the footnotes if they are
+        written per chapter
+        """
+        if self._footnotes == HtmlStreamWriter.Footnotes.per_chapter:
+            self._visitor.write_footnotes()
+        self.flush()
+
+    def finish(self):
+        """
+        Writes the footnotes not written yet and the footer, and writes them out
+        """
+        if self._finished:
+            return
+        if not self._started:
+            self.start()
+        self._finished = True
+        self._visitor.write_footnotes()
+        self._visitor.write_footer()
+        self.flush()
+
+    def flush(self):
+        self._visitor.flush()
+        flush = getattr(self._file, "flush", None)
+        if flush is not None:
+            flush()
+
+    @enum.unique
+    class Footnotes(enum.Enum):
+        per_chapter = 0
+        at_end = 1
+
+
+def write_html_stream(text, writable_file, parser=None, **kwargs):
+    """
+    Parses and renders a USFM source to HTML, writing out each chapter as soon
+    as it is parsed. See HtmlStreamWriter
+    :param str|unicode text: USFM source
+    :param file writable_file: file to write to
+    :param UsfmParser parser: parser to parse text with, the default one if None
+    :param kwargs: arguments for HtmlStreamWriter
+    """
+    HtmlStreamWriter(writable_file, **kwargs).write_text(text, parser=parser)
@@ -1,3 +1,20 @@
+def escape(s):
+    """
+    Escapes text for HTML content or (double-quoted) attribute values. Most text
+    needs no escaping, and is returned as is after a quick check for each
+    character to escape; only the characters it contains are then replaced
+    :param str|unicode s:
+    :rtype: str|unicode
+    """
+    if "&" in s:
+        s = s.replace("&", "&amp;")
+    if "<" in s:
+        s = s.replace("<", "&lt;")
+    if ">" in s:
+        s = s.replace(">", "&gt;")
+    if "\"" in s:
+        s = s.replace("\"", "&quot;")
+    return s
 
 
 def add_class(attributes, clazz):
@@ -15,7 +32,7 @@ def open_tag(name, clazz=None, classes=None, **attributes):
     if len(attributes) == 0:
         return "<{}>".format(name)
     return "<{} {}>".format(name, " ".join(
-        attr + "=\"" + val + "\"" for attr, val in attributes.items()))
+        attr + "=\"" + escape(val) + "\"" for attr, val in attributes.items()))
 
 
 def close_tag(name):
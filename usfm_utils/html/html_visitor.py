@@ -7,52 +7,120 @@ from usfm_utils.elements.element_impls import FormattedText, ChapterNumber, \
     Whitespace
 from usfm_utils.elements.element_visitor import ElementVisitor
 from usfm_utils.elements.paragraph_utils import ParagraphLayoutVisitor
+from usfm_utils.elements.traversal import walk
+from usfm_utils.html.html_buffer import DEFAULT_BUFFER_SIZE, OutputBuffer
 from usfm_utils.html.html_utils import open_tag, close_tag, open_span, \
-    close_span, add_class
+    close_span, add_class, escape
+from usfm_utils.stats import CountingWriter
 
 
 class HtmlVisitor(ElementVisitor):
-    def __init__(self, writable_file, stylesheets=()):
+    def __init__(self, writable_file, stylesheets=(), stats=None,
+                 buffer_size=DEFAULT_BUFFER_SIZE, encoding=None, first_footnote_id=1):
         """
         :param file writable_file: file to write to
         :param iterable[str|unicode] stylesheets: filenames for stylesheets
+        :param Stats stats: if not None, records the time spent rendering, and the
+        number of bytes written
+        :param int buffer_size: number of characters of output that are buffered
+        before they are written to writable_file (see OutputBuffer)
+        :param str encoding: if not None, the output is encoded (e.g. "utf-8") and
+        written to writable_file as bytes
+        :param int first_footnote_id: number of the first footnote rendered, for
+        rendering part of a document as a serial render of all of it would
         """
-        self._file = writable_file
+        if stats is not None:
+            writable_file = CountingWriter(writable_file, stats)
+        self._output = OutputBuffer(writable_file, buffer_size=buffer_size,
+                                    encoding=encoding)
         self._stylesheets = stylesheets
+        self._stats = stats
+
+        # where recorded output goes: the output, or the innermost footnote
+        self._record = self._output.write
 
         # footnotes
-        self._next_footnote_id = 1
+        self._next_footnote_id = first_footnote_id
         self._accumulated_footnotes = []
         self._current_footnotes = []
 
         # paragraphs
         self._layout_visitor = HtmlVisitor.HtmlParagraphLayoutVisitor()
 
+        # tags, computed once for each combination of the fields they depend on.
+        # Paragraph tags are keyed on the value of the layout (e.g. LeftAligned
+        # compares and hashes by its indents)
+        self._paragraph_tags = {}
+        self._chapter_no_tags = {}
+        self._formatted_text_tags = {}
+        self._heading_tags = {}
+        self._other_tags = {}
+
     def write(self, document):
         """
         :param Document document:
         :return:
         """
-        self._file.write(html_header(title=document.heading,
-                                     stylesheets=self._stylesheets))
-        for element in document.elements:
-            element.accept(self)
+        if self._stats is not None:
+            with self._stats.timer("render"):
+                self._write_document(document)
+        else:
+            self._write_document(document)
+
+    def _write_document(self, document):
+        self.write_header(document.heading)
+        self.write_elements(document.elements)
         self.write_footnotes()
-        self._file.write(html_footer())
+        self.write_footer()
+        self.flush()
+
+    def write_header(self, title):
+        """
+        :param str|unicode title: title of the page, e.g. the heading of the document
+        """
+        self._output.write(html_header(title=title, stylesheets=self._stylesheets))
+
+    def write_elements(self, elements):
+        """
+        Renders elements, whose footnotes are kept until write_footnotes
+        :param Iterable[Element] elements:
+        """
+        walk(elements, self)
+
+    def write_footer(self):
+        self._output.write(html_footer())
+
+    def flush(self):
+        """
+        Writes all buffered output to the file
+        """
+        self._output.flush()
 
     def record(self, s):
-        if len(self._current_footnotes) == 0:
-            self._file.write(s)
-        else:
-            current_footnote = self._current_footnotes[-1]
-            current_footnote.write(s)
+        self._record(s)
 
     def write_footnotes(self):
+        """
+        Renders the footnotes of the elements rendered so far
+        """
         for entry in self._accumulated_footnotes:
             self.record(entry.content)
         self._accumulated_footnotes = []
 
     def before_paragraph(self, paragraph):
+        key = (paragraph.layout, paragraph.embedded, paragraph.introductory,
+               paragraph.poetic, paragraph.continuation)
+        tag = self._paragraph_tags.get(key)
+        if tag is None:
+            tag = self._paragraph_tags[key] = self.paragraph_tag(paragraph)
+        self.record(tag)
+
+    def paragraph_tag(self, paragraph):
+        """
+        :param Paragraph paragraph:
+        :return: the opening tag of paragraph
+        :rtype: str|unicode
+        """
         paragraph.layout.accept(self._layout_visitor)
         attributes = self._layout_visitor.attributes
         if paragraph.embedded:
@@ -63,23 +131,35 @@ class HtmlVisitor(ElementVisitor):
             add_class(attributes, "poetic")
         if paragraph.continuation:
             add_class(attributes, "continuation")
-        self.record(open_tag("p", **attributes))
+        return open_tag("p", **attributes)
 
     def after_paragraph(self, paragraph):
-        self.record(close_tag("p"))
+        self.record("</p>")
 
     def before_chapter_no(self, chapter_no):
         kind = chapter_no.kind
+        tag = self._chapter_no_tags.get(kind)
+        if tag is None:
+            tag = self._chapter_no_tags[kind] = self.chapter_no_tag(kind)
+        self.record(tag)
+
+    @staticmethod
+    def chapter_no_tag(kind):
+        """
+        :param ChapterNumber.Kind kind:
+        :return: the opening tag of chapter numbers of the given kind
+        :rtype: str|unicode
+        """
         if kind == ChapterNumber.Kind.standard:
-            self.record(open_span(clazz="chapter_no"))
+            return open_span(clazz="chapter_no")
         elif kind == ChapterNumber.Kind.alternate:
-            self.record(open_span(classes=["chapter_no", "alt_chapter_no"]))
+            return open_span(classes=["chapter_no", "alt_chapter_no"])
         else:
             msg = "Unknown chapter number kind: {}".format(kind)
             raise ValueError(msg)
 
     def after_chapter_no(self, chapter_no):
-        self.record(close_span())
+        self.record("</span>")
 
     def before_footnote(self, footnote):
         footnote_id = self._next_footnote_id
@@ -92,43 +172,77 @@ class HtmlVisitor(ElementVisitor):
         entry = HtmlVisitor.Entry(footnote_id, footnote.kind)
         self._accumulated_footnotes.append(entry)
         self._current_footnotes.append(entry)
+        self._record = entry.write
         self.record(open_span(clazz=footnote.kind.name, identifier="fn{id}".format(id=footnote_id)))
 
     def after_footnote(self, footnote):
         entry = self._current_footnotes.pop()
         entry.write("<a href=\"#ref{id}\">^</a>".format(id=entry.identifier))
         entry.write(close_span())
+        if self._current_footnotes:
+            self._record = self._current_footnotes[-1].write
+        else:
+            self._record = self._output.write
 
     def before_formatted_text(self, formatted_text):
-        if formatted_text.kind in non_span_formatting:
-            self.record(non_span_formatting[formatted_text.kind][0])
-        else:
-            self.record(open_span(clazz=formatted_text.kind.name))
+        self.record(self._cached_formatted_text_tags(formatted_text.kind)[0])
 
     def after_formatted_text(self, formatted_text):
-        if formatted_text.kind in non_span_formatting:
-            self.record(non_span_formatting[formatted_text.kind][1])
-        else:
-            self.record(close_span())
+        self.record(self._cached_formatted_text_tags(formatted_text.kind)[1])
+
+    def _cached_formatted_text_tags(self, kind):
+        tags = self._formatted_text_tags.get(kind)
+        if tags is None:
+            tags = self._formatted_text_tags[kind] = self.formatted_text_tags(kind)
+        return tags
+
+    @staticmethod
+    def formatted_text_tags(kind):
+        """
+        :param FormattedText.Kind kind:
+        :return: the opening and closing tags of formatted text of the given kind
+        :rtype: (str|unicode, str|unicode)
+        """
+        if kind in non_span_formatting:
+            return non_span_formatting[kind]
+        return open_span(clazz=kind.name), close_span()
 
     def before_heading(self, heading):
-        flag = "h" + str(heading.weight)
-        clazz = heading.kind.name
-        self.record(open_tag(flag, clazz=clazz))
+        self.record(self._cached_heading_tags(heading)[0])
 
     def after_heading(self, heading):
-        flag = "h" + str(heading.weight)
-        self.record(close_tag(flag))
+        self.record(self._cached_heading_tags(heading)[1])
+
+    def _cached_heading_tags(self, heading):
+        key = (heading.kind, heading.weight)
+        tags = self._heading_tags.get(key)
+        if tags is None:
+            tags = self._heading_tags[key] = self.heading_tags(heading.kind, heading.weight)
+        return tags
+
+    @staticmethod
+    def heading_tags(kind, weight):
+        """
+        :param Heading.Kind kind:
+        :param int weight:
+        :return: the opening and closing tags of headings of the given kind and weight
+        :rtype: (str|unicode, str|unicode)
+        """
+        flag = "h" + str(weight)
+        return open_tag(flag, clazz=kind.name), close_tag(flag)
 
     def before_other(self, other):
-        clazz = other.kind.name
-        self.record(open_span(classes=[clazz]))
+        kind = other.kind
+        tag = self._other_tags.get(kind)
+        if tag is None:
+            tag = self._other_tags[kind] = open_span(classes=[kind.name])
+        self.record(tag)
 
     def after_other(self, other):
-        self.record(close_span())
+        self.record("</span>")
 
     def text(self, raw_text):
-        self.record(raw_text.content)
+        self.record(escape(raw_text.content))
 
     def whitespace(self, whitespace):
         kind = whitespace.kind
@@ -143,19 +257,18 @@ class HtmlVisitor(ElementVisitor):
         def __init__(self, identifier, kind):
             self._identifier = identifier
             self._kind = kind
-            self._content = ""
+            self._fragments = []
+            # fragments are joined once, when the content is read
+            self.write = self._fragments.append
 
         @property
         def content(self):
-            return self._content
+            return "".join(self._fragments)
 
         @property
         def identifier(self):
             return self._identifier
 
-        def write(self, s):
-            self._content += s
-
     class HtmlFootnoteLabelVisitor(FootnoteLabelVisitor):
         def __init__(self, default):
             self._default = default
@@ -172,7 +285,7 @@ class HtmlVisitor(ElementVisitor):
             self._result = ""
 
         def custom(self, custom):
-            self._result = custom.content
+            self._result = escape(custom.content)
 
     class HtmlParagraphLayoutVisitor(ParagraphLayoutVisitor):
         def __init__(self):
@@ -206,7 +319,8 @@ non_span_formatting = {
 
 
 def html_header(title="", stylesheets=()):
-    styles = "\n".join("<link rel=\"stylesheet\" href=\"{}\">".format(stylesheet)
+    title = "" if title is None else escape(title)
+    styles = "\n".join("<link rel=\"stylesheet\" href=\"{}\">".format(escape(stylesheet))
                        for stylesheet in stylesheets)
     return u"""<!DOCTYPE html>
         <meta charset=\"utf-8\">
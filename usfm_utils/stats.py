@@ -0,0 +1,149 @@
+"""
+Opt-in instrumentation of parsing and rendering.
+
+A Stats object can be passed to UsfmParser.parse_text (or parse) and to
+HtmlVisitor, which then record into it:
+- the wall time of each phase: "input" (preparing the lexer, e.g. indexing
+  lines), "lex" (producing tokens), "parse" (the grammar, including building
+  elements) and "render"
+- the number of tokens of each type
+- the number of reductions of each grammar rule
+- the number of bytes (of UTF-8) written by the renderer
+
+Without a Stats object, none of this is recorded, and the parser and renderer
+run exactly as they otherwise would. A Stats object accumulates over every parse
+and render it is passed to, and can be exported as a line of JSON.
+"""
+from __future__ import unicode_literals
+
+import json
+import timeit
+
+
+class Stats(object):
+    def __init__(self, **labels):
+        """
+        :param labels: extra fields for the JSON output, e.g. the path of the file
+        being processed
+        """
+        self.labels = dict(labels)
+        self.phases = {}
+        self.token_counts = {}
+        self.reductions = {}
+        self.bytes_written = 0
+        self.clock = timeit.default_timer
+
+    def add_time(self, phase, seconds):
+        """
+        :param str phase:
+        :param float seconds: time spent in phase
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def timer(self, phase):
+        """
+        :param str phase:
+        :return: a context manager adding the time spent within it to phase
+        :rtype: PhaseTimer
+        """
+        return PhaseTimer(self, phase)
+
+    def add_tokens(self, counts, names):
+        """
+        :param list[int] counts: number of tokens, indexed by kind code
+        :param tuple[str] names: names of the tokens, indexed by kind code
+        """
+        add_counts(counts, names, self.token_counts)
+
+    def add_reductions(self, counts, names):
+        """
+        :param list[int] counts: number of reductions, indexed by production number
+        :param tuple[str] names: names of the productions
+        """
+        add_counts(counts, names, self.reductions)
+
+    def add_bytes(self, num_bytes):
+        self.bytes_written += num_bytes
+
+    def merge(self, other):
+        """
+        Adds everything recorded by other to this
+        :param Stats other:
+        """
+        for phase, seconds in other.phases.items():
+            self.add_time(phase, seconds)
+        for name, count in other.token_counts.items():
+            self.token_counts[name] = self.token_counts.get(name, 0) + count
+        for name, count in other.reductions.items():
+            self.reductions[name] = self.reductions.get(name, 0) + count
+        self.bytes_written += other.bytes_written
+
+    def to_json(self):
+        """
+        :rtype: dict
+        """
+        result = dict(self.labels)
+        result.update({
+            "phases": dict(self.phases),
+            "tokens": dict(self.token_counts),
+            "reductions": dict(self.reductions),
+            "bytes_written": self.bytes_written,
+        })
+        return result
+
+    def to_json_line(self):
+        """
+        :return: the recorded stats, as a line of JSON (including the newline)
+        :rtype: str
+        """
+        return json.dumps(self.to_json(), sort_keys=True) + "\n"
+
+
+def add_counts(counts, names, totals):
+    """
+    :param list[int] counts: counts, indexed like names
+    :param tuple[str] names:
+    :param dict[str, int] totals: totals to add the (non-zero) counts to
+    """
+    for index, count in enumerate(counts):
+        if count:
+            name = names[index]
+            totals[name] = totals.get(name, 0) + count
+
+
+class PhaseTimer(object):
+    def __init__(self, stats, phase):
+        self._stats = stats
+        self._phase = phase
+        self._start = None
+
+    def __enter__(self):
+        self._start = self._stats.clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stats.add_time(self._phase, self._stats.clock() - self._start)
+        return False
+
+
+class CountingWriter(object):
+    """
+    Wraps a writable file, recording the number of bytes written to it
+    """
+    def __init__(self, writable_file, stats):
+        """
+        :param file writable_file:
+        :param Stats stats: stats to record bytes written into
+        """
+        self._file = writable_file
+        self._stats = stats
+
+    def write(self, s):
+        if isinstance(s, bytes):
+            self._stats.add_bytes(len(s))
+        else:
+            self._stats.add_bytes(len(s.encode("utf-8")))
+        return self._file.write(s)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
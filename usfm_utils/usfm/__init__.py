@@ -1,4 +1,5 @@
 from usfm_utils.usfm.lex import UsfmLexer
 from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.scan import UsfmScanner
 from usfm_utils.usfm.tokens import Position
 from usfm_utils.usfm.usfm_error import UsfmInputError
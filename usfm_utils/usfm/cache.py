@@ -0,0 +1,213 @@
+"""
+An on-disk cache of parsed documents.
+
+Entries are keyed by a hash of the USFM source together with a checksum of the
+tables in flags.py (so that changing the flags invalidates the cache), and are
+stored as one file per document in a directory. The total size of the directory
+is capped; when it is exceeded, the least recently used entries are evicted.
+
+Entries are stored in the format of usfm_utils.elements.serialize rather than
+pickled: loading a tampered entry from a shared or persistent directory can at
+worst fail (the entry is then dropped as corrupted), whereas unpickling it could
+run arbitrary code.
+"""
+import collections
+import hashlib
+import os
+import tempfile
+import threading
+
+from usfm_utils.elements import serialize
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.tables import flags_checksum
+
+# bumped whenever the format of cached entries changes
+CACHE_VERSION = 3
+
+ENTRY_SUFFIX = ".doc"
+
+
+class DocumentCache(object):
+    def __init__(self, directory, max_size=64 * 1024 * 1024, parser=None):
+        """
+        :param str directory: directory in which to store entries, created if needed
+        :param int max_size: maximum total size of the entries, in bytes
+        :param UsfmParser parser: parser to use on cache misses
+        """
+        self._directory = directory
+        self._max_size = max_size
+        self._parser = UsfmParser.create() if parser is None else parser
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        # key -> size of entry, from least to most recently used
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._load_entries()
+
+    @property
+    def hits(self):
+        """
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        :rtype: int
+        """
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        :rtype: int
+        """
+        return self._evictions
+
+    @property
+    def size(self):
+        """
+        :return: total size of the entries, in bytes
+        :rtype: int
+        """
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(text):
+        """
+        :param str|unicode text: USFM source
+        :return: the key of the entry for the given source
+        :rtype: str
+        """
+        digest = hashlib.sha1()
+        digest.update("{}:{}:".format(CACHE_VERSION, flags_checksum()).encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def parse_text(self, text):
+        """
+        Returns the cached document for the given source, parsing (and caching)
+        it if it is not in the cache
+        :param str|unicode text: USFM source
+        :rtype: Document
+        """
+        key = self.key(text)
+        document = self._get(key)
+        if document is None:
+            document = self._parser.parse_text(text)
+            self._put(key, document)
+        return document
+
+    def get(self, text):
+        """
+        :param str|unicode text: USFM source
+        :return: the cached document for the given source, or None
+        :rtype: Document
+        """
+        return self._get(self.key(text))
+
+    def put(self, text, document):
+        """
+        :param str|unicode text: USFM source
+        :param Document document: the document parsed from text
+        """
+        self._put(self.key(text), document)
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _get(self, key):
+        with self._lock:
+            path = self._path(key)
+            if key not in self._entries:
+                if not os.path.exists(path):
+                    self._misses += 1
+                    return None
+                # written by another process sharing the directory
+                self._entries[key] = os.path.getsize(path)
+                self._size += self._entries[key]
+            try:
+                with open(path, "rb") as entry_file:
+                    document = self.loads(entry_file.read())
+            except Exception:  # missing or corrupted entry
+                self._remove(key)
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries[key] = self._entries.pop(key)
+            try:
+                # the modification time records use across processes
+                os.utime(path, None)
+            except OSError:  # e.g. removed by another process, or read-only
+                pass
+            return document
+
+    def _put(self, key, document):
+        data = self.dumps(document)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if len(data) > self._max_size:
+                return
+            fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as entry_file:
+                entry_file.write(data)
+            os.rename(temp_path, self._path(key))
+            self._entries[key] = len(data)
+            self._size += len(data)
+            while self._size > self._max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    @staticmethod
+    def dumps(document):
+        """
+        :param Document document:
+        :rtype: bytes
+        """
+        return serialize.dumps(document)
+
+    @staticmethod
+    def loads(data):
+        """
+        :param bytes data:
+        :rtype: Document
+        """
+        return serialize.loads(data)
+
+    def _remove(self, key):
+        self._size -= self._entries.pop(key)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _path(self, key):
+        return os.path.join(self._directory, key + ENTRY_SUFFIX)
+
+    def _load_entries(self):
+        if not os.path.isdir(self._directory):
+            os.makedirs(self._directory)
+        entries = []
+        for filename in os.listdir(self._directory):
+            if not filename.endswith(ENTRY_SUFFIX):
+                continue
+            stat = os.stat(os.path.join(self._directory, filename))
+            entries.append((stat.st_mtime, filename[:-len(ENTRY_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._size += size
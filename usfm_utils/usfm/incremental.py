@@ -0,0 +1,341 @@
+"""
+Incremental reparsing of a USFM source after an edit.
+
+A source is split into segments at its chapter markers (a \\cl marker directly
+followed by a \\c marker starts the chapter's segment): each chapter corresponds
+to the elements from its ChapterNumber up to the next one. After an edit, only
+the segments that the edit touches are parsed again, and their new elements are
+spliced between the untouched ones.
+
+The only state of a parse that carries over from one segment to the next is
+the relative chapter label (set by a \\cl marker before a \\c marker) and the
+previous paragraph (which a \\nb marker continues). The state at the start of
+each segment is found by a scan of the markers involved, using the lexer's own
+rules, and the parse of the edited segments starts from that state. If the state
+at the end of the edited segments differs from what it was before the edit, the
+following segments are parsed again as well.
+
+An IncrementalParser keeps the segments of the last source it parsed, and
+updates them from the scan of the edited segments, so that a sequence of edits,
+each applied to the result of the previous one, never scans the whole source.
+
+Whenever an edit cannot be handled this way (it touches the \\h or \\toc markers
+of another segment, or the segments no longer line up with the document), the
+whole source is parsed again.
+"""
+from __future__ import unicode_literals
+
+import bisect
+import itertools
+import re
+
+from usfm_utils.elements.document import Document
+from usfm_utils.elements.element_impls import ChapterNumber, Paragraph
+from usfm_utils.usfm.flags import headings, higher_rest_of_lines, \
+    ignore_rest_of_lines, indented_paragraphs, paragraphs
+from usfm_utils.usfm.index import marker_regex
+from usfm_utils.usfm.lex import UsfmLexer
+from usfm_utils.usfm.parse import ParseContext, UsfmParser
+from usfm_utils.usfm.tokens import Token
+from usfm_utils.usfm.usfm_error import UsfmInputError
+
+HEADER_TOKENS = ("HEADING", "TABLE_OF_CONTENTS")
+
+
+def paragraph_flags(paragraph):
+    """
+    :param Paragraph paragraph: a previous paragraph, or None
+    :return: the fields of the paragraph that a \\nb marker carries on
+    :rtype: (bool, bool, bool)
+    """
+    if paragraph is None:
+        return None
+    return paragraph.embedded, paragraph.introductory, paragraph.poetic
+
+
+class Edit(object):
+    """
+    The replacement of part of a source by new text
+    """
+    def __init__(self, offset, deleted, inserted):
+        """
+        :param int offset: offset (in characters) of the edit in the old source
+        :param int deleted: number of characters deleted from offset
+        :param str|unicode inserted: text inserted at offset
+        """
+        self._offset = offset
+        self._deleted = deleted
+        self._inserted = inserted
+
+    @property
+    def offset(self):
+        """
+        :rtype: int
+        """
+        return self._offset
+
+    @property
+    def deleted(self):
+        """
+        :rtype: int
+        """
+        return self._deleted
+
+    @property
+    def inserted(self):
+        """
+        :rtype: str|unicode
+        """
+        return self._inserted
+
+    def apply(self, text):
+        """
+        :param str|unicode text: the old source
+        :return: the new source
+        :rtype: str|unicode
+        """
+        return text[:self._offset] + self._inserted + text[self._offset + self._deleted:]
+
+
+class Segments(object):
+    """
+    The chapter segments of a source: segment k starts at offsets[k] (segment 0,
+    which holds whatever comes before the first chapter, starts at 0), and
+    states[k] is the (relative chapter label, previous paragraph flags) state of
+    a parse at that offset. headers holds the offsets of \\h and \\toc markers
+    """
+    _regex = None
+    _rules = None
+    _paragraph_flags = None
+
+    def __init__(self, offsets, states, headers):
+        self.offsets = offsets
+        self.states = states
+        self.headers = headers
+
+    @staticmethod
+    def init():
+        """
+        Builds the regex of the scan, from the lexer's rules for the markers that
+        start chapters, paragraphs or (so that markers within them are skipped)
+        rest-of-line elements
+        """
+        if Segments._regex is not None:
+            return
+        rules = dict((name, func) for name, func, _, _, _ in UsfmLexer.lexical_rules())
+        flags = {}
+        for name, (_, builder) in paragraphs.items():
+            flags[name] = None if builder is None else paragraph_flags(builder([]))
+        for name, (_, constructor) in indented_paragraphs.items():
+            flags[name] = paragraph_flags(constructor([], 1))
+        names = ["CHAPTER", "CHAPTER_LABEL"] + sorted(flags) + sorted(itertools.chain(
+            headings, higher_rest_of_lines, ignore_rest_of_lines))
+        Segments._rules = rules
+        Segments._paragraph_flags = flags
+        Segments._regex = marker_regex([(name, [rules[name].__doc__]) for name in names],
+                                       flags=re.VERBOSE)
+
+    @staticmethod
+    def scan(text, state=(None, None)):
+        """
+        :param str|unicode text: USFM source
+        :param state: the state at the start of text
+        :rtype: Segments
+        """
+        Segments.init()
+        relative_chapter_label, previous_paragraph = state
+        offsets = [0]
+        states = [state]
+        headers = []
+        previous = None
+        for match in Segments._regex.finditer(text):
+            name = match.lastgroup
+            if name == "CHAPTER":
+                start = match.start()
+                label = None
+                if previous is not None and previous.lastgroup == "CHAPTER_LABEL" and \
+                        len(text[previous.end():start].strip()) == 0:
+                    start = previous.start()
+                    label_token = Token(0, start, previous.group())
+                    label = Segments._rules["CHAPTER_LABEL"](label_token).value
+                offsets.append(start)
+                states.append((relative_chapter_label, previous_paragraph))
+                if label is not None:
+                    relative_chapter_label = label
+            elif name in Segments._paragraph_flags:
+                flags = Segments._paragraph_flags[name]
+                if flags is not None:
+                    previous_paragraph = flags
+                elif previous_paragraph is None:  # \nb without a previous paragraph
+                    previous_paragraph = (False, False, False)
+            elif name in HEADER_TOKENS:
+                headers.append(match.start())
+            previous = match
+        return Segments(offsets, states, headers)
+
+    def splice(self, first, last, start, end, delta, region_segments):
+        """
+        :param int first: first segment replaced
+        :param int last: last segment replaced
+        :param int start: offset of segment first
+        :param int end: offset at which segment last ends
+        :param int delta: difference in length between the new and the old source
+        :param Segments region_segments: segments of the new source from start, up
+        to end + delta
+        :return: the segments of the new source
+        :rtype: Segments
+        """
+        # unless it starts the source, the region starts with a chapter, and so
+        # with an empty segment 0
+        skip = 0 if first == 0 else 1
+        header_start = bisect.bisect_left(self.headers, start)
+        header_end = bisect.bisect_left(self.headers, end)
+        offsets = self.offsets[:first] + \
+            [start + offset for offset in region_segments.offsets[skip:]] + \
+            [offset + delta for offset in self.offsets[last + 1:]]
+        states = self.states[:first] + region_segments.states[skip:] + \
+            self.states[last + 1:]
+        headers = self.headers[:header_start] + \
+            [start + offset for offset in region_segments.headers] + \
+            [offset + delta for offset in self.headers[header_end:]]
+        return Segments(offsets, states, headers)
+
+    def end(self, k, text):
+        """
+        :return: the offset at which segment k ends
+        :rtype: int
+        """
+        return self.offsets[k + 1] if k + 1 < len(self.offsets) else len(text)
+
+    def headers_between(self, start, end):
+        """
+        :return: whether there are \\h or \\toc markers from start to end
+        :rtype: bool
+        """
+        index = bisect.bisect_left(self.headers, start)
+        return index < len(self.headers) and self.headers[index] < end
+
+
+class IncrementalParser(object):
+    def __init__(self, parser=None):
+        """
+        :param UsfmParser parser: parser to parse (parts of) sources with
+        """
+        self._parser = UsfmParser.create() if parser is None else parser
+        # the last source parsed, and its segments
+        self._text = None
+        self._segments = None
+
+    def reparse(self, document, old_text, edit):
+        """
+        Parses the source resulting from an edit, reusing the elements of the
+        document parsed from the old source wherever the edit does not affect them.
+        The result is the same as a parse of the whole new source. When old_text is
+        the source resulting from the previous edit, its segments are not scanned
+        again
+        :param Document document: the document parsed from old_text
+        :param str|unicode old_text: the source before the edit
+        :param Edit edit:
+        :rtype: Document
+        """
+        new_text = edit.apply(old_text)
+        if self._text is not None and old_text == self._text:
+            segments = self._segments
+        else:
+            segments = Segments.scan(old_text)
+        self._text = self._segments = None
+        elements = document.elements
+        element_offsets = [0] + [index for index, element in enumerate(elements)
+                                 if is_chapter(element)]
+        if len(element_offsets) != len(segments.offsets):
+            return self._parser.parse_text(new_text)
+
+        edit_end = edit.offset + edit.deleted
+        first = max(bisect.bisect_left(segments.offsets, edit.offset) - 1, 0)
+        last = bisect.bisect_right(segments.offsets, edit_end) - 1
+        delta = len(edit.inserted) - edit.deleted
+        while True:
+            start = segments.offsets[first]
+            end = segments.end(last, old_text)
+            region = new_text[start:end + delta]
+            region_segments = Segments.scan(region, segments.states[first])
+            # \h and \toc markers are part of the state of the whole parse
+            if segments.headers_between(start, end) or region_segments.headers:
+                if segments.headers_between(0, start) or \
+                        segments.headers_between(end, len(old_text)):
+                    return self._parser.parse_text(new_text)
+                context = ParseContext()
+            else:
+                context = self.context(document)
+            relative_chapter_label, previous_paragraph = segments.states[first]
+            context.relative_chapter_label = relative_chapter_label
+            if previous_paragraph is not None:
+                embedded, introductory, poetic = previous_paragraph
+                context.previous_paragraph = Paragraph([], embedded=embedded,
+                                                       introductory=introductory,
+                                                       poetic=poetic)
+            try:
+                region_document = self._parser.parse_text(region, context=context)
+            except UsfmInputError:
+                # parsed again so that the error refers to the whole source
+                return self._parser.parse_text(new_text)
+            region_elements = region_document.elements
+            chapters = sum(1 for element in region_elements if is_chapter(element))
+            if chapters != len(region_segments.offsets) - 1 or \
+                    (first > 0 and not (region_elements and is_chapter(region_elements[0]))):
+                return self._parser.parse_text(new_text)
+
+            if last + 1 == len(segments.offsets):
+                break
+            state = (context.relative_chapter_label,
+                     paragraph_flags(context.previous_paragraph))
+            if state == segments.states[last + 1]:
+                break
+            elif state[0] != segments.states[last + 1][0]:
+                last = len(segments.offsets) - 1  # every following chapter changes
+            else:
+                last += 1
+
+        element_start = element_offsets[first]
+        element_end = element_offsets[last + 1] if last + 1 < len(element_offsets) \
+            else len(elements)
+        new_elements = elements[:element_start] + region_elements + elements[element_end:]
+        self._text = new_text
+        self._segments = segments.splice(first, last, start, end, delta, region_segments)
+        return Document(new_elements,
+                        heading=region_document.heading,
+                        table_of_contents=region_document.table_of_contents)
+
+    @staticmethod
+    def context(document):
+        """
+        :return: a context holding the heading and table of contents of document
+        :rtype: ParseContext
+        """
+        context = ParseContext()
+        context.heading = document.heading
+        toc = document.table_of_contents
+        if toc is not None:
+            context.toc_builder.set_long_description(toc.long_description)
+            context.toc_builder.set_short_description(toc.short_description)
+            context.toc_builder.set_abbreviation(toc.abbreviation)
+        return context
+
+
+def is_chapter(element):
+    """
+    :rtype: bool
+    """
+    return isinstance(element, ChapterNumber) and element.kind == ChapterNumber.Kind.standard
+
+
+def reparse(document, old_text, edit, parser=None):
+    """
+    See IncrementalParser.reparse
+    :param Document document: the document parsed from old_text
+    :param str|unicode old_text: the source before the edit
+    :param Edit edit:
+    :param UsfmParser parser: parser to parse (parts of) sources with
+    :rtype: Document
+    """
+    return IncrementalParser(parser).reparse(document, old_text, edit)
@@ -0,0 +1,552 @@
+"""
+An index of the chapters and verses of a USFM book, for parsing single passages.
+
+The index is built by a prescan of the raw source: a single regular expression,
+made of the lexer's own rules for the markers involved, finds every \\c, \\v, \\id
+and \\toc marker, as well as the paragraph markers, without lexing or parsing
+anything else. The offsets it records are kept in arrays, and can be saved next
+to the source file so that the prescan is only done once per version of a file.
+
+A passage such as "JHN 3:16-18" is then parsed from an excerpt of the source:
+the \\id and \\toc lines, the marker of the paragraph enclosing the first verse
+(or the \\c marker, if the verse is not in a paragraph of its own), and the source
+from the first verse up to the next verse not in the passage, less any headings
+(and paragraph markers) that precede that next verse. Character markers (e.g.
+\\wj) opened before the first verse are reopened after its \\v marker, and those
+still open after the last verse are closed at the end of the excerpt.
+"""
+from __future__ import unicode_literals
+
+import array
+import hashlib
+import io
+import re
+import sys
+
+from usfm_utils.elements.serialize import INTEGER_TYPECODES, from_bytes, to_bytes, \
+    write_varint
+from usfm_utils.usfm.flags import headings, higher_rest_of_lines, \
+    ignore_rest_of_lines, indented_paragraphs, lower_open_closes, one_word_arguments, \
+    paragraphs
+from usfm_utils.usfm.lex_utils import FLAG_PREFIX, UNESCAPED_FLAG_PREFIX, WHITESPACE, \
+    close_token_regex, make_flag, one_arg_regex, open_token_regex, rest_of_line, \
+    scale, scale_and_rest_of_line, standalone
+from usfm_utils.usfm.parse import UsfmParser
+from usfm_utils.usfm.tables import flags_checksum
+
+MAGIC = b"USFMIDX"
+# bumped whenever the format of saved indices changes
+INDEX_VERSION = 1
+
+INDEX_SUFFIX = ".idx"
+
+# array typecode for the (unsigned, 32-bit) integers of an index
+OFFSET_TYPECODE = INTEGER_TYPECODES[-1]
+
+REFERENCE = re.compile(r"^\s*(\w+)\s+(\d+)(?::(\d+)(?:-(\d+))?)?\s*$", re.UNICODE)
+LEADING_NUMBER = re.compile(r"\d+")
+
+
+def prescan_regex():
+    """
+    :return: a regex matching the markers recorded by the prescan, whose
+    lastgroup is one of CHAPTER, VERSE, FILE_ID, TABLE_OF_CONTENTS or PARAGRAPH
+    :rtype: re.RegexObject
+    """
+    paragraph_rules = [standalone(flag) for name, (flag, _) in paragraphs.items()]
+    paragraph_rules += [scale(flag) for flag, _ in indented_paragraphs.values()]
+    alternatives = [
+        ("CHAPTER", [one_arg_regex(one_word_arguments["CHAPTER"][0])]),
+        ("VERSE", [one_arg_regex(one_word_arguments["VERSE"][0])]),
+        ("FILE_ID", [rest_of_line(ignore_rest_of_lines["FILE_ID"]).__doc__]),
+        ("TABLE_OF_CONTENTS", [r"{}[0-9]*\b".format(
+            make_flag(headings["TABLE_OF_CONTENTS"][0], boundary=False))]),
+        ("PARAGRAPH", [rule.__doc__ for rule in paragraph_rules]),
+    ]
+    return marker_regex(alternatives)
+
+
+def character_regex():
+    """
+    :return: a regex matching the markers opening and closing character styles
+    (e.g. \\wj and \\wj*), whose lastgroup is OPEN or CLOSE
+    :rtype: re.RegexObject
+    """
+    flags = [flag for flag, _ in lower_open_closes.values()]
+    return marker_regex([("OPEN", [open_token_regex(flag) for flag in flags]),
+                         ("CLOSE", [close_token_regex(flag) for flag in flags])])
+
+
+def trailing_regex():
+    """
+    :return: a regex matching a run of headings, speaker and similar lines, and
+    paragraph markers, up to the end of the string (or endpos)
+    :rtype: re.RegexObject
+    """
+    rules = [scale_and_rest_of_line(flag) for flag, _ in headings.values()]
+    rules += [rest_of_line(flag) for flag, _ in higher_rest_of_lines.values()]
+    rules += [standalone(flag) for flag, _ in paragraphs.values()]
+    rules += [scale(flag) for flag, _ in indented_paragraphs.values()]
+    markers = "|".join(rule.__doc__ for rule in rules)
+    return re.compile(r"(?:{markers})(?:\s*(?:{markers}))*\s*\Z".format(markers=markers),
+                      re.UNICODE)
+
+
+def marker_regex(alternatives, flags=0):
+    """
+    :param list[(str, list[str])] alternatives: (group name, regexes) pairs, where
+    each regex matches markers, and so starts with FLAG_PREFIX and a flag
+    :param int flags: additional flags for re.compile
+    :return: a regex matching any of the alternatives, whose lastgroup is the name
+    of the matched alternative
+    :rtype: re.RegexObject
+    """
+    initials = set(regex[len(FLAG_PREFIX)] for _, regexes in alternatives for regex in regexes)
+    # the leading lookahead lets the regex engine skip ahead to the next marker
+    # that may match, rather than trying every alternative at every position
+    return re.compile("(?={prefix}[{initials}])(?:{alternatives})".format(
+        prefix=FLAG_PREFIX,
+        initials="".join(sorted(initials)),
+        alternatives="|".join("(?P<{}>{})".format(name, "|".join(regexes))
+                              for name, regexes in alternatives)
+    ), re.UNICODE | flags)
+
+
+class VerseIndex(object):
+    """
+    The offsets (in characters) of the chapters and verses of a USFM source. Each
+    field is an array of unsigned integers: the i-th chapter has number
+    chapter_numbers[i], starts at chapter_offsets[i], and its verses are those
+    from index chapter_verses[i] up to chapter_verses[i + 1]. The j-th verse
+    covers verse numbers verse_firsts[j] to verse_lasts[j] (e.g. for "\\v 16-17"),
+    starts at verse_offsets[j], and its enclosing paragraph (or chapter) marker
+    starts at verse_contexts[j].
+
+    Chapters and verses whose numbers do not start with digits are not indexed.
+    """
+    FIELDS = ("header_offsets", "chapter_numbers", "chapter_offsets", "chapter_verses",
+              "verse_firsts", "verse_lasts", "verse_offsets", "verse_contexts")
+
+    _prescan_regex = None
+    _character_regex = None
+    _trailing_regex = None
+
+    def __init__(self, digest, book=None, **fields):
+        """
+        :param str digest: digest (see VerseIndex.digest) of the indexed source
+        :param str|unicode book: book code from the \\id marker, or None
+        :param fields: arrays for each of FIELDS, empty if omitted
+        """
+        self._digest = digest
+        self._book = book
+        for name in self.FIELDS:
+            setattr(self, name, fields.get(name, array.array(OFFSET_TYPECODE)))
+        self._chapter_indices = None
+
+    @property
+    def digest(self):
+        """
+        :rtype: str
+        """
+        return self._digest
+
+    @property
+    def book(self):
+        """
+        :return: book code from the \\id marker (e.g. "JHN"), or None
+        :rtype: str|unicode
+        """
+        return self._book
+
+    @staticmethod
+    def prescan_regex():
+        """
+        :return: the regex of the prescan, compiled on first use
+        :rtype: re.RegexObject
+        """
+        if VerseIndex._prescan_regex is None:
+            VerseIndex._prescan_regex = prescan_regex()
+        return VerseIndex._prescan_regex
+
+    @staticmethod
+    def character_regex():
+        """
+        :return: the regex of character markers, compiled on first use
+        :rtype: re.RegexObject
+        """
+        if VerseIndex._character_regex is None:
+            VerseIndex._character_regex = character_regex()
+        return VerseIndex._character_regex
+
+    @staticmethod
+    def trailing_regex():
+        """
+        :return: the regex of trailing headings, compiled on first use
+        :rtype: re.RegexObject
+        """
+        if VerseIndex._trailing_regex is None:
+            VerseIndex._trailing_regex = trailing_regex()
+        return VerseIndex._trailing_regex
+
+    @staticmethod
+    def source_digest(text):
+        """
+        :param str|unicode text: USFM source
+        :return: a digest of the source and of the flags used to index it
+        :rtype: str
+        """
+        digest = hashlib.sha1()
+        digest.update("{}:{}:".format(INDEX_VERSION, flags_checksum()).encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def build(text):
+        """
+        Prescans a USFM source
+        :param str|unicode text: USFM source
+        :rtype: VerseIndex
+        """
+        index = VerseIndex(VerseIndex.source_digest(text))
+        header_offsets = index.header_offsets
+        chapter_numbers = index.chapter_numbers
+        chapter_offsets = index.chapter_offsets
+        chapter_verses = index.chapter_verses
+        verse_firsts = index.verse_firsts
+        verse_lasts = index.verse_lasts
+        verse_offsets = index.verse_offsets
+        verse_contexts = index.verse_contexts
+
+        context = None
+        for match in VerseIndex.prescan_regex().finditer(text):
+            role = match.lastgroup
+            if role == "VERSE":
+                if context is None:
+                    continue  # verse before the first chapter
+                first, last = VerseIndex.verse_numbers(match.group().split()[1])
+                if first is None:
+                    continue
+                verse_firsts.append(first)
+                verse_lasts.append(last)
+                verse_offsets.append(match.start())
+                verse_contexts.append(context)
+            elif role == "PARAGRAPH":
+                context = match.start()
+            elif role == "CHAPTER":
+                number, _ = VerseIndex.verse_numbers(match.group().split()[1])
+                if number is None:
+                    continue
+                chapter_numbers.append(number)
+                chapter_offsets.append(match.start())
+                chapter_verses.append(len(verse_offsets))
+                context = match.start()
+            elif role == "TABLE_OF_CONTENTS":
+                header_offsets.append(match.start())
+            elif role == "FILE_ID":
+                header_offsets.append(match.start())
+                words = match.group().split()
+                if index._book is None and len(words) > 1:
+                    index._book = words[1]
+        return index
+
+    @staticmethod
+    def verse_numbers(value):
+        """
+        :param str|unicode value: argument of a \\c or \\v marker, e.g. "16", "16-17"
+        or "16a"
+        :return: the first and last numbers covered, or (None, None)
+        :rtype: (int, int)
+        """
+        numbers = [int(number) for number in LEADING_NUMBER.findall(value)]
+        if not numbers or not value[0].isdigit():
+            return None, None
+        if "-" in value and len(numbers) > 1:
+            return numbers[0], max(numbers[0], numbers[1])
+        return numbers[0], numbers[0]
+
+    def chapters(self):
+        """
+        :return: the numbers of the indexed chapters, in order
+        :rtype: list[int]
+        """
+        return list(self.chapter_numbers)
+
+    def verses(self, chapter):
+        """
+        :param int chapter: chapter number
+        :return: the (first, last) numbers of each verse of the chapter, in order
+        :rtype: list[(int, int)]
+        """
+        start, end = self._verse_range(chapter)
+        return list(zip(self.verse_firsts[start:end], self.verse_lasts[start:end]))
+
+    def excerpt(self, text, chapter, first=None, last=None):
+        """
+        Returns the part of the source needed to parse a passage. The result is
+        itself a USFM source
+        :param str|unicode text: the indexed USFM source
+        :param int chapter: chapter number
+        :param int first: first verse of the passage, or None for the whole chapter
+        :param int last: last verse of the passage, first if None
+        :rtype: str|unicode
+        """
+        header = [self._line(text, offset) for offset in self.header_offsets]
+        chapter_index = self._chapter_index(chapter)
+        start, end = self._verse_range(chapter)
+        if chapter_index + 1 < len(self.chapter_offsets):
+            chapter_end = self.chapter_offsets[chapter_index + 1]
+        else:
+            chapter_end = len(text)
+        if first is None:
+            body = text[self.chapter_offsets[chapter_index]:chapter_end]
+            return "\n".join(header + [body])
+
+        last = first if last is None else last
+        verse = start
+        while verse < end and self.verse_lasts[verse] < first:
+            verse += 1
+        if verse == end or self.verse_firsts[verse] > last:
+            raise KeyError("No verse {}:{}-{}".format(chapter, first, last))
+        following = verse
+        while following < end and self.verse_firsts[following] <= last:
+            following += 1
+
+        if following == end:
+            body_end = chapter_end
+        elif self.verse_contexts[following] > self.verse_offsets[following - 1]:
+            # the following verse starts a paragraph of its own
+            body_end = self.verse_contexts[following]
+        else:
+            body_end = self.verse_offsets[following]
+        # headings preceding the following verse are not part of the passage
+        trailing = self.trailing_regex().search(text, self.verse_offsets[following - 1],
+                                                body_end)
+        if trailing is not None:
+            body_end = trailing.start()
+
+        context = self.verse_contexts[verse]
+        verse_offset = self.verse_offsets[verse]
+        reopened = self._open_markers(text, context, verse_offset)
+        still_open = self._open_markers(text, verse_offset, body_end, reopened)
+        verse_marker = self.prescan_regex().match(text, verse_offset)
+        rest = text[verse_marker.end():body_end]
+        content = rest.rstrip(WHITESPACE)
+        body = "".join([verse_marker.group()] +
+                       [" " + UNESCAPED_FLAG_PREFIX + flag for flag in reopened] +
+                       [content] +
+                       [UNESCAPED_FLAG_PREFIX + flag + "*" for flag in reversed(still_open)] +
+                       [rest[len(content):]])
+        match = self.prescan_regex().match(text, context)
+        return "\n".join(header + [match.group(), body])
+
+    def _open_markers(self, text, start, end, open_markers=()):
+        """
+        :param str|unicode text: the indexed USFM source
+        :param int start: where to start looking for character markers
+        :param int end: where to stop looking for character markers
+        :param iterable[str|unicode] open_markers: flags of the character markers
+        open at start
+        :return: flags of the character markers open at end, innermost last
+        :rtype: list[str|unicode]
+        """
+        open_markers = list(open_markers)
+        for match in self.character_regex().finditer(text, start, end):
+            flag = match.group()[len(UNESCAPED_FLAG_PREFIX):-1]
+            if match.lastgroup == "OPEN":
+                open_markers.append(flag)
+            elif flag in open_markers:
+                del open_markers[len(open_markers) - 1 - open_markers[::-1].index(flag)]
+        return open_markers
+
+    def _line(self, text, offset):
+        end = text.find("\n", offset)
+        return text[offset:] if end < 0 else text[offset:end]
+
+    def _chapter_index(self, chapter):
+        if self._chapter_indices is None:
+            indices = {}
+            for index, number in enumerate(self.chapter_numbers):
+                indices.setdefault(number, index)
+            self._chapter_indices = indices
+        try:
+            return self._chapter_indices[chapter]
+        except KeyError:
+            raise KeyError("No chapter {}".format(chapter))
+
+    def _verse_range(self, chapter):
+        index = self._chapter_index(chapter)
+        start = self.chapter_verses[index]
+        if index + 1 < len(self.chapter_verses):
+            return start, self.chapter_verses[index + 1]
+        return start, len(self.verse_offsets)
+
+    def dumps(self):
+        """
+        :rtype: bytes
+        """
+        result = bytearray(MAGIC)
+        result.append(INDEX_VERSION)
+        result.extend(self._digest.encode("ascii"))
+        book = b"" if self._book is None else self._book.encode("utf-8")
+        write_varint(result, len(book))
+        result.extend(book)
+        for name in self.FIELDS:
+            values = array.array(OFFSET_TYPECODE, getattr(self, name))
+            if sys.byteorder == "big":
+                values.byteswap()
+            write_varint(result, len(values))
+            result.extend(to_bytes(values))
+        return bytes(result)
+
+    @staticmethod
+    def loads(data):
+        """
+        :param bytes data: the result of VerseIndex.dumps
+        :rtype: VerseIndex
+        """
+        data = bytearray(data)
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a verse index")
+        if data[len(MAGIC)] != INDEX_VERSION:
+            raise ValueError("Unsupported version {}".format(data[len(MAGIC)]))
+        position = [len(MAGIC) + 1]
+
+        def read(length):
+            start = position[0]
+            position[0] += length
+            if position[0] > len(data):
+                raise ValueError("Truncated verse index")
+            return bytes(data[start:position[0]])
+
+        def read_varint():
+            result = 0
+            shift = 0
+            while True:
+                byte = bytearray(read(1))[0]
+                result |= (byte & 0x7f) << shift
+                if byte < 0x80:
+                    return result
+                shift += 7
+
+        digest = read(40).decode("ascii")
+        book = read(read_varint()).decode("utf-8") or None
+        fields = {}
+        for name in VerseIndex.FIELDS:
+            values = array.array(OFFSET_TYPECODE)
+            from_bytes(values, read(read_varint() * values.itemsize))
+            if sys.byteorder == "big":
+                values.byteswap()
+            fields[name] = values
+        if position[0] != len(data):
+            raise ValueError("Trailing data after verse index")
+        return VerseIndex(digest, book, **fields)
+
+    def save(self, path):
+        """
+        :param str path: path of the file to write the index to
+        """
+        with open(path, "wb") as index_file:
+            index_file.write(self.dumps())
+
+    @staticmethod
+    def load(path):
+        """
+        :param str path: path of a file written by VerseIndex.save
+        :rtype: VerseIndex
+        """
+        with open(path, "rb") as index_file:
+            return VerseIndex.loads(index_file.read())
+
+
+def index_path(path):
+    """
+    :param str path: path of a USFM file
+    :return: path of the index saved next to it
+    :rtype: str
+    """
+    return path + INDEX_SUFFIX
+
+
+def parse_reference(reference):
+    """
+    :param str|unicode reference: e.g. "JHN 3", "JHN 3:16" or "JHN 3:16-18"
+    :return: the book, chapter, first and last verse (None for whole chapters)
+    :rtype: (str|unicode, int, int, int)
+    """
+    match = REFERENCE.match(reference)
+    if match is None:
+        raise ValueError("Invalid reference: {}".format(reference))
+    book, chapter, first, last = match.groups()
+    first = None if first is None else int(first)
+    last = first if last is None else int(last)
+    return book, int(chapter), first, last
+
+
+class IndexedBook(object):
+    """
+    A USFM file together with its verse index, from which single passages can
+    be parsed
+    """
+    def __init__(self, text, index, parser=None):
+        """
+        :param str|unicode text: USFM source
+        :param VerseIndex index: index of text
+        :param UsfmParser parser: parser to use for passages
+        """
+        self._text = text
+        self._index = index
+        self._parser = UsfmParser.create() if parser is None else parser
+
+    @staticmethod
+    def open(path, parser=None, save=True):
+        """
+        Reads a USFM file, along with the index saved next to it. If there is no
+        such index, or it is out of date, the file is prescanned (and the new index
+        saved, if possible)
+        :param str path: path of a (UTF-8) USFM file
+        :param UsfmParser parser: parser to use for passages
+        :param bool save: whether to save a new index next to the file
+        :rtype: IndexedBook
+        """
+        with io.open(path, encoding="utf-8") as usfm_file:
+            text = usfm_file.read()
+        index = None
+        try:
+            index = VerseIndex.load(index_path(path))
+        except (EnvironmentError, ValueError):
+            pass
+        if index is None or index.digest != VerseIndex.source_digest(text):
+            index = VerseIndex.build(text)
+            if save:
+                try:
+                    index.save(index_path(path))
+                except EnvironmentError:
+                    pass  # e.g. a read-only directory
+        return IndexedBook(text, index, parser=parser)
+
+    @property
+    def text(self):
+        """
+        :rtype: str|unicode
+        """
+        return self._text
+
+    @property
+    def index(self):
+        """
+        :rtype: VerseIndex
+        """
+        return self._index
+
+    def parse_passage(self, reference):
+        """
+        Parses a single chapter, verse or range of verses. Positions of errors are
+        relative to the excerpt of the source being parsed
+        :param str|unicode reference: e.g. "JHN 3", "JHN 3:16" or "JHN 3:16-18"
+        :rtype: Document
+        """
+        book, chapter, first, last = parse_reference(reference)
+        if self._index.book is not None and book.upper() != self._index.book.upper():
+            raise KeyError("Not in book {}: {}".format(self._index.book, reference))
+        excerpt = self._index.excerpt(self._text, chapter, first, last)
+        return self._parser.parse_text(excerpt)
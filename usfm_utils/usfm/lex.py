@@ -1,20 +1,20 @@
 from __future__ import unicode_literals
 
 import itertools
-
-import ply.lex as lex
+import re
+import threading
 
 from usfm_utils.elements.footnote_utils import AutomaticFootnoteLabel, \
     NoFootnoteLabel, CustomFootnoteLabel
-from usfm_utils.usfm.escape_text import escape_text, unescape_text
 from usfm_utils.usfm.flags import paragraphs, indented_paragraphs, \
     lower_open_closes, higher_open_closes, headings, one_word_arguments, \
     higher_rest_of_lines, lower_until_next_flags, whitespace, ignore_rest_of_lines, \
     footnotes
 from usfm_utils.usfm.lex_utils import standalone, open_token, close_token, one_arg, \
-    until_next_flag, rest_of_line, open_token_regex, FLAG_PREFIX, scale, \
+    until_next_flag, rest_of_line, FLAG_PREFIX, scale, \
     scale_and_rest_of_line
-from usfm_utils.usfm.tokens import Position, Token
+from usfm_utils.usfm.tables import build_lexer
+from usfm_utils.usfm.tokens import LineIndex, Token
 from usfm_utils.usfm.usfm_error import UsfmInputError
 
 # TODO
@@ -23,156 +23,251 @@ from usfm_utils.usfm.usfm_error import UsfmInputError
 # - images
 
 
-class UpdateablePosition(object):
-    def __init__(self, index_from=1):
-        self._line = index_from
-        self._col = index_from
-        self._index_from = index_from
+# kind code of the EOF token
+EOF = 0
 
-    @property
-    def position(self):
-        return Position(self._line, self._col)
+# number of characters of the source shown in "Unrecognized token" errors
+ERROR_CONTEXT = 80
 
-    def update(self, text):
-        for char in text:
-            if char == "\n":
-                self._line += 1
-                self._col = self._index_from
-            else:
-                self._col += 1
+# what is skipped after an unrecognized token, when lexing carries on
+UNRECOGNIZED_MARKER = re.compile(r"{prefix}\w*\*?|.".format(prefix=FLAG_PREFIX),
+                                 re.UNICODE | re.DOTALL)
 
 
-def lex_open_footnote(flag):
-    def lex_open_footnote_inner(token):
-        token.value = Token.Builder(token.value)
-        token.lexer.begin("footnotelabel")
-        return token
-    lex_open_footnote_inner.__doc__ = open_token_regex(flag)
-    return lex_open_footnote_inner
+def eof_offset(s):
+    """
+    The end of the input is reported at the start of the line following the last
+    one, whether or not the last line is terminated.
+    :param str s: USFM source
+    :rtype: int
+    """
+    return len(s) if s.endswith("\n") else len(s) + 1
+
+
+def lex_text(token):
+    if len(token.value.strip()) == 0:
+        return  # ignore text that is purely whitespace
+    return token
+lex_text.__doc__ = r"[^{prefix}]+".format(prefix=FLAG_PREFIX)
+
+
+def lex_footnote_label(token):
+    marker = token.value
+    if marker == "+":
+        token.value = AutomaticFootnoteLabel()
+    elif marker == "-":
+        token.value = NoFootnoteLabel()
+    else:
+        token.value = CustomFootnoteLabel(marker)
+    return token
+lex_footnote_label.__doc__ = r"[^\s{prefix}]+".format(prefix=FLAG_PREFIX)
 
 
 class UsfmLexer(object):
+    """
+    The rules of the lexer are registered once, on the class, and are never
+    modified afterwards. Each instance holds the state of lexing one input at a
+    time, so a lexer should not be shared between threads; create one per thread
+    (which is cheap) instead.
+    """
     states = (("footnotelabel", "exclusive"),)
 
-    def __init__(self):
-        self.token_list = ["EOF"]
-        self.tokens = None
-        self.pos = UpdateablePosition()
+    # names of all tokens, set when the rules are registered
+    tokens = None
+    _registration_lock = threading.Lock()
+
+    def __init__(self, track_positions=True):
+        """
+        :param bool track_positions: whether tokens and errors should report their
+        line/column positions
+        """
+        self.track_positions = track_positions
+        self.line_index = None
+        self.eof_offset = 0
         self.lexer = None
 
         self.reached_eof = False
 
+        # if not None, errors are appended to this list, and lexing carries on,
+        # instead of errors being raised
+        self.errors = None
+
     @staticmethod
-    def create():
+    def create(track_positions=True):
         """
         Factory method for constructing new instances. Should be used instead of
         "normal" initialization
+        :param bool track_positions: whether tokens and errors should report their
+        line/column positions
         """
-        usfm_lexer = UsfmLexer()
+        usfm_lexer = UsfmLexer(track_positions=track_positions)
         usfm_lexer.init()
         return usfm_lexer
 
-    def register(self, name, func, state=None, discard=False):
+    @staticmethod
+    def register(name, kind, func, state=None, discard=False, next_state=None):
         """
         "Registers" a lexical rule so that PLY will recognize it
         :param str|unicode name: name of token
+        :param int kind: kind code of token
         :param callable func: lexical rule to register
         :param str|unicode state: lexer state to which the rule applies
         :param bool discard: if token should be discarded
+        :param str|unicode next_state: lexer state to enter after the token, if any
         """
-        def register_helper(this, token):  # this to avoid collision with self
-            s = token.value
-            if func(token) is None:
-                this.pos.update(s)
-                return
-            token.value = token.value.build(this.pos.position)
-            this.pos.update(s)
-            if not discard:
-                return token
+        def register_helper(this, lex_token):  # this to avoid collision with self
+            token = Token(kind, lex_token.lexpos, lex_token.value, line_index=this.line_index)
+            lex_token.value = this.apply_rule(func, token, discard, next_state)
+            return None if lex_token.value is None else lex_token
         register_helper.__doc__ = func.__doc__
         qualified_name = name if state is None else "{}_{}".format(state, name)
         setattr(UsfmLexer, "t_" + qualified_name, register_helper)
-        self.token_list.append(name)
+
+    def apply_rule(self, func, token, discard=False, next_state=None):
+        """
+        Applies a lexical rule to a matched token
+        :param callable func: lexical rule
+        :param Token token: matched token, whose value is the matched text
+        :param bool discard: if token should be discarded
+        :param str|unicode next_state: lexer state to enter after the token, if any
+        :return: the token, or None if it should be skipped
+        :rtype: Token
+        """
+        if next_state is not None:
+            self.begin(next_state)
+        if func(token) is None or discard:
+            return None
+        return token
+
+    def begin(self, state):
+        self.lexer.begin(state)
+
+    def position(self, offset):
+        """
+        :param int offset: offset into the current input
+        :return: the corresponding position, or None if positions are not tracked
+        :rtype: Position
+        """
+        if self.line_index is None:
+            return None
+        return self.line_index.position(offset)
+
+    @staticmethod
+    def token_names():
+        """
+        :return: names of all tokens produced by the lexer
+        :rtype: tuple[str]
+        """
+        UsfmLexer.register_rules()
+        return UsfmLexer.tokens
 
     def init(self):
         """
-        Initialize the lexer, adding rules for PLY
+        Initialize the lexer, loading (or building) the tables for PLY
         """
-        if self.tokens is not None:
+        if self.lexer is not None:
             return
-        self.register("TEXT", self.t_text)
+        self.register_rules()
+        self.lexer = build_lexer(self)
+
+    @staticmethod
+    def lexical_rules():
+        """
+        :return: the lexical rules for USFM, in order of registration, as (token
+        name, rule, lexer state, discard, next lexer state)
+        :rtype: list[(str, callable, str, bool, str)]
+        """
+        rules = [("TEXT", lex_text, None, False, None)]
 
         for name, (flag, _) in paragraphs.items():
-            self.register(name, standalone(flag))
+            rules.append((name, standalone(flag), None, False, None))
 
         for name, (flag, _) in indented_paragraphs.items():
-            self.register(name, scale(flag))
+            rules.append((name, scale(flag), None, False, None))
 
         for name, (flag, _) in headings.items():
-            self.register(name, scale_and_rest_of_line(flag))
+            rules.append((name, scale_and_rest_of_line(flag), None, False, None))
 
         for name, (flag, _) in one_word_arguments.items():
-            self.register(name, one_arg(flag))
+            rules.append((name, one_arg(flag), None, False, None))
 
         for name, (flag, _) in itertools.chain(lower_open_closes.items(),
                                                higher_open_closes.items()):
-            self.register("OPEN_" + name, open_token(flag))
-            self.register("CLOSE_" + name, close_token(flag))
+            rules.append(("OPEN_" + name, open_token(flag), None, False, None))
+            rules.append(("CLOSE_" + name, close_token(flag), None, False, None))
 
         for name, (flag, _) in higher_rest_of_lines.items():
-            self.register(name, rest_of_line(flag))
+            rules.append((name, rest_of_line(flag), None, False, None))
 
         for name, flag in ignore_rest_of_lines.items():
-            self.register(name, rest_of_line(flag), discard=True)
+            rules.append((name, rest_of_line(flag), None, True, None))
 
         for name, (flag, _) in lower_until_next_flags.items():
-            self.register(name, until_next_flag(flag))
+            rules.append((name, until_next_flag(flag), None, False, None))
 
         for name, (flag, _) in footnotes.items():
-            self.register("OPEN_" + name, lex_open_footnote(flag))
-            self.register("CLOSE_" + name, close_token(flag))
-
-        def footnote_label(token):
-            marker = token.value
-            if marker == "+":
-                token.value = Token.Builder(AutomaticFootnoteLabel())
-            elif marker == "-":
-                token.value = Token.Builder(NoFootnoteLabel())
-            else:
-                token.value = Token.Builder(CustomFootnoteLabel(marker))
-
-            token.lexer.begin("INITIAL")
-            return token
-        footnote_label.__doc__ = r"[^\s{prefix}]+".format(prefix=FLAG_PREFIX)
-        self.register("FOOTNOTE_LABEL", footnote_label, "footnotelabel")
+            rules.append(("OPEN_" + name, open_token(flag), None, False, "footnotelabel"))
+            rules.append(("CLOSE_" + name, close_token(flag), None, False, None))
 
-        for name, (flag, _) in whitespace.items():
-            self.register(name, standalone(flag))
+        rules.append(("FOOTNOTE_LABEL", lex_footnote_label, "footnotelabel", False, "INITIAL"))
 
-        self.register("CHAPTER_LABEL", rest_of_line("cl"))
+        for name, (flag, _) in whitespace.items():
+            rules.append((name, standalone(flag), None, False, None))
 
-        self.tokens = tuple(self.token_list)
+        rules.append(("CHAPTER_LABEL", rest_of_line("cl"), None, False, None))
+        return rules
 
-        self.lexer = lex.lex(module=self)
+    @staticmethod
+    def register_rules():
+        """
+        Add rules for PLY. This is done once, on the UsfmLexer class
+        """
+        if UsfmLexer.tokens is not None:
+            return
+        with UsfmLexer._registration_lock:
+            if UsfmLexer.tokens is not None:
+                return
+            token_list = ["EOF"]
+            for name, func, state, discard, next_state in UsfmLexer.lexical_rules():
+                UsfmLexer.register(name, len(token_list), func, state, discard, next_state)
+                token_list.append(name)
+            Token.names = tuple(token_list)
+            UsfmLexer.tokens = Token.names
+
+    def report(self, error):
+        """
+        Raises an error, or records it if errors are being collected
+        :param UsfmInputError error:
+        """
+        if self.errors is None:
+            raise error
+        self.errors.append(error)
 
-    def t_text(self, token):
-        text = token.value
-        if len(text.strip()) == 0:
-            return  # ignore text that is purely whitespace
-        token.value = Token.Builder(text)
-        return token
-    t_text.__doc__ = r"[^\{prefix}]+".format(prefix=FLAG_PREFIX)
+    def skip(self, n):
+        """
+        Skips the next n characters of the input
+        :param int n:
+        """
+        self.lexer.skip(n)
 
     def t_error(self, token):
         text = token.value
         newline_index = text.find("\n")
-        max_index = 80 if newline_index < -1 or newline_index > 80 else newline_index
-        text_to_display = "\"{}\"".format(unescape_text(text[:max_index]))
-        raise UsfmInputError("Unrecognized token: {}".format(text_to_display),
-                             self.pos.position)
+        max_index = ERROR_CONTEXT if newline_index == -1 or newline_index > ERROR_CONTEXT \
+            else newline_index
+        text_to_display = "\"{}\"".format(text[:max_index])
+        self.report(UsfmInputError("Unrecognized token: {}".format(text_to_display),
+                                   self.position(token.lexpos)))
+        # carry on after the unrecognized marker
+        self.skip(len(UNRECOGNIZED_MARKER.match(text).group()))
 
     def t_footnotelabel_error(self, token):
-        raise UsfmInputError("Expected a footnote label", self.pos.position)
+        self.report(UsfmInputError("Expected a footnote label",
+                                   self.position(token.lexpos)))
+        # carry on without a label. PLY requires that an error handler consumes
+        # input, so the next token is lexed right away
+        self.begin("INITIAL")
+        return self.lexer.token()
 
     def t_whitespace(self, t):
         r"""[ \t\r\n]+"""
@@ -182,26 +277,54 @@ class UsfmLexer(object):
 
     def t_eof(self, token):
         if not self.reached_eof:
-            token.value = Token(self.pos.position, None)
+            token.value = Token(EOF, self.eof_offset, None, line_index=self.line_index)
             token.type = "EOF"
             self.reached_eof = True
             return token
 
+    # the input may end where a footnote label is expected
+    t_footnotelabel_eof = t_eof
+
     def input(self, s):
         self.lexer.begin("INITIAL")
         self.reached_eof = False
-        self.pos = UpdateablePosition()
-        s = escape_text(s)
-        if s[-1] != "\n":
-            s += "\n"
+        self.line_index = LineIndex(s) if self.track_positions else None
+        self.eof_offset = eof_offset(s)
         self.lexer.input(s)
 
     def token(self):
-        token = self.lexer.token()
-        return token
+        """
+        :return: the next token, or None at the end of the input
+        :rtype: Token
+        """
+        lex_token = self.lexer.token()
+        return None if lex_token is None else lex_token.value
 
     def get_tokens(self):
         return self.tokens
 
-lexer = UsfmLexer.create()
-tokens = lexer.get_tokens()  # a "tokens" global variable for parse.py
+
+tokens = UsfmLexer.token_names()  # a "tokens" global variable for parse.py
+
+
+def get_lexer():
+    """
+    :return: the module-level lexer, built on first use rather than at import
+    :rtype: UsfmLexer
+    """
+    global _lexer
+    if _lexer is None:
+        _lexer = UsfmLexer.create()
+    return _lexer
+
+
+class LazyLexer(object):
+    """
+    Stands in for the module-level lexer, which it builds on first use
+    """
+    def __getattr__(self, name):
+        return getattr(get_lexer(), name)
+
+
+_lexer = None
+lexer = LazyLexer()
@@ -3,14 +3,30 @@ Various constants and utility functions for lexing
 """
 
 import re
+import sys
 
-from usfm_utils.usfm.tokens import Token
-
-UNESCAPED_FLAG_PREFIX = "$"
+UNESCAPED_FLAG_PREFIX = "\\"
 FLAG_PREFIX = re.escape(UNESCAPED_FLAG_PREFIX)
 
 WHITESPACE = " \r\t\n"
 
+# the end of a line, or of the input if its last line is not terminated
+END_OF_LINE = r"(\n|\Z)"
+
+
+try:
+    intern_string = sys.intern
+except AttributeError:  # Python 2, whose intern() does not accept unicode
+    _interned_strings = {}
+
+    def intern_string(s):
+        """
+        :param str|unicode s:
+        :return: a string equal to s, shared by all such calls with equal strings
+        :rtype: str|unicode
+        """
+        return _interned_strings.setdefault(s, s)
+
 
 def make_flag(flag, boundary=True):
     """
@@ -30,8 +46,6 @@ def thunk(regex):
     :param str regex: regular expression for
     """
     def regex_inner(token):
-        token.value = Token.Builder(token.value)
-        # raise AssertionError()
         return token
     regex_inner.__doc__ = regex
     return regex_inner
@@ -47,7 +61,8 @@ def one_arg_regex(flag):
 
 def one_arg(flag):
     def one_arg_inner(token):
-        token.value = Token.Builder(token.value.split()[1])
+        # the arguments (verse and chapter numbers) repeat throughout a source
+        token.value = intern_string(token.value.split()[1])
         return token
     one_arg_inner.__doc__ = one_arg_regex(flag)
     return one_arg_inner
@@ -71,17 +86,18 @@ def close_token(flag):
 
 def rest_of_line(flag):
     def rest_of_line_inner(token):
-        line = token.value[:-1]  # ignore newline
-        token.value = Token.Builder(drop_first_word(line))
+        line = drop_newline(token.value)
+        token.value = drop_first_word(line)
         return token
-    rest_of_line_inner.__doc__ = r"{flag}(\s[^\n]*)?\n".format(flag=make_flag(flag))
+    rest_of_line_inner.__doc__ = r"{flag}(\s[^\n]*)?{end}".format(flag=make_flag(flag),
+                                                                end=END_OF_LINE)
     return rest_of_line_inner
 
 
 def until_next_flag(flag):
     def until_next_flag_inner(token):
         text = token.value
-        token.value = Token.Builder(drop_first_word(text))
+        token.value = drop_first_word(text)
         return token
     until_next_flag_inner.__doc__ = r"{flag}\s[^{prefix}]*".format(flag=make_flag(flag), prefix=FLAG_PREFIX)
     return until_next_flag_inner
@@ -99,6 +115,15 @@ def drop_first_word(line):
     return line[match.end():]
 
 
+def drop_newline(line):
+    """
+    :param str line:
+    :return: line without its terminating newline, if it has one
+    :rtype: str
+    """
+    return line[:-1] if line.endswith("\n") else line
+
+
 def scale(flag):
     def scale_inner(token):
         text = token.value
@@ -107,7 +132,7 @@ def scale(flag):
             raise ValueError("Malformatted input: {}".format(token.value))
         number_str = match.group()
         number = 1 if len(number_str) == 0 else int(number_str)
-        token.value = Token.Builder(text).set_number(number)
+        token.number = number
         return token
     scale_inner.__doc__ = r"{flag}[0-9]*\b".format(flag=make_flag(flag, boundary=False))
     return scale_inner
@@ -115,7 +140,7 @@ def scale(flag):
 
 def scale_and_rest_of_line(flag):
     def scale_and_rest_of_line_inner(token):
-        line = token.value[:-1]
+        line = drop_newline(token.value)
         rgx = r"{flag}([0-9]+)".format(flag=make_flag(flag, boundary=False))
         number_match = re.match(rgx, line)
         if number_match is None:
@@ -123,8 +148,9 @@ def scale_and_rest_of_line(flag):
         else:
             number = int(number_match.group(1))
         rest = drop_first_word(line)
-        token.value = Token.Builder(rest).set_number(number)
+        token.value = rest
+        token.number = number
         return token
-    scale_and_rest_of_line_inner.__doc__ = r"{flag}[0-9]*([ \r\t][^\n]*)?\n"\
-        .format(flag=make_flag(flag, boundary=False))
+    scale_and_rest_of_line_inner.__doc__ = r"{flag}[0-9]*([ \r\t][^\n]*)?{end}"\
+        .format(flag=make_flag(flag, boundary=False), end=END_OF_LINE)
     return scale_and_rest_of_line_inner
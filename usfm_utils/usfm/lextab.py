@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ACROSTIC_HEADING', 'BLANK_LINE', 'CENTERED_PARAGRAPH', 'CHAPTER', 'CHAPTER_LABEL', 'CLOSE_ALT_CHAPTER', 'CLOSE_ALT_VERSE', 'CLOSE_BOLD', 'CLOSE_BOLD_AND_ITALICS', 'CLOSE_BOOK_TITLE', 'CLOSE_CROSS_REFERENCE', 'CLOSE_CROSS_REF_DEUTEROCANONICAL', 'CLOSE_CROSS_REF_NEW_TESTAMENT', 'CLOSE_CROSS_REF_OLD_TESTAMENT', 'CLOSE_DEUTEROCANONICAL', 'CLOSE_EMPHASIS', 'CLOSE_ENDNOTE', 'CLOSE_FOOTNOTE', 'CLOSE_FOOTNOTE_DEUTEROCANONICAL', 'CLOSE_FOOTNOTE_REFERENCE_MARK', 'CLOSE_ITALICS', 'CLOSE_KEYWORD', 'CLOSE_NAME_OF_GOD', 'CLOSE_NORMAL', 'CLOSE_ORDINAL', 'CLOSE_PROPER_NAME', 'CLOSE_PUBLISHED_VERSE', 'CLOSE_QUOTED_TEXT', 'CLOSE_SECONDARY_LANG', 'CLOSE_SELAH', 'CLOSE_SIGNATURE', 'CLOSE_SMALL_CAPS', 'CLOSE_TRANSLATOR_ADDITION', 'CLOSE_WORDS_OF_JESUS', 'CROSS_REF_KEYWORD', 'CROSS_REF_ORIGIN', 'CROSS_REF_QUOTATION', 'DESCRIPTIVE_TITLE', 'EMBEDDED_CLOSING', 'EMBEDDED_OPENING', 'EMBEDDED_PARAGRAPH', 'EMBEDDED_POETIC', 'EMBEDDED_REFRAIN', 'ENCODING', 'EOF', 'EXPLANATORY', 'FILE_ID', 'FLUSH_PARAGRAPH', 'FOOTNOTE_ALT_QUOTATION', 'FOOTNOTE_KEYWORD', 'FOOTNOTE_LABEL', 'FOOTNOTE_QUOTATION', 'FOOTNOTE_REFERENCE', 'FOOTNOTE_TEXT', 'FOOTNOTE_VERSE', 'HEADING', 'INDENTED_PARAGRAPH', 'INTRO_BLANK_LINE', 'INTRO_FLUSH', 'INTRO_FLUSH_QUOTE', 'INTRO_INDENTED', 'INTRO_INDENTED_FLUSH', 'INTRO_LIST_ITEM', 'INTRO_MAJOR_TITLE', 'INTRO_MAJOR_TITLE_END', 'INTRO_OUTLINE_TITLE', 'INTRO_PARAGRAPH', 'INTRO_POETIC', 'INTRO_QUOTE', 'INTRO_RIGHT_ALIGNED', 'INTRO_SECTION', 'LIST_ITEM', 'MAJOR_SECTION', 'MAJOR_TITLE', 'MAJOR_TITLE_END', 'NO_BREAK', 'OPEN_ALT_CHAPTER', 'OPEN_ALT_VERSE', 'OPEN_BOLD', 'OPEN_BOLD_AND_ITALICS', 'OPEN_BOOK_TITLE', 'OPEN_CROSS_REFERENCE', 'OPEN_CROSS_REF_DEUTEROCANONICAL', 'OPEN_CROSS_REF_NEW_TESTAMENT', 'OPEN_CROSS_REF_OLD_TESTAMENT', 'OPEN_DEUTEROCANONICAL', 'OPEN_EMPHASIS', 'OPEN_ENDNOTE', 'OPEN_FOOTNOTE', 'OPEN_FOOTNOTE_DEUTEROCANONICAL', 'OPEN_FOOTNOTE_REFERENCE_MARK', 'OPEN_ITALICS', 'OPEN_KEYWORD', 'OPEN_NAME_OF_GOD', 'OPEN_NORMAL', 'OPEN_ORDINAL', 'OPEN_PROPER_NAME', 'OPEN_PUBLISHED_VERSE', 'OPEN_QUOTED_TEXT', 'OPEN_SECONDARY_LANG', 'OPEN_SELAH', 'OPEN_SIGNATURE', 'OPEN_SMALL_CAPS', 'OPEN_TRANSLATOR_ADDITION', 'OPEN_WORDS_OF_JESUS', 'PAGE_BREAK', 'PARAGRAPH', 'POETIC_CENTERED', 'POETIC_LINE', 'POETIC_RIGHT_ALIGNED', 'REM_TEXT', 'SECTION', 'SPEAKER_ID', 'STATUS', 'TABLE_OF_CONTENTS', 'TEXT', 'VERSE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'footnotelabel': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_ACROSTIC_HEADING>\\\\qa\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_BLANK_LINE>\\\\b\\b)|(?P<t_CENTERED_PARAGRAPH>\\\\pc\\b)|(?P<t_CHAPTER>\\\\c\\b\\s+[^\\\\\\s]+)|(?P<t_CHAPTER_LABEL>\\\\cl\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_CLOSE_ALT_CHAPTER>\\\\ca\\b\\*)|(?P<t_CLOSE_ALT_VERSE>\\\\va\\b\\*)|(?P<t_CLOSE_BOLD>\\\\bd\\b\\*)|(?P<t_CLOSE_BOLD_AND_ITALICS>\\\\bdit\\b\\*)|(?P<t_CLOSE_BOOK_TITLE>\\\\bk\\b\\*)|(?P<t_CLOSE_CROSS_REFERENCE>\\\\x\\b\\*)|(?P<t_CLOSE_CROSS_REF_DEUTEROCANONICAL>\\\\xdc\\b\\*)|(?P<t_CLOSE_CROSS_REF_NEW_TESTAMENT>\\\\xnt\\b\\*)|(?P<t_CLOSE_CROSS_REF_OLD_TESTAMENT>\\\\xot\\b\\*)|(?P<t_CLOSE_DEUTEROCANONICAL>\\\\dc\\b\\*)|(?P<t_CLOSE_EMPHASIS>\\\\em\\b\\*)|(?P<t_CLOSE_ENDNOTE>\\\\fe\\b\\*)|(?P<t_CLOSE_FOOTNOTE>\\\\f\\b\\*)|(?P<t_CLOSE_FOOTNOTE_DEUTEROCANONICAL>\\\\fdc\\b\\*)|(?P<t_CLOSE_FOOTNOTE_REFERENCE_MARK>\\\\fm\\b\\*)|(?P<t_CLOSE_ITALICS>\\\\it\\b\\*)|(?P<t_CLOSE_KEYWORD>\\\\k\\b\\*)|(?P<t_CLOSE_NAME_OF_GOD>\\\\nd\\b\\*)|(?P<t_CLOSE_NORMAL>\\\\no\\b\\*)|(?P<t_CLOSE_ORDINAL>\\\\ord\\b\\*)|(?P<t_CLOSE_PROPER_NAME>\\\\pn\\b\\*)|(?P<t_CLOSE_PUBLISHED_VERSE>\\\\vp\\b\\*)|(?P<t_CLOSE_QUOTED_TEXT>\\\\qt\\b\\*)|(?P<t_CLOSE_SECONDARY_LANG>\\\\sls\\b\\*)|(?P<t_CLOSE_SELAH>\\\\qs\\b\\*)|(?P<t_CLOSE_SIGNATURE>\\\\sig\\b\\*)|(?P<t_CLOSE_SMALL_CAPS>\\\\sc\\b\\*)|(?P<t_CLOSE_TRANSLATOR_ADDITION>\\\\add\\b\\*)|(?P<t_CLOSE_WORDS_OF_JESUS>\\\\wj\\b\\*)|(?P<t_CROSS_REF_KEYWORD>\\\\xk\\b\\s[^\\\\]*)|(?P<t_CROSS_REF_ORIGIN>\\\\xo\\b\\s[^\\\\]*)|(?P<t_CROSS_REF_QUOTATION>\\\\xq\\b\\s[^\\\\]*)|(?P<t_DESCRIPTIVE_TITLE>\\\\d\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_EMBEDDED_CLOSING>\\\\pmc\\b)|(?P<t_EMBEDDED_OPENING>\\\\pmo\\b)|(?P<t_EMBEDDED_PARAGRAPH>\\\\pm\\b)|(?P<t_EMBEDDED_POETIC>\\\\qm[0-9]*\\b)|(?P<t_EMBEDDED_REFRAIN>\\\\pmr\\b)|(?P<t_ENCODING>\\\\ide\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_EXPLANATORY>\\\\iex\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_FILE_ID>\\\\id\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_FLUSH_PARAGRAPH>\\\\m\\b)|(?P<t_FOOTNOTE_ALT_QUOTATION>\\\\fqa\\b\\s[^\\\\]*)|(?P<t_FOOTNOTE_KEYWORD>\\\\fk\\b\\s[^\\\\]*)|(?P<t_FOOTNOTE_QUOTATION>\\\\fq\\b\\s[^\\\\]*)|(?P<t_FOOTNOTE_REFERENCE>\\\\fr\\b\\s[^\\\\]*)|(?P<t_FOOTNOTE_TEXT>\\\\ft\\b\\s[^\\\\]*)|(?P<t_FOOTNOTE_VERSE>\\\\fv\\b\\s[^\\\\]*)|(?P<t_HEADING>\\\\h[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_INDENTED_PARAGRAPH>\\\\pi[0-9]*\\b)|(?P<t_INTRO_BLANK_LINE>\\\\ib\\b)|(?P<t_INTRO_FLUSH>\\\\im\\b)|(?P<t_INTRO_FLUSH_QUOTE>\\\\imq\\b)|(?P<t_INTRO_INDENTED>\\\\ipi\\b)|(?P<t_INTRO_INDENTED_FLUSH>\\\\imi\\b)|(?P<t_INTRO_LIST_ITEM>\\\\ili[0-9]*\\b)|(?P<t_INTRO_MAJOR_TITLE>\\\\imt[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_INTRO_MAJOR_TITLE_END>\\\\imte[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_INTRO_OUTLINE_TITLE>\\\\iot[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_INTRO_PARAGRAPH>\\\\ip\\b)|(?P<t_INTRO_POETIC>\\\\iq[0-9]*\\b)|(?P<t_INTRO_QUOTE>\\\\ipq\\b)|(?P<t_INTRO_RIGHT_ALIGNED>\\\\ipr\\b)|(?P<t_INTRO_SECTION>\\\\is[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_LIST_ITEM>\\\\li[0-9]*\\b)|(?P<t_MAJOR_SECTION>\\\\ms[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_MAJOR_TITLE>\\\\mt[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_MAJOR_TITLE_END>\\\\mte[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_NO_BREAK>\\\\nb\\b)|(?P<t_OPEN_ALT_CHAPTER>\\\\ca\\b[^\\*])|(?P<t_OPEN_ALT_VERSE>\\\\va\\b[^\\*])|(?P<t_OPEN_BOLD>\\\\bd\\b[^\\*])|(?P<t_OPEN_BOLD_AND_ITALICS>\\\\bdit\\b[^\\*])|(?P<t_OPEN_BOOK_TITLE>\\\\bk\\b[^\\*])|(?P<t_OPEN_CROSS_REFERENCE>\\\\x\\b[^\\*])|(?P<t_OPEN_CROSS_REF_DEUTEROCANONICAL>\\\\xdc\\b[^\\*])|(?P<t_OPEN_CROSS_REF_NEW_TESTAMENT>\\\\xnt\\b[^\\*])|(?P<t_OPEN_CROSS_REF_OLD_TESTAMENT>\\\\xot\\b[^\\*])|(?P<t_OPEN_DEUTEROCANONICAL>\\\\dc\\b[^\\*])|(?P<t_OPEN_EMPHASIS>\\\\em\\b[^\\*])|(?P<t_OPEN_ENDNOTE>\\\\fe\\b[^\\*])|(?P<t_OPEN_FOOTNOTE>\\\\f\\b[^\\*])|(?P<t_OPEN_FOOTNOTE_DEUTEROCANONICAL>\\\\fdc\\b[^\\*])|(?P<t_OPEN_FOOTNOTE_REFERENCE_MARK>\\\\fm\\b[^\\*])|(?P<t_OPEN_ITALICS>\\\\it\\b[^\\*])|(?P<t_OPEN_KEYWORD>\\\\k\\b[^\\*])|(?P<t_OPEN_NAME_OF_GOD>\\\\nd\\b[^\\*])|(?P<t_OPEN_NORMAL>\\\\no\\b[^\\*])|(?P<t_OPEN_ORDINAL>\\\\ord\\b[^\\*])|(?P<t_OPEN_PROPER_NAME>\\\\pn\\b[^\\*])|(?P<t_OPEN_PUBLISHED_VERSE>\\\\vp\\b[^\\*])|(?P<t_OPEN_QUOTED_TEXT>\\\\qt\\b[^\\*])|(?P<t_OPEN_SECONDARY_LANG>\\\\sls\\b[^\\*])|(?P<t_OPEN_SELAH>\\\\qs\\b[^\\*])|(?P<t_OPEN_SIGNATURE>\\\\sig\\b[^\\*])|(?P<t_OPEN_SMALL_CAPS>\\\\sc\\b[^\\*])|(?P<t_OPEN_TRANSLATOR_ADDITION>\\\\add\\b[^\\*])|(?P<t_OPEN_WORDS_OF_JESUS>\\\\wj\\b[^\\*])|(?P<t_PAGE_BREAK>\\\\pb\\b)|(?P<t_PARAGRAPH>\\\\p\\b)|(?P<t_POETIC_CENTERED>\\\\qc\\b)|(?P<t_POETIC_LINE>\\\\q[0-9]*\\b)|(?P<t_POETIC_RIGHT_ALIGNED>\\\\qr\\b)|(?P<t_REM_TEXT>\\\\rem_text\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_SECTION>\\\\s[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_SPEAKER_ID>\\\\sp\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_STATUS>\\\\sts\\b(\\s[^\\n]*)?(\\n|\\Z))|(?P<t_TABLE_OF_CONTENTS>\\\\toc[0-9]*([ \\r\\t][^\\n]*)?(\\n|\\Z))|(?P<t_TEXT>[^\\\\]+)|(?P<t_VERSE>\\\\v\\b\\s+[^\\\\\\s]+)|(?P<t_whitespace>[ \\t\\r\\n]+)', [None, ('t_ACROSTIC_HEADING', 'ACROSTIC_HEADING'), None, None, ('t_BLANK_LINE', 'BLANK_LINE'), ('t_CENTERED_PARAGRAPH', 'CENTERED_PARAGRAPH'), ('t_CHAPTER', 'CHAPTER'), ('t_CHAPTER_LABEL', 'CHAPTER_LABEL'), None, None, ('t_CLOSE_ALT_CHAPTER', 'CLOSE_ALT_CHAPTER'), ('t_CLOSE_ALT_VERSE', 'CLOSE_ALT_VERSE'), ('t_CLOSE_BOLD', 'CLOSE_BOLD'), ('t_CLOSE_BOLD_AND_ITALICS', 'CLOSE_BOLD_AND_ITALICS'), ('t_CLOSE_BOOK_TITLE', 'CLOSE_BOOK_TITLE'), ('t_CLOSE_CROSS_REFERENCE', 'CLOSE_CROSS_REFERENCE'), ('t_CLOSE_CROSS_REF_DEUTEROCANONICAL', 'CLOSE_CROSS_REF_DEUTEROCANONICAL'), ('t_CLOSE_CROSS_REF_NEW_TESTAMENT', 'CLOSE_CROSS_REF_NEW_TESTAMENT'), ('t_CLOSE_CROSS_REF_OLD_TESTAMENT', 'CLOSE_CROSS_REF_OLD_TESTAMENT'), ('t_CLOSE_DEUTEROCANONICAL', 'CLOSE_DEUTEROCANONICAL'), ('t_CLOSE_EMPHASIS', 'CLOSE_EMPHASIS'), ('t_CLOSE_ENDNOTE', 'CLOSE_ENDNOTE'), ('t_CLOSE_FOOTNOTE', 'CLOSE_FOOTNOTE'), ('t_CLOSE_FOOTNOTE_DEUTEROCANONICAL', 'CLOSE_FOOTNOTE_DEUTEROCANONICAL'), ('t_CLOSE_FOOTNOTE_REFERENCE_MARK', 'CLOSE_FOOTNOTE_REFERENCE_MARK'), ('t_CLOSE_ITALICS', 'CLOSE_ITALICS'), ('t_CLOSE_KEYWORD', 'CLOSE_KEYWORD'), ('t_CLOSE_NAME_OF_GOD', 'CLOSE_NAME_OF_GOD'), ('t_CLOSE_NORMAL', 'CLOSE_NORMAL'), ('t_CLOSE_ORDINAL', 'CLOSE_ORDINAL'), ('t_CLOSE_PROPER_NAME', 'CLOSE_PROPER_NAME'), ('t_CLOSE_PUBLISHED_VERSE', 'CLOSE_PUBLISHED_VERSE'), ('t_CLOSE_QUOTED_TEXT', 'CLOSE_QUOTED_TEXT'), ('t_CLOSE_SECONDARY_LANG', 'CLOSE_SECONDARY_LANG'), ('t_CLOSE_SELAH', 'CLOSE_SELAH'), ('t_CLOSE_SIGNATURE', 'CLOSE_SIGNATURE'), ('t_CLOSE_SMALL_CAPS', 'CLOSE_SMALL_CAPS'), ('t_CLOSE_TRANSLATOR_ADDITION', 'CLOSE_TRANSLATOR_ADDITION'), ('t_CLOSE_WORDS_OF_JESUS', 'CLOSE_WORDS_OF_JESUS'), ('t_CROSS_REF_KEYWORD', 'CROSS_REF_KEYWORD'), ('t_CROSS_REF_ORIGIN', 'CROSS_REF_ORIGIN'), ('t_CROSS_REF_QUOTATION', 'CROSS_REF_QUOTATION'), ('t_DESCRIPTIVE_TITLE', 'DESCRIPTIVE_TITLE'), None, None, ('t_EMBEDDED_CLOSING', 'EMBEDDED_CLOSING'), ('t_EMBEDDED_OPENING', 'EMBEDDED_OPENING'), ('t_EMBEDDED_PARAGRAPH', 'EMBEDDED_PARAGRAPH'), ('t_EMBEDDED_POETIC', 'EMBEDDED_POETIC'), ('t_EMBEDDED_REFRAIN', 'EMBEDDED_REFRAIN'), ('t_ENCODING', 'ENCODING'), None, None, ('t_EXPLANATORY', 'EXPLANATORY'), None, None, ('t_FILE_ID', 'FILE_ID'), None, None, ('t_FLUSH_PARAGRAPH', 'FLUSH_PARAGRAPH'), ('t_FOOTNOTE_ALT_QUOTATION', 'FOOTNOTE_ALT_QUOTATION'), ('t_FOOTNOTE_KEYWORD', 'FOOTNOTE_KEYWORD'), ('t_FOOTNOTE_QUOTATION', 'FOOTNOTE_QUOTATION'), ('t_FOOTNOTE_REFERENCE', 'FOOTNOTE_REFERENCE'), ('t_FOOTNOTE_TEXT', 'FOOTNOTE_TEXT'), ('t_FOOTNOTE_VERSE', 'FOOTNOTE_VERSE'), ('t_HEADING', 'HEADING'), None, None, ('t_INDENTED_PARAGRAPH', 'INDENTED_PARAGRAPH'), ('t_INTRO_BLANK_LINE', 'INTRO_BLANK_LINE'), ('t_INTRO_FLUSH', 'INTRO_FLUSH'), ('t_INTRO_FLUSH_QUOTE', 'INTRO_FLUSH_QUOTE'), ('t_INTRO_INDENTED', 'INTRO_INDENTED'), ('t_INTRO_INDENTED_FLUSH', 'INTRO_INDENTED_FLUSH'), ('t_INTRO_LIST_ITEM', 'INTRO_LIST_ITEM'), ('t_INTRO_MAJOR_TITLE', 'INTRO_MAJOR_TITLE'), None, None, ('t_INTRO_MAJOR_TITLE_END', 'INTRO_MAJOR_TITLE_END'), None, None, ('t_INTRO_OUTLINE_TITLE', 'INTRO_OUTLINE_TITLE'), None, None, ('t_INTRO_PARAGRAPH', 'INTRO_PARAGRAPH'), ('t_INTRO_POETIC', 'INTRO_POETIC'), ('t_INTRO_QUOTE', 'INTRO_QUOTE'), ('t_INTRO_RIGHT_ALIGNED', 'INTRO_RIGHT_ALIGNED'), ('t_INTRO_SECTION', 'INTRO_SECTION'), None, None, ('t_LIST_ITEM', 'LIST_ITEM'), ('t_MAJOR_SECTION', 'MAJOR_SECTION'), None, None, ('t_MAJOR_TITLE', 'MAJOR_TITLE'), None, None, ('t_MAJOR_TITLE_END', 'MAJOR_TITLE_END'), None, None, ('t_NO_BREAK', 'NO_BREAK'), ('t_OPEN_ALT_CHAPTER', 'OPEN_ALT_CHAPTER'), ('t_OPEN_ALT_VERSE', 'OPEN_ALT_VERSE'), ('t_OPEN_BOLD', 'OPEN_BOLD'), ('t_OPEN_BOLD_AND_ITALICS', 'OPEN_BOLD_AND_ITALICS'), ('t_OPEN_BOOK_TITLE', 'OPEN_BOOK_TITLE'), ('t_OPEN_CROSS_REFERENCE', 'OPEN_CROSS_REFERENCE'), ('t_OPEN_CROSS_REF_DEUTEROCANONICAL', 'OPEN_CROSS_REF_DEUTEROCANONICAL'), ('t_OPEN_CROSS_REF_NEW_TESTAMENT', 'OPEN_CROSS_REF_NEW_TESTAMENT'), ('t_OPEN_CROSS_REF_OLD_TESTAMENT', 'OPEN_CROSS_REF_OLD_TESTAMENT'), ('t_OPEN_DEUTEROCANONICAL', 'OPEN_DEUTEROCANONICAL'), ('t_OPEN_EMPHASIS', 'OPEN_EMPHASIS'), ('t_OPEN_ENDNOTE', 'OPEN_ENDNOTE'), ('t_OPEN_FOOTNOTE', 'OPEN_FOOTNOTE'), ('t_OPEN_FOOTNOTE_DEUTEROCANONICAL', 'OPEN_FOOTNOTE_DEUTEROCANONICAL'), ('t_OPEN_FOOTNOTE_REFERENCE_MARK', 'OPEN_FOOTNOTE_REFERENCE_MARK'), ('t_OPEN_ITALICS', 'OPEN_ITALICS'), ('t_OPEN_KEYWORD', 'OPEN_KEYWORD'), ('t_OPEN_NAME_OF_GOD', 'OPEN_NAME_OF_GOD'), ('t_OPEN_NORMAL', 'OPEN_NORMAL'), ('t_OPEN_ORDINAL', 'OPEN_ORDINAL'), ('t_OPEN_PROPER_NAME', 'OPEN_PROPER_NAME'), ('t_OPEN_PUBLISHED_VERSE', 'OPEN_PUBLISHED_VERSE'), ('t_OPEN_QUOTED_TEXT', 'OPEN_QUOTED_TEXT'), ('t_OPEN_SECONDARY_LANG', 'OPEN_SECONDARY_LANG'), ('t_OPEN_SELAH', 'OPEN_SELAH'), ('t_OPEN_SIGNATURE', 'OPEN_SIGNATURE'), ('t_OPEN_SMALL_CAPS', 'OPEN_SMALL_CAPS'), ('t_OPEN_TRANSLATOR_ADDITION', 'OPEN_TRANSLATOR_ADDITION'), ('t_OPEN_WORDS_OF_JESUS', 'OPEN_WORDS_OF_JESUS'), ('t_PAGE_BREAK', 'PAGE_BREAK'), ('t_PARAGRAPH', 'PARAGRAPH'), ('t_POETIC_CENTERED', 'POETIC_CENTERED'), ('t_POETIC_LINE', 'POETIC_LINE'), ('t_POETIC_RIGHT_ALIGNED', 'POETIC_RIGHT_ALIGNED'), ('t_REM_TEXT', 'REM_TEXT'), None, None, ('t_SECTION', 'SECTION'), None, None, ('t_SPEAKER_ID', 'SPEAKER_ID'), None, None, ('t_STATUS', 'STATUS'), None, None, ('t_TABLE_OF_CONTENTS', 'TABLE_OF_CONTENTS'), None, None, ('t_TEXT', 'TEXT'), ('t_VERSE', 'VERSE'), ('t_whitespace', 'whitespace')])], 'footnotelabel': [('(?P<t_footnotelabel_FOOTNOTE_LABEL>[^\\s\\\\]+)|(?P<t_footnotelabel_whitespace>[ \\t\\r\\n]+)', [None, ('t_footnotelabel_FOOTNOTE_LABEL', 'FOOTNOTE_LABEL'), ('t_footnotelabel_whitespace', 'whitespace')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'footnotelabel': 't_footnotelabel_error'}
+_lexstateeoff = {'INITIAL': 't_eof', 'footnotelabel': 't_eof'}
+_flags_checksum = '330a4160ed6802b5599fd33fe14da5fd546fa0b4'
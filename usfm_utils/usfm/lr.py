@@ -0,0 +1,304 @@
+"""
+A table-driven LR parsing loop over the tables that PLY generates.
+
+Unlike PLY's own LRParser.parse, LRDriver.run is a generator that can pause after
+selected reductions, which lets callers consume the results of a parse while it
+is still in progress.
+"""
+
+
+class Production(object):
+    """
+    The object passed to grammar rules, as in PLY: t[n] is the value of the n-th
+    symbol of the production, and t[0] is set to the value of the production.
+    t.context is the state of the parse in progress, as given to LRDriver.run
+    """
+    def __init__(self, context=None):
+        self.slice = None
+        self.context = context
+
+    def __getitem__(self, n):
+        return self.slice[n]
+
+    def __setitem__(self, n, value):
+        self.slice[n] = value
+
+    def __len__(self):
+        return len(self.slice)
+
+
+class CountingProduction(object):
+    """
+    Stands in for a production, counting its reductions
+    """
+    def __init__(self, production, counts, number):
+        """
+        :param production: production of PLY's tables
+        :param list[int] counts: counts of reductions, indexed by production number
+        :param int number: number of the production
+        """
+        self.name = production.name
+        self.len = production.len
+        self._callable = production.callable
+        self._counts = counts
+        self._number = number
+
+    def callable(self, production):
+        self._counts[self._number] += 1
+        self._callable(production)
+
+
+class LRDriver(object):
+    """
+    A driver only reads its tables, so a single driver can run any number of
+    parses at the same time, from any number of threads.
+
+    Tokens are identified by their integer kind code (token.kind), which indexes
+    the names of the terminals of the grammar. The action table of each state is
+    stored as a list indexed by kind code, with an extra entry for the end of the
+    input.
+    """
+    def __init__(self, lr_parser, token_names):
+        """
+        :param ply.yacc.LRParser lr_parser: parser whose tables (and bound grammar
+        rules) should be used
+        :param tuple[str] token_names: names of the terminals, indexed by kind code
+        """
+        self._token_names = tuple(token_names) + ("$end",)
+        self._end = len(token_names)
+        kinds = dict((name, kind) for kind, name in enumerate(self._token_names))
+        self._actions = [None] * len(lr_parser.action)
+        for state, state_actions in lr_parser.action.items():
+            dense_actions = [None] * len(self._token_names)
+            for name, action in state_actions.items():
+                if name in kinds:
+                    dense_actions[kinds[name]] = action
+            self._actions[state] = dense_actions
+        self._goto = lr_parser.goto
+        self._productions = lr_parser.productions
+        self._production_names = tuple(production.str for production in self._productions)
+        self._defaulted_states = lr_parser.defaulted_states
+        # number of the empty production of each nonterminal that has one
+        self._empty_productions = dict((production.name, number)
+                                       for number, production in enumerate(self._productions)
+                                       if number and production.len == 0)
+
+    @property
+    def production_names(self):
+        """
+        :return: a description of each production, indexed by production number
+        :rtype: tuple[str]
+        """
+        return self._production_names
+
+    def parse(self, token_func, error_func, context=None, recover_to=None, reductions=None):
+        """
+        :param callable token_func: returns the next token, or None at the end of input
+        :param callable error_func: called with the offending token (None at the end
+        of input) on a syntax error
+        :param context: state of the parse, passed to grammar rules
+        :param str recover_to: see run
+        :param list[int] reductions: see run
+        :return: the value of the start symbol
+        """
+        result = []
+        for _ in self.run(token_func, error_func, result, context=context,
+                          recover_to=recover_to, reductions=reductions):
+            pass
+        return result[0]
+
+    def run(self, token_func, error_func, result, pause_after=(), context=None,
+            recover_to=None, reductions=None):
+        """
+        Generator performing a parse. It yields (None) after each reduction of one
+        of the productions whose names are in pause_after. The values of terminals
+        are the tokens themselves.
+
+        If recover_to is given, the parse carries on after a syntax error (once
+        error_func has returned): the stacks are unwound to the state reached by
+        recover_to from the initial state, and tokens are skipped until one that
+        can follow recover_to. Whatever was parsed since recover_to is dropped. An
+        error before recover_to is first reduced (e.g. on the first token) reduces
+        its empty production instead. If the input ends before such a token, the
+        tokens still needed to complete the parse are made up, with None values
+        (for the lowest kind code allowed in each state), so a value is always
+        returned and no error is raised for any input.
+        :param callable token_func: returns the next token, or None at the end of input
+        :param callable error_func: called with the offending token (None at the end
+        of input) on a syntax error
+        :param list result: the value of the start symbol is appended to it
+        :param pause_after: names of the productions to pause after
+        :param context: state of the parse, passed to grammar rules
+        :param str recover_to: name of a (left-recursive) nonterminal with an empty
+        production, derived at the start of the input, to recover to after syntax
+        errors
+        :param list[int] reductions: if not None, a count for each production (see
+        production_names), incremented whenever it is reduced
+        """
+        actions = self._actions
+        goto = self._goto
+        if reductions is None:
+            productions = self._productions
+        else:
+            productions = [CountingProduction(production, reductions, number)
+                           for number, production in enumerate(self._productions)]
+        defaulted_states = self._defaulted_states
+        end = self._end
+        production = Production(context)
+
+        state_stack = [0]
+        value_stack = [None]
+        state = 0
+        lookahead = None
+        kind = None
+        completing = False  # whether missing tokens are made up
+        while True:
+            if state in defaulted_states:
+                action = defaulted_states[state]
+            else:
+                if kind is None:
+                    lookahead = token_func()
+                    kind = end if lookahead is None else lookahead.kind
+                action = actions[state][kind]
+
+            if action is None and completing:
+                # the input ended within recover_to: make up the missing token
+                lookahead, kind = None, self._missing_kind(state)
+                action = actions[state][kind]
+            if action is None:
+                error_func(lookahead)
+                lookahead, kind = self._recover(state_stack, lookahead, kind,
+                                                token_func, recover_to)
+                if kind == end:
+                    completing = True
+                    token_func = _end_of_input
+                del value_stack[len(state_stack):]
+                if len(value_stack) < len(state_stack):
+                    # recover_to had not been reduced yet: reduce its empty production
+                    values = [None]
+                    production.slice = values
+                    productions[self._empty_productions[recover_to]].callable(production)
+                    value_stack.append(values[0])
+                state = state_stack[-1]
+                continue
+            elif action > 0:  # shift
+                state_stack.append(action)
+                value_stack.append(lookahead)
+                state = action
+                kind = None
+            elif action < 0:  # reduce
+                rule = productions[-action]
+                length = rule.len
+                if length:
+                    values = value_stack[-length - 1:]
+                    values[0] = None
+                    del value_stack[-length:]
+                    del state_stack[-length:]
+                else:
+                    values = [None]
+                production.slice = values
+                rule.callable(production)
+                value_stack.append(values[0])
+                state = goto[state_stack[-1]][rule.name]
+                state_stack.append(state)
+                if rule.name in pause_after:
+                    yield
+            else:  # accept
+                result.append(value_stack[-1])
+                return
+
+    def recognize(self, token_func, error_func, recover_to=None):
+        """
+        Checks whether the input is accepted, without calling any grammar rule
+        (and thus without building any value). Otherwise behaves like parse
+        :param callable token_func: returns the next token, or None at the end of input
+        :param callable error_func: called with the offending token (None at the end
+        of input) on a syntax error
+        :param str recover_to: see run
+        """
+        actions = self._actions
+        goto = self._goto
+        productions = self._productions
+        defaulted_states = self._defaulted_states
+        end = self._end
+
+        state_stack = [0]
+        state = 0
+        lookahead = None
+        kind = None
+        completing = False  # whether missing tokens are made up
+        while True:
+            if state in defaulted_states:
+                action = defaulted_states[state]
+            else:
+                if kind is None:
+                    lookahead = token_func()
+                    kind = end if lookahead is None else lookahead.kind
+                action = actions[state][kind]
+
+            if action is None and completing:
+                # the input ended within recover_to: make up the missing token
+                lookahead, kind = None, self._missing_kind(state)
+                action = actions[state][kind]
+            if action is None:
+                error_func(lookahead)
+                lookahead, kind = self._recover(state_stack, lookahead, kind,
+                                                token_func, recover_to)
+                if kind == end:
+                    completing = True
+                    token_func = _end_of_input
+                state = state_stack[-1]
+            elif action > 0:  # shift
+                state_stack.append(action)
+                state = action
+                kind = None
+            elif action < 0:  # reduce
+                rule = productions[-action]
+                if rule.len:
+                    del state_stack[-rule.len:]
+                state = goto[state_stack[-1]][rule.name]
+                state_stack.append(state)
+            else:  # accept
+                return
+
+    def _recover(self, state_stack, lookahead, kind, token_func, recover_to):
+        """
+        Unwinds state_stack to the state reached by recover_to from the initial
+        state (pushing it if recover_to has not been reduced yet, in which case the
+        caller reduces its empty production), and skips tokens until one that can
+        follow recover_to, or the end of input
+        :return: the next token, and its kind code
+        :rtype: (Token, int)
+        """
+        if recover_to is None:
+            raise SyntaxError("Unexpected token of type {}".format(self._token_names[kind]))
+        recovery_state = self._goto[0].get(recover_to)
+        if len(state_stack) == 1 and recover_to in self._empty_productions:
+            state_stack.append(recovery_state)
+        if recovery_state is None or state_stack[1] != recovery_state:
+            raise ValueError("Cannot recover to {}: it is not derived at the start of "
+                             "the input".format(recover_to))
+        del state_stack[2:]
+        recovery_actions = self._actions[recovery_state]
+        while recovery_actions[kind] is None and kind != self._end:
+            lookahead = token_func()
+            kind = self._end if lookahead is None else lookahead.kind
+        return lookahead, kind
+
+    def _missing_kind(self, state):
+        """
+        :return: the lowest kind code with an action in the given state
+        :rtype: int
+        """
+        for kind, action in enumerate(self._actions[state]):
+            if action is not None:
+                return kind
+        raise ValueError("No action in state {}".format(state))
+
+
+def _end_of_input():
+    """
+    Token function standing in for that of a parse once its input has ended
+    :rtype: None
+    """
+    return None
@@ -1,20 +1,25 @@
-import ply.yacc as yacc
+import itertools
+import threading
+
 from usfm_utils.elements.paragraph_utils import LeftAligned
 
 from usfm_utils.elements.document import Document, TableOfContentsInfo
 from usfm_utils.elements.element_impls import Footnote, FormattedText, \
     Paragraph, Text, ChapterNumber
+from usfm_utils.elements.flat import FlatDocument
 from usfm_utils.usfm.flags import paragraphs, indented_paragraphs, \
     lower_open_closes, higher_open_closes, headings, higher_rest_of_lines, \
-    lower_until_next_flags, whitespace
-from usfm_utils.usfm.lex import tokens
+    lower_until_next_flags, whitespace, footnotes
+from usfm_utils.usfm.lex import UsfmLexer, tokens
+from usfm_utils.usfm.lr import LRDriver
+from usfm_utils.usfm.tables import build_parser
 from usfm_utils.usfm.usfm_error import UsfmInputError
 
 
 def parse_paragraph(name, builder):
     def parse_paragraph_inner(self, t):
         paragraph = builder(t[2])
-        self._previous_paragraph = paragraph
+        t.context.previous_paragraph = paragraph
         t[0] = [paragraph]
     parse_paragraph_inner.__doc__ = "higher_element : {} lower_elements".format(name)
     return parse_paragraph_inner
@@ -25,7 +30,7 @@ def parse_indented_paragraph(name, constructor):
         indent = t[1].number
         children = t[2]
         paragraph = constructor(children, indent)
-        self._previous_paragraph = paragraph
+        t.context.previous_paragraph = paragraph
         t[0] = [paragraph]
     parse_indented_paragraph_inner.__doc__ = "higher_element : {} lower_elements".format(name)
     return parse_indented_paragraph_inner
@@ -91,51 +96,94 @@ def unary_rule(f, index, extract=False):
     return unary_rule_inner
 
 
+class ParseContext(object):
+    """
+    The state of a single parse. A new context is created for every document, so
+    that nothing carries over from one document to the next
+    """
+    def __init__(self, sink=None):
+        """
+        :param list sink: if not None, completed higher elements are moved to
+        this list instead of accumulating in the document
+        """
+        # tracking chapter labels
+        self.relative_chapter_label = None
+
+        # previous paragraph
+        self.previous_paragraph = None
+
+        # metadata
+        self.heading = None
+        self.toc_builder = TableOfContentsInfo.Builder()
+
+        self.sink = sink
+
 
 class UsfmParser(object):
+    """
+    A UsfmParser holds no state about the documents it parses: grammar rules are
+    registered once on the class, the parsing tables are loaded once and shared
+    by all instances, and the state of each parse lives in its own ParseContext.
+    An instance can therefore be used by several threads at the same time, and
+    be called again from within a parse (e.g. while consuming iter_elements).
+    """
     start = "document"
 
     # right associativity favors shifting
     precedence = (("right", "CHAPTER_LABEL", "CHAPTER"),)
 
-    def __init__(self):
-        # tracking chapter labels
-        self.relative_chapter_label = None
-        self.tokens = None
+    tokens = tokens
+    _registered = False
 
-        # tracking text formatting
-        self._formattings = []
-        self._parser = None
+    # LRDriver over the shared parsing tables, loaded on first use
+    _driver = None
+    _driver_lock = threading.Lock()
 
-        # previous paragraph
-        self._previous_paragraph = None
+    def __init__(self, lexer_class=None, track_positions=True):
+        """
+        :param type lexer_class: lexing engine to use in parse_text, either
+        UsfmLexer (the default) or UsfmScanner
+        :param bool track_positions: whether errors raised by parse_text should
+        report their positions
+        """
+        self._lexer_class = UsfmLexer if lexer_class is None else lexer_class
+        self._track_positions = track_positions
 
-        # metadata
-        self._heading = None
-        self._toc_builder = TableOfContentsInfo.Builder()
+        # idle lexers, each used by at most one parse at a time
+        self._lexers = []
 
     def reset(self):
-        self.relative_chapter_label = None
-        self._formattings = None
+        """
+        Does nothing: the state of each parse is created afresh for it. Kept for
+        compatibility
+        """
+        pass
 
     @staticmethod
-    def create():
+    def create(lexer_class=None, track_positions=True):
         """
         Factory method for constructing new instances. Should be used instead of
         "normal" initialization
+        :param type lexer_class: lexing engine to use in parse_text, either
+        UsfmLexer (the default) or UsfmScanner
+        :param bool track_positions: whether errors raised by parse_text should
+        report their positions
         """
-        usfm_parser = UsfmParser()
+        usfm_parser = UsfmParser(lexer_class=lexer_class,
+                                 track_positions=track_positions)
         usfm_parser.init()
         return usfm_parser
 
-    def register(self, name, func):
+    @staticmethod
+    def register(name, func):
         setattr(UsfmParser, "p_" + name, func)
 
     def p_document(self, t):
         """document : higher_elements EOF"""
+        context = t.context
         t[0] = Document(t[1],
-                        heading=self._heading,
-                        table_of_contents=self._toc_builder.build())
+                        heading=context.heading,
+                        table_of_contents=context.toc_builder.build())
 
     def p_higher_elements(self, t):
         """higher_elements : higher_elements higher_element
@@ -144,32 +192,51 @@ class UsfmParser(object):
             t[0] = []
             return
         l = t[1]
-        l.extend(t[2])
+        sink = t.context.sink
+        if sink is None:
+            l.extend(t[2])
+        else:
+            sink.extend(t[2])
         t[0] = l
 
     def init(self):
-        self.tokens = tokens
+        """
+        Initialize the parser. The parsing tables themselves are loaded on the
+        first call to parse()
+        """
+        self.register_rules()
+
+    @staticmethod
+    def register_rules():
+        """
+        Add rules for PLY. This is done once, on the UsfmParser class, when this
+        module is imported
+        """
+        if UsfmParser._registered:
+            return
+        UsfmParser._registered = True
+        register = UsfmParser.register
 
         for (name, (flag, builder)) in paragraphs.items():
             if builder is None:
                 continue
-            self.register(name, parse_paragraph(name, builder))
+            register(name, parse_paragraph(name, builder))
 
         for (name, (flag, constructor)) in indented_paragraphs.items():
-            self.register(name, parse_indented_paragraph(name, constructor))
+            register(name, parse_indented_paragraph(name, constructor))
 
         for name in headings:
             _, builder = headings[name]
             if builder is not None:
                 rule = parse_heading(name, builder)
-                self.register(name, rule)
+                register(name, rule)
 
         for name in lower_open_closes:
             _, constructor = lower_open_closes[name]
             if constructor is not None:
                 rule = unary_rule(constructor, 2)
                 rule.__doc__ = "lower_element : {} lower_elements {}".format("OPEN_" + name, "CLOSE_" + name)
-                self.register(name, rule)
+                register(name, rule)
 
         for name in higher_open_closes:
             _, constructor = higher_open_closes[name]
@@ -177,33 +244,32 @@ class UsfmParser(object):
                 rule = higher_rule(unary_rule(constructor, 2), 4)
                 rule.__doc__ = "higher_element : {} lower_elements {} lower_elements".format(
                     "OPEN_" + name, "CLOSE_" + name)
-                self.register(name, rule)
+                register(name, rule)
 
         for name in higher_rest_of_lines:
             _, constructor = higher_rest_of_lines[name]
             if constructor is not None:
                 rule = higher_rule(unary_rule(of_text(constructor), 1, extract=True), 2)
                 rule.__doc__ = "higher_element : {} lower_elements".format(name)
-                self.register(name, rule)
+                register(name, rule)
 
         for name in lower_until_next_flags:
             _, builder = lower_until_next_flags[name]
             if builder is not None:
                 rule = unary_rule(of_text(builder), 1, extract=True)
                 rule.__doc__ = "lower_element : {}".format(name)
-                self.register(name, rule)
+                register(name, rule)
 
         for name in whitespace:
             _, kind = whitespace[name]
             rule = parse_whitespace(name, kind)
-            self.register(name, rule)
-
-        self._parser = yacc.yacc(module=self)
+            register(name, rule)
 
     def p_chapter(self, t):
         """higher_element : CHAPTER lower_elements"""
-        if self.relative_chapter_label is not None:
-            text = self.relative_chapter_label + " " + t[1].value
+        relative_chapter_label = t.context.relative_chapter_label
+        if relative_chapter_label is not None:
+            text = relative_chapter_label + " " + t[1].value
         else:
             text = t[1].value
         chapter = ChapterNumber(ChapterNumber.Kind.standard, [Text(text)])
@@ -214,8 +280,8 @@ class UsfmParser(object):
 
     def p_chapter_label_before(self, t):
         """higher_element : CHAPTER_LABEL CHAPTER lower_elements"""
-        self.relative_chapter_label = t[1].value
-        text = self.relative_chapter_label + " " + t[2].value
+        t.context.relative_chapter_label = t[1].value
+        text = t[1].value + " " + t[2].value
         chapter = ChapterNumber(ChapterNumber.Kind.standard, [Text(text)])
         if len(t[3]) == 0:
             t[0] = [chapter]
@@ -232,13 +298,12 @@ class UsfmParser(object):
 
     def p_heading(self, t):
         """higher_element : HEADING"""
-        heading = t[1].value
-        self._heading = heading
+        t.context.heading = t[1].value
         t[0] = []
 
     def p_no_break(self, t):
         """higher_element : NO_BREAK lower_elements"""
-        prev = self._previous_paragraph
+        prev = t.context.previous_paragraph
         if prev is None:
             paragraph = Paragraph(t[2])
         else:
@@ -250,19 +315,20 @@ class UsfmParser(object):
                 poetic=prev.poetic,
                 continuation=True
             )
-        self._previous_paragraph = paragraph
+        t.context.previous_paragraph = paragraph
         t[0] = [paragraph]
 
     def p_toc(self, t):
         """higher_element : TABLE_OF_CONTENTS"""
         value = t[1].value
         weight = t[1].number
+        toc_builder = t.context.toc_builder
         if weight == 1:
-            self._toc_builder.set_long_description(value)
+            toc_builder.set_long_description(value)
         elif weight == 2:
-            self._toc_builder.set_short_description(value)
+            toc_builder.set_short_description(value)
         elif weight == 3:
-            self._toc_builder.set_abbreviation(value)
+            toc_builder.set_abbreviation(value)
         else:
             pass  # TODO warning?
         t[0] = []
@@ -302,8 +368,337 @@ class UsfmParser(object):
         t[0] = Footnote(Footnote.Kind.cross_reference, t[3], t[2].value)
 
     def p_error(self, token):
+        raise self.syntax_error(token)
+
+    @staticmethod
+    def syntax_error(token):
+        """
+        :param Token token: unexpected token, None at the end of input
+        :rtype: UsfmInputError
+        """
+        if token is None:
+            return UsfmInputError("Unexpected end of input", None)
         msg = "Unexpected token of type {}".format(token.type)
-        raise UsfmInputError(msg, token.value.position)
+        return UsfmInputError(msg, token.position)
+
+    @staticmethod
+    def driver():
+        """
+        :return: the driver for the parsing tables, loading the tables on first use
+        :rtype: LRDriver
+        """
+        if UsfmParser._driver is None:
+            with UsfmParser._driver_lock:
+                if UsfmParser._driver is None:
+                    UsfmParser._driver = LRDriver(build_parser(UsfmParser()), tokens)
+        return UsfmParser._driver
+
+    def parse(self, lexer, context=None, stats=None):
+        """
+        :param lexer: lexer, whose input has been set, from which to read tokens
+        :param ParseContext context: state to start from, e.g. the state of an
+        earlier parse to carry on from. A new context if None
+        :param Stats stats: if not None, records the time spent lexing and parsing,
+        and counts of tokens and reductions
+        :rtype: Document
+        """
+        if context is None:
+            context = ParseContext()
+        if stats is None:
+            return self.driver().parse(lexer.token, self.p_error, context)
+
+        driver = self.driver()
+        token_counts = [0] * len(tokens)
+        reductions = [0] * len(driver.production_names)
+        clock = stats.clock
+        lex_token = lexer.token
+        lex_time = [0.0]
+
+        def token_func():
+            start = clock()
+            token = lex_token()
+            lex_time[0] += clock() - start
+            if token is not None:
+                token_counts[token.kind] += 1
+            return token
+        start = clock()
+        try:
+            return driver.parse(token_func, self.p_error, context, reductions=reductions)
+        finally:
+            stats.add_time("lex", lex_time[0])
+            stats.add_time("parse", clock() - start - lex_time[0])
+            stats.add_tokens(token_counts, tokens)
+            stats.add_reductions(reductions, driver.production_names)
+
+    def iter_elements(self, text):
+        """
+        Parses a USFM source incrementally. The returned stream yields each
+        higher-level element (ChapterNumber, Paragraph, Heading, Whitespace, ...)
+        as soon as it is complete, without the whole Document being kept in memory.
+        :param str|unicode text: USFM source
+        :rtype: ElementStream
+        """
+        context = ParseContext(sink=[])
+        return ElementStream(context, self._run(text, context))
+
+    def parse_flat(self, text):
+        """
+        Parses a USFM source into a FlatDocument. The grammar rules build the
+        same element objects as for parse_text; each higher-level element is
+        flattened into the FlatDocument once it is complete
+        :param str|unicode text: USFM source
+        :rtype: FlatDocument
+        """
+        builder = FlatDocument.Builder()
+        stream = self.iter_elements(text)
+        for element in stream:
+            builder.add(element)
+        return builder.build(heading=stream.heading,
+                             table_of_contents=stream.table_of_contents)
+
+    def _run(self, text, context):
+        lexer = self.acquire_lexer()
+        try:
+            lexer.input(text)
+            result = []
+            for _ in self.driver().run(lexer.token, self.p_error, result,
+                                       pause_after=("higher_elements",),
+                                       context=context):
+                yield
+        finally:
+            self.release_lexer(lexer)
+
+    def acquire_lexer(self):
+        """
+        :return: a lexer, of the class chosen at construction, that no other parse
+        is using. It should be handed back with release_lexer
+        """
+        try:
+            return self._lexers.pop()
+        except IndexError:
+            return self._lexer_class.create(track_positions=self._track_positions)
+
+    def release_lexer(self, lexer):
+        """
+        :param lexer: lexer obtained from acquire_lexer, which is no longer in use
+        """
+        self._lexers.append(lexer)
+
+    def parse_text(self, text, context=None, stats=None):
+        """
+        Lexes and parses a USFM source, using the lexing engine chosen at construction
+        :param str|unicode text: USFM source
+        :param ParseContext context: state to start from (see parse)
+        :param Stats stats: if not None, records the time spent in each phase (see
+        parse), and counts of tokens and reductions
+        :rtype: Document
+        """
+        lexer = self.acquire_lexer()
+        try:
+            if stats is None:
+                lexer.input(text)
+            else:
+                with stats.timer("input"):
+                    lexer.input(text)
+            return self.parse(lexer, context=context, stats=stats)
+        finally:
+            self.release_lexer(lexer)
+
+    def validate(self, text):
+        """
+        Checks a USFM source, reporting all errors, without building any element.
+        The same lexer and grammar as parse_text are used, but no grammar rule is
+        run, so this is much cheaper than a parse
+        :param str|unicode text: USFM source
+        :rtype: ValidationReport
+        """
+        errors = []
+        counts = [0] * len(tokens)
+        lexer = self.acquire_lexer()
+        lex_token = lexer.token
+
+        def token_func():
+            token = lex_token()
+            if token is not None:
+                counts[token.kind] += 1
+            return token
+        try:
+            lexer.errors = errors
+            lexer.input(text)
+            self.driver().recognize(token_func,
+                                    lambda token: errors.append(self.syntax_error(token)),
+                                    recover_to="higher_elements")
+        finally:
+            lexer.errors = None
+            self.release_lexer(lexer)
+        token_counts = dict((tokens[kind], count) for kind, count in enumerate(counts) if count)
+        return ValidationReport(errors, token_counts)
+
+    def parse_text_with_errors(self, text):
+        """
+        Lexes and parses a USFM source, carrying on after errors instead of raising
+        them. After an error, parsing resumes at the next marker that starts a
+        higher-level element (a paragraph, chapter, heading, ...); the element in
+        which the error occurred is left out of the document.
+        :param str|unicode text: USFM source
+        :return: the (partial) document, and the errors found, in order
+        :rtype: (Document, list[UsfmInputError])
+        """
+        errors = []
+        lexer = self.acquire_lexer()
+        try:
+            lexer.errors = errors
+            lexer.input(text)
+            document = self.driver().parse(lexer.token,
+                                           lambda token: errors.append(self.syntax_error(token)),
+                                           ParseContext(),
+                                           recover_to="higher_elements")
+        finally:
+            lexer.errors = None
+            self.release_lexer(lexer)
+        return document, errors
+
+
+class ValidationReport(object):
+    """
+    The outcome of UsfmParser.validate: the errors found, and counts of tokens
+    """
+    PARAGRAPH_TOKENS = tuple(itertools.chain(paragraphs, indented_paragraphs))
+    FOOTNOTE_TOKENS = tuple("OPEN_" + name for name in footnotes)
+
+    def __init__(self, errors, token_counts):
+        """
+        :param list[UsfmInputError] errors:
+        :param dict[str, int] token_counts: number of tokens of each kind, by name
+        """
+        self._errors = errors
+        self._token_counts = token_counts
+
+    @property
+    def errors(self):
+        """
+        :rtype: list[UsfmInputError]
+        """
+        return self._errors
+
+    @property
+    def valid(self):
+        """
+        :rtype: bool
+        """
+        return len(self._errors) == 0
+
+    @property
+    def token_counts(self):
+        """
+        :return: the number of tokens of each kind (by name) that were lexed
+        :rtype: dict[str, int]
+        """
+        return self._token_counts
+
+    def count(self, *names):
+        """
+        :param names: names of kinds of tokens
+        :return: the total number of tokens of the given kinds
+        :rtype: int
+        """
+        return sum(self._token_counts.get(name, 0) for name in names)
+
+    @property
+    def chapters(self):
+        return self.count("CHAPTER")
+
+    @property
+    def verses(self):
+        return self.count("VERSE")
+
+    @property
+    def paragraphs(self):
+        return self.count(*ValidationReport.PARAGRAPH_TOKENS)
+
+    @property
+    def footnotes(self):
+        return self.count(*ValidationReport.FOOTNOTE_TOKENS)
+
 
-    def parse(self, lexer):
-        return self._parser.parse(lexer=lexer)
+class ElementStream(object):
+    """
+    The higher-level elements of a document, yielded as they are parsed. The
+    heading and table of contents of the document are available once the stream
+    is exhausted.
+    """
+    def __init__(self, context, steps):
+        """
+        :param ParseContext context: state of the parse, whose sink receives
+        completed elements
+        :param steps: generator running the parse, pausing after each higher element
+        """
+        self._context = context
+        self._steps = steps
+        self._table_of_contents = None
+
+    def __iter__(self):
+        sink = self._context.sink
+        for _ in self._steps:
+            for element in sink:
+                yield element
+            del sink[:]
+        self._table_of_contents = self._context.toc_builder.build()
+
+    @property
+    def heading(self):
+        """
+        :rtype: str|unicode
+        """
+        return self._context.heading
+
+    @property
+    def table_of_contents(self):
+        """
+        :return: the table of contents of the document, None until the stream is
+        exhausted
+        :rtype: TableOfContentsInfo
+        """
+        return self._table_of_contents
+
+
+UsfmParser.register_rules()
+
+_default_parser = UsfmParser.create()
+
+
+def parse(text):
+    """
+    Parses a USFM source. Safe to call from several threads at the same time.
+    :param str|unicode text: USFM source
+    :rtype: Document
+    """
+    return _default_parser.parse_text(text)
+
+
+def parse_flat(text):
+    """
+    Parses a USFM source into a FlatDocument. See UsfmParser.parse_flat
+    :param str|unicode text: USFM source
+    :rtype: FlatDocument
+    """
+    return _default_parser.parse_flat(text)
+
+
+def validate(text):
+    """
+    Checks a USFM source without building elements. See UsfmParser.validate
+    :param str|unicode text: USFM source
+    :rtype: ValidationReport
+    """
+    return _default_parser.validate(text)
+
+
+def parse_with_errors(text):
+    """
+    Parses a USFM source, reporting all errors instead of raising the first one.
+    See UsfmParser.parse_text_with_errors
+    :param str|unicode text: USFM source
+    :rtype: (Document, list[UsfmInputError])
+    """
+    return _default_parser.parse_text_with_errors(text)
@@ -0,0 +1,119 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'documentrightCHAPTER_LABELCHAPTERACROSTIC_HEADING BLANK_LINE CENTERED_PARAGRAPH CHAPTER CHAPTER_LABEL CLOSE_ALT_CHAPTER CLOSE_ALT_VERSE CLOSE_BOLD CLOSE_BOLD_AND_ITALICS CLOSE_BOOK_TITLE CLOSE_CROSS_REFERENCE CLOSE_CROSS_REF_DEUTEROCANONICAL CLOSE_CROSS_REF_NEW_TESTAMENT CLOSE_CROSS_REF_OLD_TESTAMENT CLOSE_DEUTEROCANONICAL CLOSE_EMPHASIS CLOSE_ENDNOTE CLOSE_FOOTNOTE CLOSE_FOOTNOTE_DEUTEROCANONICAL CLOSE_FOOTNOTE_REFERENCE_MARK CLOSE_ITALICS CLOSE_KEYWORD CLOSE_NAME_OF_GOD CLOSE_NORMAL CLOSE_ORDINAL CLOSE_PROPER_NAME CLOSE_PUBLISHED_VERSE CLOSE_QUOTED_TEXT CLOSE_SECONDARY_LANG CLOSE_SELAH CLOSE_SIGNATURE CLOSE_SMALL_CAPS CLOSE_TRANSLATOR_ADDITION CLOSE_WORDS_OF_JESUS CROSS_REF_KEYWORD CROSS_REF_ORIGIN CROSS_REF_QUOTATION DESCRIPTIVE_TITLE EMBEDDED_CLOSING EMBEDDED_OPENING EMBEDDED_PARAGRAPH EMBEDDED_POETIC EMBEDDED_REFRAIN ENCODING EOF EXPLANATORY FILE_ID FLUSH_PARAGRAPH FOOTNOTE_ALT_QUOTATION FOOTNOTE_KEYWORD FOOTNOTE_LABEL FOOTNOTE_QUOTATION FOOTNOTE_REFERENCE FOOTNOTE_TEXT FOOTNOTE_VERSE HEADING INDENTED_PARAGRAPH INTRO_BLANK_LINE INTRO_FLUSH INTRO_FLUSH_QUOTE INTRO_INDENTED INTRO_INDENTED_FLUSH INTRO_LIST_ITEM INTRO_MAJOR_TITLE INTRO_MAJOR_TITLE_END INTRO_OUTLINE_TITLE INTRO_PARAGRAPH INTRO_POETIC INTRO_QUOTE INTRO_RIGHT_ALIGNED INTRO_SECTION LIST_ITEM MAJOR_SECTION MAJOR_TITLE MAJOR_TITLE_END NO_BREAK OPEN_ALT_CHAPTER OPEN_ALT_VERSE OPEN_BOLD OPEN_BOLD_AND_ITALICS OPEN_BOOK_TITLE OPEN_CROSS_REFERENCE OPEN_CROSS_REF_DEUTEROCANONICAL OPEN_CROSS_REF_NEW_TESTAMENT OPEN_CROSS_REF_OLD_TESTAMENT OPEN_DEUTEROCANONICAL OPEN_EMPHASIS OPEN_ENDNOTE OPEN_FOOTNOTE OPEN_FOOTNOTE_DEUTEROCANONICAL OPEN_FOOTNOTE_REFERENCE_MARK OPEN_ITALICS OPEN_KEYWORD OPEN_NAME_OF_GOD OPEN_NORMAL OPEN_ORDINAL OPEN_PROPER_NAME OPEN_PUBLISHED_VERSE OPEN_QUOTED_TEXT OPEN_SECONDARY_LANG OPEN_SELAH OPEN_SIGNATURE OPEN_SMALL_CAPS OPEN_TRANSLATOR_ADDITION OPEN_WORDS_OF_JESUS PAGE_BREAK PARAGRAPH POETIC_CENTERED POETIC_LINE POETIC_RIGHT_ALIGNED REM_TEXT SECTION SPEAKER_ID STATUS TABLE_OF_CONTENTS TEXT VERSEhigher_element : CENTERED_PARAGRAPH lower_elementshigher_element : EMBEDDED_CLOSING lower_elementshigher_element : EMBEDDED_OPENING lower_elementshigher_element : EMBEDDED_PARAGRAPH lower_elementshigher_element : EMBEDDED_REFRAIN lower_elementshigher_element : FLUSH_PARAGRAPH lower_elementshigher_element : INTRO_FLUSH lower_elementshigher_element : INTRO_FLUSH_QUOTE lower_elementshigher_element : INTRO_INDENTED lower_elementshigher_element : INTRO_INDENTED_FLUSH lower_elementshigher_element : INTRO_PARAGRAPH lower_elementshigher_element : INTRO_QUOTE lower_elementshigher_element : INTRO_RIGHT_ALIGNED lower_elementshigher_element : PARAGRAPH lower_elementshigher_element : POETIC_CENTERED lower_elementshigher_element : POETIC_RIGHT_ALIGNED lower_elementshigher_element : EMBEDDED_POETIC lower_elementshigher_element : INDENTED_PARAGRAPH lower_elementshigher_element : INTRO_LIST_ITEM lower_elementshigher_element : INTRO_POETIC lower_elementshigher_element : LIST_ITEM lower_elementshigher_element : POETIC_LINE lower_elementshigher_element : ACROSTIC_HEADING lower_elementshigher_element : OPEN_ALT_CHAPTER lower_elements CLOSE_ALT_CHAPTER lower_elementshigher_element : BLANK_LINE lower_elementshigher_element : DESCRIPTIVE_TITLE lower_elementshigher_element : EXPLANATORY lower_elementshigher_element : INTRO_BLANK_LINE lower_elementshigher_element : INTRO_MAJOR_TITLE lower_elementshigher_element : INTRO_MAJOR_TITLE_END lower_elementshigher_element : INTRO_OUTLINE_TITLE lower_elementshigher_element : INTRO_SECTION lower_elementshigher_element : MAJOR_SECTION lower_elementshigher_element : MAJOR_TITLE lower_elementshigher_element : MAJOR_TITLE_END lower_elementshigher_element : PAGE_BREAK lower_elementshigher_element : SECTION lower_elementshigher_element : OPEN_SELAH lower_elements CLOSE_SELAH lower_elementshigher_element : SPEAKER_ID lower_elementslower_element : OPEN_ALT_VERSE lower_elements CLOSE_ALT_VERSElower_element : OPEN_BOLD lower_elements CLOSE_BOLDlower_element : OPEN_BOLD_AND_ITALICS lower_elements CLOSE_BOLD_AND_ITALICSlower_element : OPEN_BOOK_TITLE lower_elements CLOSE_BOOK_TITLElower_element : OPEN_CROSS_REF_DEUTEROCANONICAL lower_elements CLOSE_CROSS_REF_DEUTEROCANONICALlower_element : CROSS_REF_KEYWORDlower_element : OPEN_CROSS_REF_NEW_TESTAMENT lower_elements CLOSE_CROSS_REF_NEW_TESTAMENTlower_element : OPEN_CROSS_REF_OLD_TESTAMENT lower_elements CLOSE_CROSS_REF_OLD_TESTAMENTlower_element : CROSS_REF_ORIGINlower_element : CROSS_REF_QUOTATIONlower_element : OPEN_DEUTEROCANONICAL lower_elements CLOSE_DEUTEROCANONICALlower_element : OPEN_EMPHASIS lower_elements CLOSE_EMPHASISlower_element : FOOTNOTE_ALT_QUOTATIONlower_element : OPEN_FOOTNOTE_DEUTEROCANONICAL lower_elements CLOSE_FOOTNOTE_DEUTEROCANONICALlower_element : FOOTNOTE_KEYWORDlower_element : FOOTNOTE_QUOTATIONlower_element : FOOTNOTE_REFERENCElower_element : OPEN_FOOTNOTE_REFERENCE_MARK lower_elements CLOSE_FOOTNOTE_REFERENCE_MARKlower_element : FOOTNOTE_TEXTlower_element : FOOTNOTE_VERSElower_element : OPEN_ITALICS lower_elements CLOSE_ITALICSlower_element : OPEN_KEYWORD lower_elements CLOSE_KEYWORDlower_element : OPEN_NAME_OF_GOD lower_elements CLOSE_NAME_OF_GODlower_element : OPEN_NORMAL lower_elements CLOSE_NORMALlower_element : OPEN_ORDINAL lower_elements CLOSE_ORDINALlower_element : OPEN_PROPER_NAME lower_elements CLOSE_PROPER_NAMElower_element : OPEN_QUOTED_TEXT lower_elements CLOSE_QUOTED_TEXTlower_element : OPEN_SECONDARY_LANG lower_elements CLOSE_SECONDARY_LANGlower_element : OPEN_SIGNATURE lower_elements CLOSE_SIGNATURElower_element : OPEN_SMALL_CAPS lower_elements CLOSE_SMALL_CAPSlower_element : OPEN_TRANSLATOR_ADDITION lower_elements CLOSE_TRANSLATOR_ADDITIONlower_element : OPEN_WORDS_OF_JESUS lower_elements CLOSE_WORDS_OF_JESUSdocument : higher_elements EOFhigher_elements : higher_elements higher_element\n                           | higher_element : CHAPTER lower_elementshigher_element : CHAPTER_LABEL CHAPTER lower_elementshigher_element : CHAPTER CHAPTER_LABEL lower_elementshigher_element : HEADINGhigher_element : NO_BREAK lower_elementshigher_element : TABLE_OF_CONTENTSlower_elements : lower_elements lower_element\n                          | lower_element : TEXTlower_element : VERSElower_element : VERSE OPEN_PUBLISHED_VERSE lower_elements CLOSE_PUBLISHED_VERSElower_element : OPEN_FOOTNOTE FOOTNOTE_LABEL lower_elements CLOSE_FOOTNOTElower_element : OPEN_ENDNOTE FOOTNOTE_LABEL lower_elements CLOSE_ENDNOTElower_element : OPEN_CROSS_REFERENCE FOOTNOTE_LABEL lower_elements CLOSE_CROSS_REFERENCE'
+    
+_lr_action_items = {'EOF':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,3,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CENTERED_PARAGRAPH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,5,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'EMBEDDED_CLOSING':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,6,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'EMBEDDED_OPENING':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,7,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'EMBEDDED_PARAGRAPH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,8,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'EMBEDDED_REFRAIN':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,9,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'FLUSH_PARAGRAPH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,10,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_FLUSH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,11,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_FLUSH_QUOTE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,12,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_INDENTED':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,13,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_INDENTED_FLUSH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,14,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_PARAGRAPH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,15,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_QUOTE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,16,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_RIGHT_ALIGNED':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,17,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'PARAGRAPH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,18,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'POETIC_CENTERED':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,19,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'POETIC_RIGHT_ALIGNED':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,20,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'EMBEDDED_POETIC':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,21,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INDENTED_PARAGRAPH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,22,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_LIST_ITEM':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,23,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_POETIC':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,24,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'LIST_ITEM':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,25,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'POETIC_LINE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,26,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'ACROSTIC_HEADING':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,27,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'OPEN_ALT_CHAPTER':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,28,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'BLANK_LINE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,29,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'DESCRIPTIVE_TITLE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,30,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'EXPLANATORY':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,31,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_BLANK_LINE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,32,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_MAJOR_TITLE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,33,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_MAJOR_TITLE_END':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,34,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_OUTLINE_TITLE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,35,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'INTRO_SECTION':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,36,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'MAJOR_SECTION':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,37,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'MAJOR_TITLE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,38,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'MAJOR_TITLE_END':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,39,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'PAGE_BREAK':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,40,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'SECTION':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,41,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'OPEN_SELAH':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,42,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'SPEAKER_ID':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,43,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CHAPTER':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,44,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,90,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CHAPTER_LABEL':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,45,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,89,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'HEADING':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,46,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'NO_BREAK':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,47,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'TABLE_OF_CONTENTS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,98,101,102,105,107,108,109,111,112,125,126,130,131,132,133,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-74,48,-73,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-78,-82,-80,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-39,-75,-82,-82,-79,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-82,-77,-76,-24,-38,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'$end':([1,3,],[0,-72,]),'OPEN_ALT_VERSE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-82,-82,93,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-82,-82,-82,-82,93,93,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,93,93,93,93,-85,-86,-87,-88,]),'OPEN_BOLD':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-82,-82,94,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-82,-82,-82,-82,94,94,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,94,94,94,94,-85,-86,-87,-88,]),'OPEN_BOLD_AND_ITALICS':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-82,-82,95,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-82,-82,-82,-82,95,95,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,95,95,95,95,-85,-86,-87,-88,]),'OPEN_BOOK_TITLE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-82,-82,96,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-82,-82,-82,-82,96,96,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,96,96,96,96,-85,-86,-87,-88,]),'OPEN_CROSS_REF_DEUTEROCANONICAL':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-82,-82,97,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-82,-82,-82,-82,97,97,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,97,97,97,97,-85,-86,-87,-88,]),'CROSS_REF_KEYWORD':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-82,-82,98,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-82,-82,-82,-82,98,98,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,98,98,98,98,-85,-86,-87,-88,]),'OPEN_CROSS_REF_NEW_TESTAMENT':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-82,-82,99,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-82,-82,-82,-82,99,99,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,99,99,99,99,-85,-86,-87,-88,]),'OPEN_CROSS_REF_OLD_TESTAMENT':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-82,-82,100,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-82,-82,-82,-82,100,100,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,100,100,100,100,-85,-86,-87,-88,]),'CROSS_REF_ORIGIN':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-82,-82,101,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-82,-82,-82,-82,101,101,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,101,101,101,101,-85,-86,-87,-88,]),'CROSS_REF_QUOTATION':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-82,-82,102,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-82,-82,-82,-82,102,102,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,102,102,102,102,-85,-86,-87,-88,]),'OPEN_DEUTEROCANONICAL':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-82,-82,103,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-82,-82,-82,-82,103,103,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,103,103,103,103,-85,-86,-87,-88,]),'OPEN_EMPHASIS':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-82,-82,104,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-82,-82,-82,-82,104,104,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,104,104,104,104,-85,-86,-87,-88,]),'FOOTNOTE_ALT_QUOTATION':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-82,-82,105,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-82,-82,-82,-82,105,105,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,105,105,105,105,-85,-86,-87,-88,]),'OPEN_FOOTNOTE_DEUTEROCANONICAL':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-82,-82,106,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-82,-82,-82,-82,106,106,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,106,106,106,106,-85,-86,-87,-88,]),'FOOTNOTE_KEYWORD':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-82,-82,107,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-82,-82,-82,-82,107,107,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,107,107,107,107,-85,-86,-87,-88,]),'FOOTNOTE_QUOTATION':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-82,-82,108,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-82,-82,-82,-82,108,108,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,108,108,108,108,-85,-86,-87,-88,]),'FOOTNOTE_REFERENCE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-82,-82,109,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-82,-82,-82,-82,109,109,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,109,109,109,109,-85,-86,-87,-88,]),'OPEN_FOOTNOTE_REFERENCE_MARK':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-82,-82,110,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-82,-82,-82,-82,110,110,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,110,110,110,110,-85,-86,-87,-88,]),'FOOTNOTE_TEXT':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-82,-82,111,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-82,-82,-82,-82,111,111,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,111,111,111,111,-85,-86,-87,-88,]),'FOOTNOTE_VERSE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-82,-82,112,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-82,-82,-82,-82,112,112,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,112,112,112,112,-85,-86,-87,-88,]),'OPEN_ITALICS':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-82,-82,113,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-82,-82,-82,-82,113,113,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,113,113,113,113,-85,-86,-87,-88,]),'OPEN_KEYWORD':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-82,-82,114,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-82,-82,-82,-82,114,114,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,114,114,114,114,-85,-86,-87,-88,]),'OPEN_NAME_OF_GOD':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-82,-82,115,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-82,-82,-82,-82,115,115,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,115,115,115,115,-85,-86,-87,-88,]),'OPEN_NORMAL':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-82,-82,116,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-82,-82,-82,-82,116,116,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,116,116,116,116,-85,-86,-87,-88,]),'OPEN_ORDINAL':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-82,-82,117,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-82,-82,-82,-82,117,117,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,117,117,117,117,-85,-86,-87,-88,]),'OPEN_PROPER_NAME':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,-82,-82,118,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,-82,-82,-82,-82,118,118,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,118,118,118,118,-85,-86,-87,-88,]),'OPEN_QUOTED_TEXT':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,-82,-82,119,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,-82,-82,-82,-82,119,119,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,119,119,119,119,-85,-86,-87,-88,]),'OPEN_SECONDARY_LANG':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,-82,-82,120,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,-82,-82,-82,-82,120,120,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,120,120,120,120,-85,-86,-87,-88,]),'OPEN_SIGNATURE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,-82,-82,121,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,-82,-82,-82,-82,121,121,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,121,121,121,121,-85,-86,-87,-88,]),'OPEN_SMALL_CAPS':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-82,-82,122,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-82,-82,-82,-82,122,122,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,122,122,122,122,-85,-86,-87,-88,]),'OPEN_TRANSLATOR_ADDITION':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-82,-82,123,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-82,-82,-82,-82,123,123,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,123,123,123,123,-85,-86,-87,-88,]),'OPEN_WORDS_OF_JESUS':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-82,-82,124,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-82,-82,-82,-82,124,124,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,124,124,124,124,-85,-86,-87,-88,]),'TEXT':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,-82,-82,125,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,-82,-82,-82,-82,125,125,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,125,125,125,125,-85,-86,-87,-88,]),'VERSE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,-82,-82,126,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,-82,-82,-82,-82,126,126,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,126,126,126,126,-85,-86,-87,-88,]),'OPEN_FOOTNOTE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,-82,-82,127,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,-82,-82,-82,-82,127,127,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,127,127,127,127,-85,-86,-87,-88,]),'OPEN_ENDNOTE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,-82,-82,128,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,-82,-82,-82,-82,128,128,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,128,128,128,128,-85,-86,-87,-88,]),'OPEN_CROSS_REFERENCE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,],[-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,-82,-82,129,-81,-82,-82,-82,-82,-82,-45,-82,-82,-48,-49,-82,-82,-52,-82,-54,-55,-56,-82,-58,-59,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-82,-83,-84,-82,-82,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,-82,-82,-82,-82,129,129,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,129,129,129,129,-85,-86,-87,-88,]),'CLOSE_ALT_CHAPTER':([28,72,92,98,101,102,105,107,108,109,111,112,125,126,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-82,130,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_SELAH':([42,86,92,98,101,102,105,107,108,109,111,112,125,126,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-82,131,-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_ALT_VERSE':([92,93,98,101,102,105,107,108,109,111,112,125,126,134,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-82,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,163,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_BOLD':([92,94,98,101,102,105,107,108,109,111,112,125,126,135,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-82,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,164,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_BOLD_AND_ITALICS':([92,95,98,101,102,105,107,108,109,111,112,125,126,136,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-82,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,165,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_BOOK_TITLE':([92,96,98,101,102,105,107,108,109,111,112,125,126,137,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-82,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,166,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_CROSS_REF_DEUTEROCANONICAL':([92,97,98,101,102,105,107,108,109,111,112,125,126,138,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-82,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,167,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_CROSS_REF_NEW_TESTAMENT':([92,98,99,101,102,105,107,108,109,111,112,125,126,139,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-82,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,168,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_CROSS_REF_OLD_TESTAMENT':([92,98,100,101,102,105,107,108,109,111,112,125,126,140,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-82,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,169,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_DEUTEROCANONICAL':([92,98,101,102,103,105,107,108,109,111,112,125,126,141,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-82,-52,-54,-55,-56,-58,-59,-83,-84,170,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_EMPHASIS':([92,98,101,102,104,105,107,108,109,111,112,125,126,142,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-82,-52,-54,-55,-56,-58,-59,-83,-84,171,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_FOOTNOTE_DEUTEROCANONICAL':([92,98,101,102,105,106,107,108,109,111,112,125,126,143,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-82,-54,-55,-56,-58,-59,-83,-84,172,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_FOOTNOTE_REFERENCE_MARK':([92,98,101,102,105,107,108,109,110,111,112,125,126,144,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-82,-58,-59,-83,-84,173,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_ITALICS':([92,98,101,102,105,107,108,109,111,112,113,125,126,145,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,174,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_KEYWORD':([92,98,101,102,105,107,108,109,111,112,114,125,126,146,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,175,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_NAME_OF_GOD':([92,98,101,102,105,107,108,109,111,112,115,125,126,147,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,176,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_NORMAL':([92,98,101,102,105,107,108,109,111,112,116,125,126,148,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,177,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_ORDINAL':([92,98,101,102,105,107,108,109,111,112,117,125,126,149,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,178,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_PROPER_NAME':([92,98,101,102,105,107,108,109,111,112,118,125,126,150,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,179,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_QUOTED_TEXT':([92,98,101,102,105,107,108,109,111,112,119,125,126,151,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,180,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_SECONDARY_LANG':([92,98,101,102,105,107,108,109,111,112,120,125,126,152,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,181,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_SIGNATURE':([92,98,101,102,105,107,108,109,111,112,121,125,126,153,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,182,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_SMALL_CAPS':([92,98,101,102,105,107,108,109,111,112,122,125,126,154,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,183,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_TRANSLATOR_ADDITION':([92,98,101,102,105,107,108,109,111,112,123,125,126,155,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,184,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_WORDS_OF_JESUS':([92,98,101,102,105,107,108,109,111,112,124,125,126,156,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-82,-83,-84,185,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-85,-86,-87,-88,]),'CLOSE_PUBLISHED_VERSE':([92,98,101,102,105,107,108,109,111,112,125,126,157,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,190,-85,-86,-87,-88,]),'CLOSE_FOOTNOTE':([92,98,101,102,105,107,108,109,111,112,125,126,158,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,187,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,191,-85,-86,-87,-88,]),'CLOSE_ENDNOTE':([92,98,101,102,105,107,108,109,111,112,125,126,159,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,188,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,192,-85,-86,-87,-88,]),'CLOSE_CROSS_REFERENCE':([92,98,101,102,105,107,108,109,111,112,125,126,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,189,190,191,192,193,],[-81,-45,-48,-49,-52,-54,-55,-56,-58,-59,-83,-84,-82,-40,-41,-42,-43,-44,-46,-47,-50,-51,-53,-57,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,193,-85,-86,-87,-88,]),'OPEN_PUBLISHED_VERSE':([126,],[157,]),'FOOTNOTE_LABEL':([127,128,129,],[158,159,160,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'document':([0,],[1,]),'higher_elements':([0,],[2,]),'higher_element':([2,],[4,]),'lower_elements':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,47,89,90,93,94,95,96,97,99,100,103,104,106,110,113,114,115,116,117,118,119,120,121,122,123,124,130,131,157,158,159,160,],[49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,91,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,161,162,186,187,188,189,]),'lower_element':([49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,91,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,161,162,186,187,188,189,],[92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> document","S'",1,None,None,None),
+  ('higher_element -> CENTERED_PARAGRAPH lower_elements','higher_element',2,'p_CENTERED_PARAGRAPH','parse.py',21),
+  ('higher_element -> EMBEDDED_CLOSING lower_elements','higher_element',2,'p_EMBEDDED_CLOSING','parse.py',21),
+  ('higher_element -> EMBEDDED_OPENING lower_elements','higher_element',2,'p_EMBEDDED_OPENING','parse.py',21),
+  ('higher_element -> EMBEDDED_PARAGRAPH lower_elements','higher_element',2,'p_EMBEDDED_PARAGRAPH','parse.py',21),
+  ('higher_element -> EMBEDDED_REFRAIN lower_elements','higher_element',2,'p_EMBEDDED_REFRAIN','parse.py',21),
+  ('higher_element -> FLUSH_PARAGRAPH lower_elements','higher_element',2,'p_FLUSH_PARAGRAPH','parse.py',21),
+  ('higher_element -> INTRO_FLUSH lower_elements','higher_element',2,'p_INTRO_FLUSH','parse.py',21),
+  ('higher_element -> INTRO_FLUSH_QUOTE lower_elements','higher_element',2,'p_INTRO_FLUSH_QUOTE','parse.py',21),
+  ('higher_element -> INTRO_INDENTED lower_elements','higher_element',2,'p_INTRO_INDENTED','parse.py',21),
+  ('higher_element -> INTRO_INDENTED_FLUSH lower_elements','higher_element',2,'p_INTRO_INDENTED_FLUSH','parse.py',21),
+  ('higher_element -> INTRO_PARAGRAPH lower_elements','higher_element',2,'p_INTRO_PARAGRAPH','parse.py',21),
+  ('higher_element -> INTRO_QUOTE lower_elements','higher_element',2,'p_INTRO_QUOTE','parse.py',21),
+  ('higher_element -> INTRO_RIGHT_ALIGNED lower_elements','higher_element',2,'p_INTRO_RIGHT_ALIGNED','parse.py',21),
+  ('higher_element -> PARAGRAPH lower_elements','higher_element',2,'p_PARAGRAPH','parse.py',21),
+  ('higher_element -> POETIC_CENTERED lower_elements','higher_element',2,'p_POETIC_CENTERED','parse.py',21),
+  ('higher_element -> POETIC_RIGHT_ALIGNED lower_elements','higher_element',2,'p_POETIC_RIGHT_ALIGNED','parse.py',21),
+  ('higher_element -> EMBEDDED_POETIC lower_elements','higher_element',2,'p_EMBEDDED_POETIC','parse.py',30),
+  ('higher_element -> INDENTED_PARAGRAPH lower_elements','higher_element',2,'p_INDENTED_PARAGRAPH','parse.py',30),
+  ('higher_element -> INTRO_LIST_ITEM lower_elements','higher_element',2,'p_INTRO_LIST_ITEM','parse.py',30),
+  ('higher_element -> INTRO_POETIC lower_elements','higher_element',2,'p_INTRO_POETIC','parse.py',30),
+  ('higher_element -> LIST_ITEM lower_elements','higher_element',2,'p_LIST_ITEM','parse.py',30),
+  ('higher_element -> POETIC_LINE lower_elements','higher_element',2,'p_POETIC_LINE','parse.py',30),
+  ('higher_element -> ACROSTIC_HEADING lower_elements','higher_element',2,'p_ACROSTIC_HEADING','parse.py',85),
+  ('higher_element -> OPEN_ALT_CHAPTER lower_elements CLOSE_ALT_CHAPTER lower_elements','higher_element',4,'p_ALT_CHAPTER','parse.py',85),
+  ('higher_element -> BLANK_LINE lower_elements','higher_element',2,'p_BLANK_LINE','parse.py',85),
+  ('higher_element -> DESCRIPTIVE_TITLE lower_elements','higher_element',2,'p_DESCRIPTIVE_TITLE','parse.py',85),
+  ('higher_element -> EXPLANATORY lower_elements','higher_element',2,'p_EXPLANATORY','parse.py',85),
+  ('higher_element -> INTRO_BLANK_LINE lower_elements','higher_element',2,'p_INTRO_BLANK_LINE','parse.py',85),
+  ('higher_element -> INTRO_MAJOR_TITLE lower_elements','higher_element',2,'p_INTRO_MAJOR_TITLE','parse.py',85),
+  ('higher_element -> INTRO_MAJOR_TITLE_END lower_elements','higher_element',2,'p_INTRO_MAJOR_TITLE_END','parse.py',85),
+  ('higher_element -> INTRO_OUTLINE_TITLE lower_elements','higher_element',2,'p_INTRO_OUTLINE_TITLE','parse.py',85),
+  ('higher_element -> INTRO_SECTION lower_elements','higher_element',2,'p_INTRO_SECTION','parse.py',85),
+  ('higher_element -> MAJOR_SECTION lower_elements','higher_element',2,'p_MAJOR_SECTION','parse.py',85),
+  ('higher_element -> MAJOR_TITLE lower_elements','higher_element',2,'p_MAJOR_TITLE','parse.py',85),
+  ('higher_element -> MAJOR_TITLE_END lower_elements','higher_element',2,'p_MAJOR_TITLE_END','parse.py',85),
+  ('higher_element -> PAGE_BREAK lower_elements','higher_element',2,'p_PAGE_BREAK','parse.py',85),
+  ('higher_element -> SECTION lower_elements','higher_element',2,'p_SECTION','parse.py',85),
+  ('higher_element -> OPEN_SELAH lower_elements CLOSE_SELAH lower_elements','higher_element',4,'p_SELAH','parse.py',85),
+  ('higher_element -> SPEAKER_ID lower_elements','higher_element',2,'p_SPEAKER_ID','parse.py',85),
+  ('lower_element -> OPEN_ALT_VERSE lower_elements CLOSE_ALT_VERSE','lower_element',3,'p_ALT_VERSE','parse.py',94),
+  ('lower_element -> OPEN_BOLD lower_elements CLOSE_BOLD','lower_element',3,'p_BOLD','parse.py',94),
+  ('lower_element -> OPEN_BOLD_AND_ITALICS lower_elements CLOSE_BOLD_AND_ITALICS','lower_element',3,'p_BOLD_AND_ITALICS','parse.py',94),
+  ('lower_element -> OPEN_BOOK_TITLE lower_elements CLOSE_BOOK_TITLE','lower_element',3,'p_BOOK_TITLE','parse.py',94),
+  ('lower_element -> OPEN_CROSS_REF_DEUTEROCANONICAL lower_elements CLOSE_CROSS_REF_DEUTEROCANONICAL','lower_element',3,'p_CROSS_REF_DEUTEROCANONICAL','parse.py',94),
+  ('lower_element -> CROSS_REF_KEYWORD','lower_element',1,'p_CROSS_REF_KEYWORD','parse.py',94),
+  ('lower_element -> OPEN_CROSS_REF_NEW_TESTAMENT lower_elements CLOSE_CROSS_REF_NEW_TESTAMENT','lower_element',3,'p_CROSS_REF_NEW_TESTAMENT','parse.py',94),
+  ('lower_element -> OPEN_CROSS_REF_OLD_TESTAMENT lower_elements CLOSE_CROSS_REF_OLD_TESTAMENT','lower_element',3,'p_CROSS_REF_OLD_TESTAMENT','parse.py',94),
+  ('lower_element -> CROSS_REF_ORIGIN','lower_element',1,'p_CROSS_REF_ORIGIN','parse.py',94),
+  ('lower_element -> CROSS_REF_QUOTATION','lower_element',1,'p_CROSS_REF_QUOTATION','parse.py',94),
+  ('lower_element -> OPEN_DEUTEROCANONICAL lower_elements CLOSE_DEUTEROCANONICAL','lower_element',3,'p_DEUTEROCANONICAL','parse.py',94),
+  ('lower_element -> OPEN_EMPHASIS lower_elements CLOSE_EMPHASIS','lower_element',3,'p_EMPHASIS','parse.py',94),
+  ('lower_element -> FOOTNOTE_ALT_QUOTATION','lower_element',1,'p_FOOTNOTE_ALT_QUOTATION','parse.py',94),
+  ('lower_element -> OPEN_FOOTNOTE_DEUTEROCANONICAL lower_elements CLOSE_FOOTNOTE_DEUTEROCANONICAL','lower_element',3,'p_FOOTNOTE_DEUTEROCANONICAL','parse.py',94),
+  ('lower_element -> FOOTNOTE_KEYWORD','lower_element',1,'p_FOOTNOTE_KEYWORD','parse.py',94),
+  ('lower_element -> FOOTNOTE_QUOTATION','lower_element',1,'p_FOOTNOTE_QUOTATION','parse.py',94),
+  ('lower_element -> FOOTNOTE_REFERENCE','lower_element',1,'p_FOOTNOTE_REFERENCE','parse.py',94),
+  ('lower_element -> OPEN_FOOTNOTE_REFERENCE_MARK lower_elements CLOSE_FOOTNOTE_REFERENCE_MARK','lower_element',3,'p_FOOTNOTE_REFERENCE_MARK','parse.py',94),
+  ('lower_element -> FOOTNOTE_TEXT','lower_element',1,'p_FOOTNOTE_TEXT','parse.py',94),
+  ('lower_element -> FOOTNOTE_VERSE','lower_element',1,'p_FOOTNOTE_VERSE','parse.py',94),
+  ('lower_element -> OPEN_ITALICS lower_elements CLOSE_ITALICS','lower_element',3,'p_ITALICS','parse.py',94),
+  ('lower_element -> OPEN_KEYWORD lower_elements CLOSE_KEYWORD','lower_element',3,'p_KEYWORD','parse.py',94),
+  ('lower_element -> OPEN_NAME_OF_GOD lower_elements CLOSE_NAME_OF_GOD','lower_element',3,'p_NAME_OF_GOD','parse.py',94),
+  ('lower_element -> OPEN_NORMAL lower_elements CLOSE_NORMAL','lower_element',3,'p_NORMAL','parse.py',94),
+  ('lower_element -> OPEN_ORDINAL lower_elements CLOSE_ORDINAL','lower_element',3,'p_ORDINAL','parse.py',94),
+  ('lower_element -> OPEN_PROPER_NAME lower_elements CLOSE_PROPER_NAME','lower_element',3,'p_PROPER_NAME','parse.py',94),
+  ('lower_element -> OPEN_QUOTED_TEXT lower_elements CLOSE_QUOTED_TEXT','lower_element',3,'p_QUOTED_TEXT','parse.py',94),
+  ('lower_element -> OPEN_SECONDARY_LANG lower_elements CLOSE_SECONDARY_LANG','lower_element',3,'p_SECONDARY_LANG','parse.py',94),
+  ('lower_element -> OPEN_SIGNATURE lower_elements CLOSE_SIGNATURE','lower_element',3,'p_SIGNATURE','parse.py',94),
+  ('lower_element -> OPEN_SMALL_CAPS lower_elements CLOSE_SMALL_CAPS','lower_element',3,'p_SMALL_CAPS','parse.py',94),
+  ('lower_element -> OPEN_TRANSLATOR_ADDITION lower_elements CLOSE_TRANSLATOR_ADDITION','lower_element',3,'p_TRANSLATOR_ADDITION','parse.py',94),
+  ('lower_element -> OPEN_WORDS_OF_JESUS lower_elements CLOSE_WORDS_OF_JESUS','lower_element',3,'p_WORDS_OF_JESUS','parse.py',94),
+  ('document -> higher_elements EOF','document',2,'p_document','parse.py',182),
+  ('higher_elements -> higher_elements higher_element','higher_elements',2,'p_higher_elements','parse.py',189),
+  ('higher_elements -> <empty>','higher_elements',0,'p_higher_elements','parse.py',190),
+  ('higher_element -> CHAPTER lower_elements','higher_element',2,'p_chapter','parse.py',269),
+  ('higher_element -> CHAPTER_LABEL CHAPTER lower_elements','higher_element',3,'p_chapter_label_before','parse.py',282),
+  ('higher_element -> CHAPTER CHAPTER_LABEL lower_elements','higher_element',3,'p_chapter_label_after','parse.py',292),
+  ('higher_element -> HEADING','higher_element',1,'p_heading','parse.py',300),
+  ('higher_element -> NO_BREAK lower_elements','higher_element',2,'p_no_break','parse.py',305),
+  ('higher_element -> TABLE_OF_CONTENTS','higher_element',1,'p_toc','parse.py',322),
+  ('lower_elements -> lower_elements lower_element','lower_elements',2,'p_lower_elements','parse.py',337),
+  ('lower_elements -> <empty>','lower_elements',0,'p_lower_elements','parse.py',338),
+  ('lower_element -> TEXT','lower_element',1,'p_lower_element_as_text','parse.py',347),
+  ('lower_element -> VERSE','lower_element',1,'p_lower_element_as_verse','parse.py',351),
+  ('lower_element -> VERSE OPEN_PUBLISHED_VERSE lower_elements CLOSE_PUBLISHED_VERSE','lower_element',4,'p_lower_element_as_published_verse','parse.py',355),
+  ('lower_element -> OPEN_FOOTNOTE FOOTNOTE_LABEL lower_elements CLOSE_FOOTNOTE','lower_element',4,'p_footnote','parse.py',359),
+  ('lower_element -> OPEN_ENDNOTE FOOTNOTE_LABEL lower_elements CLOSE_ENDNOTE','lower_element',4,'p_endnote','parse.py',363),
+  ('lower_element -> OPEN_CROSS_REFERENCE FOOTNOTE_LABEL lower_elements CLOSE_CROSS_REFERENCE','lower_element',4,'p_cross_reference','parse.py',367),
+]
+_flags_checksum = '330a4160ed6802b5599fd33fe14da5fd546fa0b4'
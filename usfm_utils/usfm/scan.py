@@ -0,0 +1,170 @@
+"""
+An alternative lexing engine for USFM.
+
+Instead of trying each of the lexical rules of UsfmLexer in turn (which is what
+PLY's master regex does), UsfmScanner matches a generic marker once, and looks up
+the rules for that marker in a precomputed dictionary. The rules themselves, and
+therefore the produced tokens, are the same as those of UsfmLexer.
+"""
+from __future__ import unicode_literals
+
+import re
+import threading
+
+from ply.lex import LexToken
+
+from usfm_utils.usfm.lex import UsfmLexer, EOF, ERROR_CONTEXT, UNRECOGNIZED_MARKER, \
+    eof_offset
+from usfm_utils.usfm.tokens import LineIndex, Token
+from usfm_utils.usfm.usfm_error import UsfmInputError
+from usfm_utils.usfm.lex_utils import FLAG_PREFIX, UNESCAPED_FLAG_PREFIX
+
+
+class UsfmScanner(UsfmLexer):
+    # a generic marker: the flag prefix followed by the name of the flag
+    MARKER = re.compile(r"{prefix}([^\W\d]+)".format(prefix=FLAG_PREFIX), re.UNICODE)
+    FOOTNOTE_LABEL_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+    # flag -> [(compiled regex, kind code, rule, discard, next state)], shared by
+    # all instances and never modified once built
+    _dispatch = None
+    _text_rule = None
+    _label_rule = None
+    _dispatch_lock = threading.Lock()
+
+    def __init__(self, track_positions=True):
+        """
+        :param bool track_positions: whether tokens and errors should report their
+        line/column positions
+        """
+        UsfmLexer.__init__(self, track_positions=track_positions)
+
+        self._data = ""
+        self._length = 0
+        self._index = 0
+        self._state = "INITIAL"
+
+    @staticmethod
+    def create(track_positions=True):
+        """
+        Factory method for constructing new instances. Should be used instead of
+        "normal" initialization
+        :param bool track_positions: whether tokens and errors should report their
+        line/column positions
+        """
+        usfm_scanner = UsfmScanner(track_positions=track_positions)
+        usfm_scanner.init()
+        return usfm_scanner
+
+    def init(self):
+        """
+        Initialize the scanner, building the dispatch table on first use
+        """
+        self.register_rules()
+        if UsfmScanner._dispatch is not None:
+            return
+        with UsfmScanner._dispatch_lock:
+            if UsfmScanner._dispatch is None:
+                UsfmScanner.build_dispatch()
+
+    @staticmethod
+    def build_dispatch():
+        flag_regex = re.compile(r"{prefix}([^\W\d]+)".format(prefix=re.escape(FLAG_PREFIX)),
+                                re.UNICODE)
+        dispatch = {}
+        kinds = dict((name, kind) for kind, name in enumerate(UsfmLexer.tokens))
+        rules = sorted(UsfmLexer.lexical_rules(), key=lambda rule: rule[0])
+        for name, func, state, discard, next_state in rules:
+            rule = (re.compile(func.__doc__, re.VERBOSE), kinds[name], func, discard, next_state)
+            if name == "TEXT":
+                UsfmScanner._text_rule = rule
+                continue
+            elif state == "footnotelabel":
+                UsfmScanner._label_rule = rule
+                continue
+            flag = flag_regex.match(func.__doc__).group(1)
+            dispatch.setdefault(flag, []).append(rule)
+        UsfmScanner._dispatch = dict((flag, tuple(rules)) for flag, rules in dispatch.items())
+
+    def begin(self, state):
+        self._state = state
+
+    def input(self, s):
+        self._state = "INITIAL"
+        self.reached_eof = False
+        self._data = s
+        self.line_index = LineIndex(s) if self.track_positions else None
+        self.eof_offset = eof_offset(s)
+        self._length = len(self._data)
+        self._index = 0
+
+    def token(self):
+        data = self._data
+        while self._index < self._length:
+            index = self._index
+            if self._state == "footnotelabel":
+                token = self.footnote_label(index)
+            elif data[index] != UNESCAPED_FLAG_PREFIX:
+                end = data.find(UNESCAPED_FLAG_PREFIX, index)
+                if end < 0:
+                    end = self._length
+                self._index = end
+                _, kind, func, _, _ = self._text_rule
+                token = func(Token(kind, index, data[index:end], line_index=self.line_index))
+            else:
+                token = self.marker(index)
+            if token is not None:
+                return token
+        return self.eof()
+
+    def marker(self, index):
+        data = self._data
+        match = UsfmScanner.MARKER.match(data, index)
+        rules = () if match is None else self._dispatch.get(match.group(1), ())
+        for regex, kind, func, discard, next_state in rules:
+            rule_match = regex.match(data, index)
+            if rule_match is not None:
+                self._index = rule_match.end()
+                token = Token(kind, index, rule_match.group(), line_index=self.line_index)
+                return self.apply_rule(func, token, discard, next_state)
+        # enough of the source for t_error to show and skip what UsfmLexer's would
+        end = UNRECOGNIZED_MARKER.match(data, index).end() + ERROR_CONTEXT
+        self.t_error(self.error_token(data[index:end], index))
+
+    def footnote_label(self, index):
+        data = self._data
+        whitespace = UsfmScanner.FOOTNOTE_LABEL_WHITESPACE.match(data, index)
+        index = self._index = whitespace.end()
+        if index == self._length:
+            return None
+        regex, kind, func, discard, next_state = self._label_rule
+        match = regex.match(data, index)
+        if match is None:
+            self.report(UsfmInputError("Expected a footnote label", self.position(index)))
+            self.begin("INITIAL")
+            return None
+        self._index = match.end()
+        token = Token(kind, index, match.group(), line_index=self.line_index)
+        return self.apply_rule(func, token, discard, next_state)
+
+    def skip(self, n):
+        self._index += n
+
+    def eof(self):
+        if self.reached_eof:
+            return None
+        self.reached_eof = True
+        return Token(EOF, self.eof_offset, None, line_index=self.line_index)
+
+    @staticmethod
+    def error_token(value, index):
+        """
+        :return: a PLY token, as passed to t_error and t_footnotelabel_error
+        :rtype: LexToken
+        """
+        token = LexToken()
+        token.type = "error"
+        token.value = value
+        token.lineno = 1
+        token.lexpos = index
+        return token
@@ -0,0 +1,199 @@
+"""
+Prebuilt PLY tables for the USFM lexer and parser.
+
+The lexer and parser tables are generated once at build time (see build_tables)
+and shipped inside this package as lextab.py and parsetab.py, so that neither
+the master regexes nor the LALR tables have to be regenerated (or written to the
+working directory) when a process starts.
+
+Each generated module records a checksum of the tables in flags.py, of the
+lexer's rules (with their regexes) and of the parser's grammar rules. If the
+checksum of the shipped tables does not match, the tables are considered stale
+and are regenerated in memory, without being written anywhere.
+"""
+
+import hashlib
+import importlib
+import os
+import re
+import sys
+import warnings
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+from usfm_utils.usfm import flags
+
+LEXTAB = "usfm_utils.usfm.lextab"
+PARSETAB = "usfm_utils.usfm.parsetab"
+
+CHECKSUM_NAME = "_flags_checksum"
+
+# set to False to ignore the shipped tables (e.g. for benchmarking)
+USE_PREBUILT = True
+
+_FLAG_TABLES = (
+    "paragraphs",
+    "indented_paragraphs",
+    "lower_open_closes",
+    "higher_open_closes",
+    "headings",
+    "one_word_arguments",
+    "higher_rest_of_lines",
+    "ignore_rest_of_lines",
+    "lower_until_next_flags",
+    "footnotes",
+    "whitespace",
+)
+
+_checksum = None
+
+
+def flags_checksum():
+    """
+    :return: a checksum of the token names and flags defined in flags.py, of the
+    rules of UsfmLexer and of the grammar rules of UsfmParser
+    :rtype: str
+    """
+    global _checksum
+    if _checksum is None:
+        from usfm_utils.usfm.lex import UsfmLexer
+        from usfm_utils.usfm.parse import UsfmParser
+
+        digest = hashlib.sha1()
+        for table_name in _FLAG_TABLES:
+            table = getattr(flags, table_name)
+            for name in sorted(table):
+                value = table[name]
+                flag = value if isinstance(value, str) else value[0]
+                line = "{}:{}:{}\n".format(table_name, name, flag)
+                digest.update(line.encode("utf-8"))
+        # sorted, as their order follows that of the tables in flags.py, which is
+        # not the same on every version of Python
+        lexical_rules = sorted(UsfmLexer.lexical_rules(),
+                               key=lambda rule: (rule[0], str(rule[2])))
+        for name, func, state, discard, next_state in lexical_rules:
+            line = "lex:{}:{}:{}:{}:{}\n".format(name, state, discard, next_state,
+                                                 func.__doc__)
+            digest.update(line.encode("utf-8"))
+        # the error, end of input and ignore handlers of each lexer state
+        UsfmLexer.register_rules()
+        for name in sorted(name for name in dir(UsfmLexer) if name.startswith("t_")):
+            digest.update("lex:{}\n".format(name).encode("utf-8"))
+        UsfmParser.register_rules()
+        for name in sorted(_parser_rules(UsfmParser)):
+            line = "yacc:{}:{}\n".format(name, getattr(UsfmParser, name).__doc__)
+            digest.update(line.encode("utf-8"))
+        _checksum = digest.hexdigest()
+    return _checksum
+
+
+def load_table(module_name):
+    """
+    :param str module_name: fully qualified name of a generated table module
+    :return: the table module, or None if it is missing or stale
+    """
+    if not USE_PREBUILT:
+        return None
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    if getattr(module, CHECKSUM_NAME, None) != flags_checksum():
+        warnings.warn("Prebuilt table {} is stale, regenerating it in memory"
+                      .format(module_name))
+        return None
+    return module
+
+
+def build_lexer(usfm_lexer):
+    """
+    :param UsfmLexer usfm_lexer: lexer whose rules have already been registered
+    :return: a PLY lexer for the given rules
+    """
+    lextab = load_table(LEXTAB)
+    if lextab is not None:
+        try:
+            return lex.lex(module=usfm_lexer, optimize=True, lextab=lextab)
+        except ImportError:  # tables from an incompatible PLY version
+            pass
+        except (AssertionError, re.error):
+            # the shipped master regex cannot be compiled, e.g. as it has more groups
+            # than the re module of Python < 3.5 supports; without tables, PLY splits
+            # it up as needed
+            pass
+    return lex.lex(module=usfm_lexer, optimize=False)
+
+
+def build_parser(usfm_parser):
+    """
+    :param UsfmParser usfm_parser: parser whose rules have already been registered
+    :return: a PLY parser for the given rules
+    """
+    parsetab = load_table(PARSETAB)
+    if parsetab is not None:
+        try:
+            lr_table = yacc.LRTable()
+            lr_table.read_table(parsetab)
+            lr_table.bind_callables(_parser_rules(usfm_parser))
+            return yacc.LRParser(lr_table, usfm_parser.p_error)
+        except (yacc.VersionError, KeyError):
+            pass
+    lr_table, parser_info = _generate_lr_table(usfm_parser)
+    lr_table.bind_callables(parser_info.pdict)
+    return yacc.LRParser(lr_table, parser_info.error_func)
+
+
+def build_tables():
+    """
+    Regenerates lextab.py and parsetab.py in the directory of this package
+    """
+    from usfm_utils.usfm.lex import UsfmLexer
+    from usfm_utils.usfm.parse import UsfmParser
+
+    outputdir = os.path.dirname(os.path.abspath(__file__))
+
+    usfm_lexer = UsfmLexer()
+    usfm_lexer.register_rules()
+    lexer = lex.lex(module=usfm_lexer, optimize=False)
+    lexer.writetab(LEXTAB, outputdir)
+
+    usfm_parser = UsfmParser()
+    usfm_parser.register_rules()
+    lr_table, parser_info = _generate_lr_table(usfm_parser)
+    lr_table.write_table(PARSETAB, outputdir, parser_info.signature())
+
+    for module_name in (LEXTAB, PARSETAB):
+        path = os.path.join(outputdir, module_name.split(".")[-1] + ".py")
+        with open(path, "a") as table_file:
+            table_file.write("{} = {}\n".format(CHECKSUM_NAME, repr(flags_checksum())))
+        sys.modules.pop(module_name, None)
+
+
+def _generate_lr_table(usfm_parser):
+    """
+    Runs the LALR table generation of PLY in memory, without writing any files
+    :param UsfmParser usfm_parser: parser whose rules have already been registered
+    :rtype: (yacc.LRGeneratedTable, yacc.ParserReflect)
+    """
+    pdict = dict((name, getattr(usfm_parser, name)) for name in dir(usfm_parser))
+    parser_info = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    parser_info.get_all()
+    if parser_info.validate_all():
+        raise yacc.YaccError("Unable to build parser")
+
+    grammar = yacc.Grammar(parser_info.tokens)
+    for term, assoc, level in parser_info.preclist:
+        grammar.set_precedence(term, assoc, level)
+    for funcname, (filename, line, prodname, syms) in parser_info.grammar:
+        grammar.add_production(prodname, syms, funcname, filename, line)
+    grammar.set_start(parser_info.start)
+    grammar.build_lritems()
+    grammar.compute_first()
+    grammar.compute_follow()
+    return yacc.LRGeneratedTable(grammar, "LALR"), parser_info
+
+
+def _parser_rules(usfm_parser):
+    return dict((name, getattr(usfm_parser, name))
+                for name in dir(usfm_parser) if name.startswith("p_"))
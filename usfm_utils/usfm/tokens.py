@@ -1,3 +1,4 @@
+import bisect
 
 
 class Position(object):
@@ -17,41 +18,91 @@ class Position(object):
         return "line: {}, col: {}".format(self._line, self._col)
 
 
+class LineIndex(object):
+    """
+    Converts offsets into a source to line/column positions. The table of newline
+    offsets is only built once a position is first requested.
+    """
+    def __init__(self, text, index_from=1):
+        """
+        :param str|unicode text: source text
+        :param int index_from: number of the first line/column
+        """
+        self._text = text
+        self._index_from = index_from
+        self._newlines = None
+
+    def position(self, offset):
+        """
+        :param int offset: offset into the source text
+        :rtype: Position
+        """
+        if self._newlines is None:
+            self._newlines = newline_offsets(self._text)
+            if not self._text.endswith("\n"):
+                # an unterminated last line ends with the text
+                self._newlines.append(len(self._text))
+        line = bisect.bisect_left(self._newlines, offset)
+        line_start = 0 if line == 0 else self._newlines[line - 1] + 1
+        return Position(line + self._index_from, offset - line_start + self._index_from)
+
+
+def newline_offsets(text):
+    """
+    :param str|unicode text:
+    :return: the offsets of all newlines in text, in increasing order
+    :rtype: list[int]
+    """
+    offsets = []
+    index = text.find("\n")
+    while index >= 0:
+        offsets.append(index)
+        index = text.find("\n", index + 1)
+    return offsets
+
+
 class Token(object):
-    def __init__(self, position, value, number=None):
-        self._position = position
-        self._value = value
-        self._number = number
+    """
+    A lexed token: a kind code (the index of the token's name in Token.names),
+    the offset at which the token starts, its value, and an optional number (e.g.
+    the weight of a heading). Tokens are the only objects allocated per token, so
+    they are kept compact.
+    """
+    __slots__ = ("kind", "offset", "value", "number", "line_index")
 
-    @property
-    def position(self):
-        return self._position
+    # names of the kinds of tokens, indexed by kind code. Set by the lexer once its
+    # rules are registered
+    names = ()
+
+    def __init__(self, kind, offset, value, number=None, line_index=None):
+        """
+        :param int kind: kind code of the token
+        :param int offset: offset of the token in the source
+        :param value:
+        :param int number:
+        :param LineIndex line_index: used to compute the position of the token,
+        None if positions are not tracked
+        """
+        self.kind = kind
+        self.offset = offset
+        self.value = value
+        self.number = number
+        self.line_index = line_index
 
     @property
-    def value(self):
-        return self._value
+    def type(self):
+        """
+        :return: name of the kind of the token
+        :rtype: str
+        """
+        return Token.names[self.kind]
 
     @property
-    def number(self):
-        return self._number
-
-    class Builder(object):
-        def __init__(self, value):
-            self._position = None
-            self._value = value
-            self._number = None
-
-        def set_number(self, number):
-            """
-            :param int number:
-            :rtype: Builder
-            """
-            self._number = number
-            return self
-
-        def build(self, position):
-            """
-            :param Position position:
-            :rtype: Token
-            """
-            return Token(position, self._value, number=self._number)
+    def position(self):
+        """
+        :return: position of the token, or None if positions are not tracked
+        :rtype: Position
+        """
+        if self.line_index is None:
+            return None
+        return self.line_index.position(self.offset)
@@ -4,6 +4,8 @@ class UsfmInputError(Exception):
     Raised when invalid USFM input is encountered.
     """
     def __init__(self, message, position):
+        # args are what an exception is pickled with
+        Exception.__init__(self, message, position)
         self._message = message
         self._position = position
 
@@ -18,10 +20,13 @@ class UsfmInputError(Exception):
     @property
     def position(self):
         """
-        :return: the position where the error occurred
+        :return: the position where the error occurred, or None if positions
+        were not tracked
         :rtype: Position
         """
         return self._position
 
     def __str__(self):
+        if self._position is None:
+            return self._message
         return "{m} at {p}".format(m=self._message, p=self._position)